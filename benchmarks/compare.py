@@ -0,0 +1,72 @@
+"""
+Сравнение двух запусков бенчмарков (JSON из benchmarks.suite).
+
+Регрессия - рост p95 или падение пропускной способности больше
+порога. При регрессиях команда завершается с кодом 1.
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python -m benchmarks.compare base.json new.json \\
+        --threshold 0.1
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks.stats import load_results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Сравнение бенчмарков')
+    parser.add_argument('base', type=Path)
+    parser.add_argument('new', type=Path)
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Допустимое ухудшение (доля, 0.1 - 10%%)',
+    )
+    return parser.parse_args()
+
+
+def get_change(base: float, new: float) -> float:
+    return (new - base) / base if base else 0.0
+
+
+def run(args: argparse.Namespace) -> int:
+    base_results = load_results(args.base)
+    new_results = load_results(args.new)
+
+    regressions = []
+    print(f'{"benchmark":<55} {"ops/s":>8} {"p50":>8} {"p95":>8} {"p99":>8}')
+    for name in sorted(base_results.keys() & new_results.keys()):
+        base, new = base_results[name], new_results[name]
+        changes = {
+            'throughput': get_change(base['throughput'], new['throughput']),
+            'p50_ms': get_change(base['p50_ms'], new['p50_ms']),
+            'p95_ms': get_change(base['p95_ms'], new['p95_ms']),
+            'p99_ms': get_change(base['p99_ms'], new['p99_ms']),
+        }
+        is_regression = (
+            changes['throughput'] < -args.threshold
+            or changes['p95_ms'] > args.threshold
+        )
+        if is_regression:
+            regressions.append(name)
+        print(
+            f'{name:<55} '
+            + ' '.join(f'{change:>+8.1%}' for change in changes.values())
+            + ('  REGRESSION' if is_regression else '')
+        )
+
+    for name in sorted(base_results.keys() ^ new_results.keys()):
+        print(f'{name:<55} only in one run')
+
+    if regressions:
+        print(f'\n{len(regressions)} regression(s)')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run(parse_args()))
@@ -0,0 +1,86 @@
+"""
+Бенчмарк вставки строк с UUIDv4 и UUIDv7 первичными ключами.
+
+Показывает скорость вставки и размер БД (индекс первичного ключа
+и индекс внешнего ключа) для случайных и упорядоченных по времени ключей.
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python -m benchmarks.entity_ids
+"""
+
+import sqlite3
+import time
+import uuid
+from typing import Callable
+
+from commons.entities.base import create_entity_id
+
+ROWS_COUNT = 200_000
+BATCH_SIZE = 1_000
+# маленький кэш, чтобы индекс не помещался в память целиком, как в проде
+CACHE_SIZE_PAGES = 500
+
+
+def create_db() -> sqlite3.Connection:
+    connection = sqlite3.connect(':memory:')
+    connection.execute(f'PRAGMA cache_size = {CACHE_SIZE_PAGES}')
+    connection.execute(
+        'CREATE TABLE purchase_requests (id BLOB PRIMARY KEY, name TEXT)'
+    )
+    connection.execute(
+        'CREATE TABLE purchase_request_products ('
+        'id BLOB PRIMARY KEY, purchase_request_id BLOB, name TEXT)'
+    )
+    connection.execute(
+        'CREATE INDEX ix_purchase_request_id '
+        'ON purchase_request_products (purchase_request_id)'
+    )
+    return connection
+
+
+def run_inserts(
+    create_id: Callable[[], uuid.UUID],
+) -> tuple[float, int]:
+    """
+    Вставляет заявки с продуктом и возвращает
+    (число строк в секунду, число страниц БД)
+    """
+    connection = create_db()
+    started_at = time.perf_counter()
+
+    for _ in range(ROWS_COUNT // BATCH_SIZE):
+        requests_rows = []
+        products_rows = []
+        for _ in range(BATCH_SIZE):
+            request_id = create_id().bytes
+            requests_rows.append((request_id, 'Иван'))
+            products_rows.append((create_id().bytes, request_id, 'Мёд'))
+
+        with connection:
+            connection.executemany(
+                'INSERT INTO purchase_requests VALUES (?, ?)', requests_rows
+            )
+            connection.executemany(
+                'INSERT INTO purchase_request_products VALUES (?, ?, ?)',
+                products_rows,
+            )
+
+    elapsed = time.perf_counter() - started_at
+    (page_count,) = connection.execute('PRAGMA page_count').fetchone()
+    connection.close()
+
+    return ROWS_COUNT * 2 / elapsed, page_count
+
+
+def run() -> None:
+    print(f'{"ids":>8} {"rows/s":>12} {"db pages":>10}')
+    for name, create_id in (
+        ('uuid4', uuid.uuid4),
+        ('uuid7', create_entity_id),
+    ):
+        rows_per_second, page_count = run_inserts(create_id)
+        print(f'{name:>8} {rows_per_second:>12.0f} {page_count:>10}')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,108 @@
+"""
+Бенчмарк параллельного MapperImpl.map_many_async на пуле процессов.
+
+Маппит заявки на покупку в уведомления в текущем потоке и в пуле
+процессов с разным числом воркеров (не больше числа ядер) для пачек
+разного размера. Печатает порог `parallel_threshold` - наименьший
+размер пачки, начиная с которого пул быстрее на всех больших пачках.
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python -m benchmarks.mapper_parallel
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.money_decimal import create_purchase_request
+from commons.mappers.mapper_impl import MapperImpl
+from commons.value_objects import MoneyDecimal
+from family_apiary.products.application.use_cases.commands import (
+    notification_mapper_config,
+)
+
+BATCH_SIZES = (1_000, 2_000, 5_000, 10_000, 20_000, 50_000)
+PRODUCTS_COUNT = 5
+WORKERS_COUNTS = (1, 2, 4, 8, 16)
+PRICE = MoneyDecimal('450.50')
+
+
+async def measure_parallel(
+    mapper: MapperImpl,
+    executor: ProcessPoolExecutor,
+    purchase_requests: list[object],
+) -> float:
+    started_at = time.perf_counter()
+    await mapper.map_many_async(
+        purchase_requests, notification_mapper_config, executor=executor
+    )
+    return time.perf_counter() - started_at
+
+
+async def run() -> None:
+    purchase_requests = [
+        create_purchase_request(PRODUCTS_COUNT, PRICE)
+        for _ in range(max(BATCH_SIZES))
+    ]
+    # порог 0 - в пуле маппится пачка любого размера
+    mapper = MapperImpl(parallel_threshold=0)
+
+    # прогрев (кэш TypeAdapter целевых типов)
+    mapper.map_many(purchase_requests[:1_000], notification_mapper_config)
+    inline_times = {}
+    for batch_size in BATCH_SIZES:
+        started_at = time.perf_counter()
+        mapper.map_many(
+            purchase_requests[:batch_size], notification_mapper_config
+        )
+        inline_times[batch_size] = time.perf_counter() - started_at
+
+    cpu_count = os.cpu_count() or 1
+    workers_counts = [count for count in WORKERS_COUNTS if count <= cpu_count]
+    # лучшее ускорение для каждого размера пачки
+    best_speedups = dict.fromkeys(BATCH_SIZES, 0.0)
+
+    print(f'{"batch":>8} {"workers":>8} {"time, s":>10} {"speedup":>8}')
+    for batch_size in BATCH_SIZES:
+        print(
+            f'{batch_size:>8} {"inline":>8} {inline_times[batch_size]:>10.3f}'
+        )
+
+    for workers_count in workers_counts:
+        with ProcessPoolExecutor(max_workers=workers_count) as executor:
+            # прогрев воркеров (импорт модулей в процессах)
+            await measure_parallel(
+                mapper, executor, purchase_requests[: workers_count * 2_000]
+            )
+
+            for batch_size in BATCH_SIZES:
+                parallel_time = await measure_parallel(
+                    mapper, executor, purchase_requests[:batch_size]
+                )
+                speedup = inline_times[batch_size] / parallel_time
+                best_speedups[batch_size] = max(
+                    best_speedups[batch_size], speedup
+                )
+                print(
+                    f'{batch_size:>8} {workers_count:>8} '
+                    f'{parallel_time:>10.3f} {speedup:>8.2f}'
+                )
+
+    threshold = None
+    for batch_size in reversed(BATCH_SIZES):
+        if best_speedups[batch_size] <= 1:
+            break
+        threshold = batch_size
+
+    if threshold is None:
+        print(
+            f'\nПул процессов не быстрее маппинга в текущем потоке '
+            f'(ядер: {cpu_count}) - parallel_threshold не задаётся'
+        )
+    else:
+        print(f'\nparallel_threshold = {threshold} (ядер: {cpu_count})')
+
+
+if __name__ == '__main__':
+    asyncio.run(run())
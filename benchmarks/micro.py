@@ -0,0 +1,160 @@
+"""
+Микро-бенчмарки горячего пути создания заявки: маппер,
+медиатор CQRS и текст уведомления Telegram
+"""
+
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from dishka import Provider, Scope, make_async_container, provide
+
+from benchmarks.money_decimal import create_purchase_request
+from benchmarks.stats import LatencyStats
+from commons.cqrs.base import QueryHandler
+from commons.cqrs.impl import QueryMediatorImpl
+from commons.mappers.mapper_impl import MapperImpl
+from commons.operations.operations import AsyncOperation
+from family_apiary.products.application.dto import (
+    NewPurchaseRequestNotification,
+)
+from family_apiary.products.application.use_cases.commands import (
+    notification_mapper_config,
+)
+from family_apiary.products.infrastructure.tg_chat_bot.senders.product_purchase_request_notificator import (
+    _NewRequestNotificationMessageText,
+)
+
+# операций в одном замере (время операции - время замера / количество)
+BATCH_SIZE = 100
+
+
+def measure(function: Callable[[], Any], repeats: int) -> LatencyStats:
+    """
+    Замеряет синхронную функцию: `repeats` замеров по BATCH_SIZE вызовов
+    """
+    durations = []
+    started_at = time.perf_counter()
+    for _ in range(repeats):
+        batch_started_at = time.perf_counter()
+        for _ in range(BATCH_SIZE):
+            function()
+        durations.append((time.perf_counter() - batch_started_at) / BATCH_SIZE)
+    elapsed = time.perf_counter() - started_at
+    return LatencyStats.from_durations(durations, elapsed=elapsed / BATCH_SIZE)
+
+
+async def measure_async(
+    function: Callable[[], Awaitable[Any]], repeats: int
+) -> LatencyStats:
+    """
+    Замеряет асинхронную функцию: `repeats` замеров по BATCH_SIZE вызовов
+    """
+    durations = []
+    started_at = time.perf_counter()
+    for _ in range(repeats):
+        batch_started_at = time.perf_counter()
+        for _ in range(BATCH_SIZE):
+            await function()
+        durations.append((time.perf_counter() - batch_started_at) / BATCH_SIZE)
+    elapsed = time.perf_counter() - started_at
+    return LatencyStats.from_durations(durations, elapsed=elapsed / BATCH_SIZE)
+
+
+@dataclass
+class _BenchmarkQuery:
+    value: int
+
+
+class _BenchmarkQueryHandler(QueryHandler[_BenchmarkQuery, int]):
+    """
+    Пустой обработчик - замеряются только накладные расходы медиатора
+    """
+
+    async def handle(self, query: _BenchmarkQuery) -> int:
+        return query.value
+
+
+class _BenchmarkHandlersProvider(Provider):
+    scope = Scope.REQUEST
+
+    handler = provide(_BenchmarkQueryHandler)
+
+
+def _create_mediator(middlewares_count: int) -> QueryMediatorImpl:
+    @asynccontextmanager
+    async def middleware(_: Any) -> AsyncIterator[None]:
+        yield
+
+    mediator = QueryMediatorImpl(
+        container=make_async_container(_BenchmarkHandlersProvider()),
+        operation=AsyncOperation(),
+        middlewares=[middleware] * middlewares_count,
+    )
+    mediator.resolve_handlers()
+    return mediator
+
+
+def run_mapper(
+    cart_sizes: tuple[int, ...], repeats: int
+) -> dict[str, LatencyStats]:
+    mapper = MapperImpl()
+    results = {}
+    for cart_size in cart_sizes:
+        purchase_request = create_purchase_request(cart_size)
+        extra = {'created_at': datetime.now(UTC)}
+        results[f'micro.mapper.notification.cart_{cart_size}'] = measure(
+            lambda: mapper.map(
+                purchase_request,
+                mapper_config=notification_mapper_config,
+                extra=extra,
+            ),
+            repeats=repeats,
+        )
+    return results
+
+
+async def run_mediator(repeats: int) -> dict[str, LatencyStats]:
+    results = {}
+    for middlewares_count in (0, 1):
+        mediator = _create_mediator(middlewares_count)
+        query = _BenchmarkQuery(value=1)
+        results[
+            f'micro.mediator.execute_request.middlewares_{middlewares_count}'
+        ] = await measure_async(
+            lambda: mediator.execute_request(query),
+            repeats=repeats,
+        )
+    return results
+
+
+def run_notification_text(
+    cart_sizes: tuple[int, ...], repeats: int
+) -> dict[str, LatencyStats]:
+    mapper = MapperImpl()
+    results = {}
+    for cart_size in cart_sizes:
+        notification: NewPurchaseRequestNotification = mapper.map(
+            create_purchase_request(cart_size),
+            mapper_config=notification_mapper_config,
+            extra={'created_at': datetime.now(UTC)},
+        )
+        results[f'micro.notification_text.cart_{cart_size}'] = measure(
+            lambda: _NewRequestNotificationMessageText(
+                notification=notification
+            ).to_string(),
+            repeats=repeats,
+        )
+    return results
+
+
+async def run(
+    cart_sizes: tuple[int, ...], repeats: int
+) -> dict[str, LatencyStats]:
+    return {
+        **run_mapper(cart_sizes, repeats),
+        **await run_mediator(repeats),
+        **run_notification_text(cart_sizes, repeats),
+    }
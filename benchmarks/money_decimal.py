@@ -0,0 +1,103 @@
+"""
+Бенчмарк подсчёта стоимости корзины заявки на покупку
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python -m benchmarks.money_decimal
+"""
+
+import itertools
+import timeit
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from commons.entities.base import create_entity_id
+from commons.value_objects import MoneyDecimal, PhoneNumber, PositiveInt
+from family_apiary.products.domain.entities import (
+    PurchaseRequest,
+    PurchaseRequestProduct,
+)
+
+CART_SIZES = (10, 100, 1_000, 10_000)
+
+# цена позиции из снимка каталога
+CATALOG_PRICE = 450.5
+
+# цены позиций: float (как в снимке каталога) и MoneyDecimal
+PRICES: dict[str, Any] = {
+    'float': CATALOG_PRICE,
+    'MoneyDecimal': MoneyDecimal('450.50'),
+}
+
+
+def create_purchase_request(
+    products_count: int, price: Any = CATALOG_PRICE
+) -> PurchaseRequest:
+    """
+    Создаёт заявку с корзиной из `products_count` продуктов по цене `price`
+    """
+    now = datetime.now(UTC)
+    products = [
+        PurchaseRequestProduct(
+            id=create_entity_id(),
+            created_at=now,
+            updated_at=now,
+            name=f'Мёд {i}',
+            description='Цветочный',
+            category='Мёд',
+            price=price,
+            count=PositiveInt(i % 5 + 1),
+        )
+        for i in range(products_count)
+    ]
+    return PurchaseRequest(
+        id=create_entity_id(),
+        created_at=now,
+        updated_at=now,
+        phone_number=PhoneNumber('+79999999999'),
+        name='Иван',
+        products=products,
+    )
+
+
+def loop_total_price(purchase_request: PurchaseRequest) -> MoneyDecimal:
+    """
+    Подсчёт стоимости корзины сложением MoneyDecimal в цикле
+    """
+    total_price = MoneyDecimal.zero()
+    for product in purchase_request.products:
+        price = Decimal(str(product.price))
+        total_price += MoneyDecimal(price * product.count)
+    return total_price
+
+
+def run() -> None:
+    print(
+        f'{"price":>12} {"cart size":>10} {"loop, us":>12} '
+        f'{"single pass, us":>16}'
+    )
+    for (price_type, price), cart_size in itertools.product(
+        PRICES.items(), CART_SIZES
+    ):
+        purchase_request = create_purchase_request(cart_size, price)
+        assert (
+            loop_total_price(purchase_request)
+            == purchase_request.get_total_price()
+        )
+
+        number = max(1, 100_000 // cart_size)
+        loop_time = timeit.timeit(
+            lambda: loop_total_price(purchase_request), number=number
+        )
+        single_pass_time = timeit.timeit(
+            purchase_request.get_total_price, number=number
+        )
+        print(
+            f'{price_type:>12} {cart_size:>10} '
+            f'{loop_time / number * 1e6:>12.1f} '
+            f'{single_pass_time / number * 1e6:>16.1f}'
+        )
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,311 @@
+"""
+Стенд для сквозных бенчмарков: настоящее приложение (`create_app`)
+в том же процессе, БД SQLite во временном каталоге (или отдельная
+PostgreSQL) и поддельный Telegram бот с заданной задержкой
+"""
+
+import asyncio
+import json
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, MutableMapping, cast
+
+import sqlalchemy as sa
+from aiogram import Bot
+from dishka import AsyncContainer, Provider, Scope, provide
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from family_apiary.framework.api.app import create_app
+from family_apiary.framework.api.settings import (
+    ApiPrometheusMetricsSettings,
+    ApiSettings,
+    ContinuousProfilingSettings,
+    EventLoopMonitorSettings,
+    MemoryProfilingSettings,
+    RequestProfilingSettings,
+)
+from family_apiary.framework.containers import create_api_container
+from family_apiary.framework.database.settings import DBSettings
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    CatalogApiSettings,
+    CustomerProfilesApiSettings,
+    PurchaseRequestsExportApiSettings,
+    PurchaseRequestsSearchApiSettings,
+    SalesReportsApiSettings,
+)
+from family_apiary.products.infrastructure.database import (
+    CatalogSnapshotCacheSettings,
+    PurchaseRequestsGroupCommitSettings,
+)
+from family_apiary.products.infrastructure.database.meta import metadata
+from family_apiary.products.infrastructure.database.partitioning import (
+    ensure_monthly_partitions,
+)
+from family_apiary.products.infrastructure.export import (
+    PurchaseRequestsExportSettings,
+)
+from family_apiary.products.infrastructure.tg_chat_bot import TgChatBotSettings
+
+CATALOG_API_TOKEN = 'benchmark'
+
+
+class FakeBot:
+    """
+    Заменяет aiogram Bot: вместо запроса к Telegram ждёт
+    `latency_seconds` и считает сообщения
+    """
+
+    def __init__(self, latency_seconds: float = 0):
+        self.latency_seconds = latency_seconds
+        self.sent_count = 0
+
+    async def send_message(
+        self, chat_id: int | str, text: str, **_: Any
+    ) -> None:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        self.sent_count += 1
+
+
+class FakeTgChatBotProvider(Provider):
+    scope = Scope.APP
+
+    def __init__(self, bot: FakeBot):
+        super().__init__()
+        self._bot = bot
+
+    @provide
+    def create_tg_chat_bot(self) -> Bot:
+        return cast(Bot, self._bot)
+
+
+@dataclass(frozen=True)
+class AsgiResponse:
+    status_code: int
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class AsgiClient:
+    """
+    Минимальный HTTP клиент, вызывающий ASGI приложение напрямую
+    (без сети и без сторонних зависимостей)
+    """
+
+    def __init__(self, app: FastAPI):
+        self._app = app
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsgiResponse:
+        body = b'' if json_body is None else json.dumps(json_body).encode()
+        raw_headers = [(b'host', b'benchmark')]
+        if json_body is not None:
+            raw_headers.append((b'content-type', b'application/json'))
+        for name, value in (headers or {}).items():
+            raw_headers.append((name.lower().encode(), value.encode()))
+
+        path, _, query_string = path.partition('?')
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': query_string.encode(),
+            'root_path': '',
+            'headers': raw_headers,
+            'client': ('127.0.0.1', 0),
+            'server': ('benchmark', 80),
+        }
+
+        request_sent = False
+
+        async def receive() -> dict[str, Any]:
+            nonlocal request_sent
+            if request_sent:
+                # запрос прочитан - ждём, пока приложение не ответит
+                await asyncio.Event().wait()
+            request_sent = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        status_code = 0
+        chunks: list[bytes] = []
+
+        async def send(message: MutableMapping[str, Any]) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            elif message['type'] == 'http.response.body':
+                chunks.append(message.get('body', b''))
+
+        await self._app(scope, receive, send)
+        return AsgiResponse(status_code=status_code, body=b''.join(chunks))
+
+
+@dataclass
+class Stand:
+    app: FastAPI
+    container: AsyncContainer
+    client: AsgiClient
+    bot: FakeBot
+    catalog_product_ids: list[str] = field(default_factory=list)
+
+    async def seed_catalog(self, products_count: int) -> None:
+        """
+        Заполняет каталог через API
+        """
+        for i in range(products_count):
+            response = await self.client.request(
+                'POST',
+                '/api/products/v1/catalog/products',
+                json_body={
+                    'name': f'Мёд {i}',
+                    'description': 'Цветочный',
+                    'category': f'Категория {i % 5}',
+                    'price': '450.50',
+                },
+                headers={'X-Catalog-Token': CATALOG_API_TOKEN},
+            )
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f'Catalog seeding failed: {response.status_code} '
+                    f'{response.body!r}'
+                )
+            self.catalog_product_ids.append(response.json()['id'])
+
+
+async def _prepare_sqlite(db_engine: AsyncEngine, directory: Path) -> None:
+    products_db_path = directory / 'products.db'
+
+    # в SQLite схема products - отдельный файл БД
+    @sa.event.listens_for(db_engine.sync_engine, 'connect')
+    def attach_products_schema(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.execute(
+            f"ATTACH DATABASE '{products_db_path}' AS products"
+        )
+
+    async with db_engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+
+
+async def _prepare_postgres(db_engine: AsyncEngine) -> None:
+    # БД стенда одноразовая - таблицы пересоздаются
+    async with db_engine.begin() as connection:
+        await connection.execute(
+            sa.text('CREATE SCHEMA IF NOT EXISTS products')
+        )
+        await connection.execute(
+            sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        )
+        await connection.run_sync(metadata.drop_all)
+        await connection.run_sync(metadata.create_all)
+    await ensure_monthly_partitions(
+        db_engine=db_engine,
+        metadata=metadata,
+        months_ahead=1,
+    )
+
+
+@asynccontextmanager
+async def create_stand(
+    db_url: str | None = None,
+    bot_latency_seconds: float = 0,
+    group_commit: bool = False,
+    continuous_profiling: bool = False,
+) -> AsyncIterator[Stand]:
+    """
+    Поднимает приложение со своей БД.
+
+    :param db_url: URL одноразовой PostgreSQL (postgresql+asyncpg://...).
+        Все таблицы схемы products пересоздаются. По умолчанию - SQLite
+        во временном каталоге
+    :param continuous_profiling: запустить постоянный профилировщик
+        (для замера его накладных расходов)
+    """
+    with tempfile.TemporaryDirectory(
+        prefix='family_apiary_bench_'
+    ) as directory:
+        db_settings = DBSettings(
+            DB_URL=db_url or f'sqlite+aiosqlite:///{directory}/main.db'
+        )
+        bot = FakeBot(latency_seconds=bot_latency_seconds)
+        continuous_profiling_settings = ContinuousProfilingSettings(
+            CONTINUOUS_PROFILING_ENABLED=continuous_profiling
+        )
+        # tracemalloc замедляет выделение памяти
+        memory_profiling_settings = MemoryProfilingSettings(
+            MEMORY_PROFILING_ENABLED=False
+        )
+        container = create_api_container(
+            api_settings=ApiSettings(),
+            # метрики регистрируются глобально - отключаются,
+            # чтобы стенд можно было поднять несколько раз
+            api_prometheus_metrics_settings=ApiPrometheusMetricsSettings(
+                PROMETHEUS_METRICS_ENABLED=False
+            ),
+            tg_chat_bot_settings=TgChatBotSettings(
+                TOKEN='0:benchmark',
+                PRODUCT_PURCHASE_REQUEST_NOTIFICATION_CHAT_ID='0',
+            ),
+            db_settings=db_settings,
+            purchase_requests_group_commit_settings=(
+                PurchaseRequestsGroupCommitSettings(ENABLED=group_commit)
+            ),
+            purchase_requests_export_settings=PurchaseRequestsExportSettings(),
+            purchase_requests_export_api_settings=(
+                PurchaseRequestsExportApiSettings()
+            ),
+            sales_reports_api_settings=SalesReportsApiSettings(),
+            customer_profiles_api_settings=CustomerProfilesApiSettings(),
+            purchase_requests_search_api_settings=(
+                PurchaseRequestsSearchApiSettings()
+            ),
+            catalog_api_settings=CatalogApiSettings(TOKEN=CATALOG_API_TOKEN),
+            catalog_snapshot_cache_settings=CatalogSnapshotCacheSettings(),
+            # задача монитора искажает замеры
+            event_loop_monitor_settings=EventLoopMonitorSettings(
+                EVENT_LOOP_MONITOR_ENABLED=False
+            ),
+            continuous_profiling_settings=continuous_profiling_settings,
+            memory_profiling_settings=memory_profiling_settings,
+            override_providers=[FakeTgChatBotProvider(bot)],
+        )
+        app = create_app(
+            api_settings=ApiSettings(),
+            container=container,
+            api_prometheus_metrics_settings=ApiPrometheusMetricsSettings(
+                PROMETHEUS_METRICS_ENABLED=False
+            ),
+            request_profiling_settings=RequestProfilingSettings(
+                REQUEST_PROFILING_TOKEN=None
+            ),
+            continuous_profiling_settings=continuous_profiling_settings,
+            memory_profiling_settings=memory_profiling_settings,
+        )
+
+        db_engine = await container.get(AsyncEngine)
+        if db_engine.dialect.name == 'sqlite':
+            await _prepare_sqlite(db_engine, Path(directory))
+        else:
+            await _prepare_postgres(db_engine)
+
+        # lifespan регистрирует обработчики и закрывает контейнер
+        async with app.router.lifespan_context(app):
+            yield Stand(
+                app=app,
+                container=container,
+                client=AsgiClient(app),
+                bot=bot,
+            )
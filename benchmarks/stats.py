@@ -0,0 +1,113 @@
+"""
+Статистика и сохранение результатов бенчмарков
+"""
+
+import json
+import math
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Процентиль отсортированной выборки (ближайший ранг)
+    """
+    if not sorted_values:
+        return math.nan
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """
+    Пропускная способность и задержки (в миллисекундах)
+    """
+
+    count: int
+    errors: int
+    throughput: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_durations(
+        cls,
+        durations: list[float],
+        elapsed: float,
+        errors: int = 0,
+    ) -> 'LatencyStats':
+        """
+        :param durations: длительности операций в секундах
+        :param elapsed: общее время выполнения в секундах
+        """
+        values = sorted(duration * 1000 for duration in durations)
+        return cls(
+            count=len(values),
+            errors=errors,
+            throughput=len(values) / elapsed if elapsed else math.nan,
+            mean_ms=sum(values) / len(values) if values else math.nan,
+            p50_ms=percentile(values, 0.50),
+            p95_ms=percentile(values, 0.95),
+            p99_ms=percentile(values, 0.99),
+            max_ms=values[-1] if values else math.nan,
+        )
+
+    def to_row(self) -> str:
+        return (
+            f'{self.throughput:>10.1f} {self.p50_ms:>9.3f} '
+            f'{self.p95_ms:>9.3f} {self.p99_ms:>9.3f} {self.errors:>7}'
+        )
+
+
+STATS_HEADER = (
+    f'{"ops/s":>10} {"p50, ms":>9} {"p95, ms":>9} {"p99, ms":>9} {"errors":>7}'
+)
+
+
+def _get_git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(
+    path: Path,
+    results: dict[str, LatencyStats],
+    parameters: dict[str, Any],
+) -> None:
+    """
+    Сохраняет результаты в JSON (для сравнения запусков:
+    `python -m benchmarks.compare`)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'created_at': datetime.now(UTC).isoformat(),
+        'git_revision': _get_git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'parameters': parameters,
+        'results': {name: asdict(stats) for name, stats in results.items()},
+    }
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def load_results(path: Path) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = json.loads(path.read_text())[
+        'results'
+    ]
+    return results
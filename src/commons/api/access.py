@@ -0,0 +1,87 @@
+import secrets
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException, Request, Security
+from fastapi.security import APIKeyHeader
+from pydantic_settings import BaseSettings
+from starlette import status
+
+
+class AccessTokenSettings(BaseSettings):
+    """
+    Токен доступа к служебным методам API. Если не задан, методы
+    отключены.
+
+    Переменная окружения - <префикс>TOKEN. Для каждой группы методов
+    объявляется наследник со своим префиксом:
+
+        class CatalogApiSettings(AccessTokenSettings):
+            class Config:
+                env_prefix = 'PRODUCTS_CATALOG_API_'
+    """
+
+    TOKEN: str | None = None
+
+
+def is_access_token_valid(
+    token: str | None, expected_token: str | None
+) -> bool:
+    """
+    Сравнивает токены за постоянное время.
+
+    Сравниваются байты: compare_digest не принимает строки с не-ASCII
+    символами, а заголовок может содержать любые байты. Если ожидаемый
+    токен не задан, проверка не проходит
+    """
+    if token is None or expected_token is None:
+        return False
+    return secrets.compare_digest(token.encode(), expected_token.encode())
+
+
+def check_access_token(token: str | None, expected_token: str | None) -> None:
+    """
+    Проверяет токен доступа к служебным методам API.
+
+    Если ожидаемый токен не задан, метод отключён
+    """
+    if not is_access_token_valid(token, expected_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Access is not allowed',
+        )
+
+
+def access_token_guard(
+    header_name: str,
+    settings: type[AccessTokenSettings] | AccessTokenSettings,
+) -> Callable[..., Awaitable[None]]:
+    """
+    Зависимость маршрута: проверяет токен доступа из заголовка.
+
+    Пример:
+        require_catalog_token = access_token_guard(
+            'X-Catalog-Token', CatalogApiSettings
+        )
+
+        @router.post('', dependencies=[Depends(require_catalog_token)])
+
+    :param header_name: заголовок с токеном
+    :param settings: тип настроек токена (наследник AccessTokenSettings)
+        в зависимостях запроса (dishka) или сами настройки
+    """
+    header = APIKeyHeader(
+        name=header_name, scheme_name=header_name, auto_error=False
+    )
+
+    async def check(
+        request: Request,
+        token: str | None = Security(header),
+    ) -> None:
+        token_settings: AccessTokenSettings = (
+            settings
+            if isinstance(settings, AccessTokenSettings)
+            else await request.state.dishka_container.get(settings)
+        )
+        check_access_token(token, token_settings.TOKEN)
+
+    return check
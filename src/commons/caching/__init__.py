@@ -0,0 +1 @@
+from .versioned_snapshot import AsyncVersionedSnapshotCache, VersionedSnapshot
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class VersionedSnapshot(Generic[T]):
+    """
+    Снимок данных и версия, с которой он прочитан
+    """
+
+    version: int
+    data: T
+
+
+LoadVersion = Callable[[], Awaitable[int]]
+"""Чтение текущей версии данных (дешёвый запрос)"""
+
+LoadSnapshot = Callable[[], Awaitable[VersionedSnapshot[T]]]
+"""Чтение данных целиком вместе с их версией"""
+
+
+class AsyncVersionedSnapshotCache(Generic[T]):
+    """
+    Кэш снимка редко меняющихся данных в памяти процесса.
+
+    Снимок считается свежим `ttl_seconds` после последней проверки.
+    Затем проверяется версия данных (`load_version`), и снимок
+    перечитывается только если версия изменилась. `invalidate`
+    заставляет проверить версию при следующем обращении - так изменения,
+    сделанные в этом процессе, видны сразу, а сделанные другими
+    процессами - не позже чем через `ttl_seconds`.
+
+    Одновременные обращения к устаревшему снимку ждут одну загрузку.
+    Должен использоваться в рамках одного event loop.
+    """
+
+    def __init__(
+        self,
+        load_version: LoadVersion,
+        load_snapshot: LoadSnapshot[T],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._load_version = load_version
+        self._load_snapshot = load_snapshot
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+
+        self._snapshot: VersionedSnapshot[T] | None = None
+        self._checked_at = float('-inf')
+        # увеличивается при каждом invalidate: загрузка, начатая до
+        # сброса, не должна считать свой результат свежим
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def _get_fresh_snapshot(self) -> VersionedSnapshot[T] | None:
+        if self._clock() - self._checked_at < self._ttl_seconds:
+            return self._snapshot
+        return None
+
+    async def get(self) -> VersionedSnapshot[T]:
+        snapshot = self._get_fresh_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        async with self._lock:
+            # пока ждали блокировку, снимок мог обновить другой вызов
+            snapshot = self._get_fresh_snapshot()
+            if snapshot is not None:
+                return snapshot
+
+            generation = self._generation
+            checked_at = self._clock()
+
+            snapshot = self._snapshot
+            if (
+                snapshot is None
+                or await self._load_version() != snapshot.version
+            ):
+                snapshot = await self._load_snapshot()
+                self._snapshot = snapshot
+
+            if generation == self._generation:
+                self._checked_at = checked_at
+            return snapshot
+
+    def invalidate(self) -> None:
+        """
+        Снимок будет сверен с версией данных при следующем обращении
+        """
+        self._generation += 1
+        self._checked_at = float('-inf')
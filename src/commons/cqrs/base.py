@@ -49,3 +49,24 @@ class CommandMediator(ABC):
 
     @abstractmethod
     async def send(self, command: TRequest) -> TResult | None: ...
+
+
+def require_result(result_type: type[TResult], result: object) -> TResult:
+    """
+    Результат медиатора ожидаемого типа.
+
+    Зарегистрированный обработчик всегда возвращает результат: None или
+    результат другого типа - ошибка программы, а не отсутствие данных
+    (такой запрос не должен стать ответом 404).
+
+    Пример:
+        result = require_result(
+            GetCatalogResult, await query_mediator.send(query=query)
+        )
+    """
+    if not isinstance(result, result_type):
+        raise TypeError(
+            f'Request handler returned {type(result).__name__}, '
+            f'expected {result_type.__name__}'
+        )
+    return result
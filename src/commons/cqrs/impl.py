@@ -1,6 +1,7 @@
 import inspect
 from abc import abstractmethod
-from typing import Any, Type
+from contextlib import AsyncExitStack
+from typing import Any, AsyncContextManager, Callable, Type
 
 from dishka import AsyncContainer
 from typing_extensions import override
@@ -17,6 +18,12 @@ from .base import (
     _RequestHandler,
 )
 
+RequestMiddleware = Callable[[Any], AsyncContextManager[Any]]
+"""
+Обёртка выполнения запроса: по запросу создаёт контекстный менеджер,
+внутри которого выполняется обработчик вместе с операцией (транзакцией)
+"""
+
 
 def find_subclasses(
     cls: Type[_RequestHandler[TRequest, TResult]],
@@ -51,18 +58,34 @@ class CQRSMediator:
     """
     Медиатор для реализации подхода CQRS.
 
-    Каждый обработчик вызывается в рамках операции (транзакции)
+    Каждый обработчик вызывается в рамках операции (транзакции).
+    Middlewares оборачивают операцию целиком (включая commit)
     """
 
-    def __init__(self, container: AsyncContainer, operation: AsyncOperation):
+    def __init__(
+        self,
+        container: AsyncContainer,
+        operation: AsyncOperation,
+        middlewares: list[RequestMiddleware] | None = None,
+    ):
         self._handlers_by_requests: dict[
             Any, Type[_RequestHandler[Any, Any]]
         ] = {}
         self._container = container
         self._operation = operation
+        self._middlewares = middlewares or []
 
-    @async_operation
     async def execute_request(self, req: TRequest) -> TResult:
+        if not self._middlewares:
+            return await self._execute_request_in_operation(req)
+
+        async with AsyncExitStack() as exit_stack:
+            for middleware in self._middlewares:
+                await exit_stack.enter_async_context(middleware(req))
+            return await self._execute_request_in_operation(req)
+
+    @async_operation
+    async def _execute_request_in_operation(self, req: TRequest) -> TResult:
         handler_cls = self._handlers_by_requests.get(req.__class__)
         if not handler_cls:
             # TODO: использовать свою ошибку
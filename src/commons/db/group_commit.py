@@ -0,0 +1,148 @@
+import asyncio
+import contextvars
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+WriteBatch = Callable[[list[T]], Awaitable[None]]
+"""Запись пачки элементов в одной транзакции"""
+
+BatchObserver = Callable[[int, list[float]], None]
+"""Наблюдатель за записью пачки (размер пачки, время ожидания элементов)"""
+
+
+@dataclass
+class _PendingItem(Generic[T]):
+    item: T
+    future: asyncio.Future[None]
+    submitted_at: float
+
+
+class AsyncGroupCommitWriter(Generic[T]):
+    """
+    Групповая запись (group commit).
+
+    Элементы, пришедшие в течение `max_wait_seconds`, собираются в пачку
+    (не больше `max_batch_size`) и записываются одной транзакцией.
+    Каждый вызывающий ждёт завершения общей записи.
+
+    Если запись пачки упала, элементы записываются по одному, чтобы
+    ошибка одного элемента не затрагивала остальных.
+
+    Должен использоваться в рамках одного event loop.
+    """
+
+    def __init__(
+        self,
+        write_batch: WriteBatch[T],
+        max_batch_size: int,
+        max_wait_seconds: float,
+        observer: BatchObserver | None = None,
+    ):
+        self._write_batch = write_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._observer = observer
+
+        self._pending: list[_PendingItem[T]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._write_tasks: set[asyncio.Task[None]] = set()
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    async def submit(self, item: T) -> None:
+        """
+        Добавляет элемент в пачку и ждёт, пока пачка будет записана
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.append(
+            _PendingItem(item=item, future=future, submitted_at=loop.time())
+        )
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(
+                self._max_wait_seconds, self._flush
+            )
+
+        await future
+
+    async def close(self) -> None:
+        """
+        Записывает накопленные элементы и дожидается всех записей
+        """
+        self._flush()
+        if self._write_tasks:
+            await asyncio.gather(*self._write_tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        # запись общая для всех элементов пачки - контекст
+        # вызывающего (того, кто заполнил пачку) не наследуется
+        task = asyncio.create_task(
+            self._write(batch), context=contextvars.Context()
+        )
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+
+    async def _write(self, batch: list[_PendingItem[T]]) -> None:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        try:
+            await self._write_batch([pending.item for pending in batch])
+        except Exception as exc:
+            if len(batch) == 1:
+                self._set_exception(batch[0], exc)
+            else:
+                self._logger.warning(
+                    'Batch write of %s items failed, writing one by one',
+                    len(batch),
+                    exc_info=exc,
+                )
+                await self._write_one_by_one(batch)
+        else:
+            for pending in batch:
+                self._set_result(pending)
+        finally:
+            # запись прервана (например, отменена при остановке) -
+            # вызывающие не должны ждать бесконечно
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.cancel()
+
+        if self._observer is not None:
+            self._observer(
+                len(batch),
+                [started_at - pending.submitted_at for pending in batch],
+            )
+
+    async def _write_one_by_one(self, batch: list[_PendingItem[T]]) -> None:
+        for pending in batch:
+            try:
+                await self._write_batch([pending.item])
+            except Exception as exc:
+                self._set_exception(pending, exc)
+            else:
+                self._set_result(pending)
+
+    @staticmethod
+    def _set_result(pending: _PendingItem[T]) -> None:
+        if not pending.future.done():
+            pending.future.set_result(None)
+
+    @staticmethod
+    def _set_exception(pending: _PendingItem[T], exc: Exception) -> None:
+        if not pending.future.done():
+            pending.future.set_exception(exc)
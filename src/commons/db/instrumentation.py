@@ -0,0 +1,165 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+QueryListener = Callable[[str, float], None]
+"""Вызывается после каждого запроса: текст запроса и длительность (сек)"""
+
+
+class TooManyDBQueriesError(AssertionError):
+    """
+    Выполнено больше запросов к БД, чем ожидалось
+    """
+
+
+class DBRoundTrips:
+    """
+    Обращения к БД за время отслеживания
+    """
+
+    def __init__(self, record_statements: bool = False) -> None:
+        # запросы, commit и rollback
+        self.count = 0
+        # только запросы
+        self.queries_count = 0
+        # время выполнения запросов (сек)
+        self.duration = 0.0
+        # количество выполнений каждого запроса
+        # (только при record_statements)
+        self.statements: Counter[str] | None = (
+            Counter() if record_statements else None
+        )
+
+    def get_repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Запросы, выполненные не меньше `threshold` раз (признак N+1)
+        """
+        if self.statements is None:
+            return []
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+class DBRoundTripsCounter:
+    """
+    Счётчик обращений к БД (запросы, commit, rollback) и времени
+    выполнения запросов в текущем контексте выполнения.
+
+    Отслеживание может быть вложенным - обращение учитывается
+    во всех активных отслеживаниях
+    """
+
+    def __init__(self) -> None:
+        self._context_round_trips: ContextVar[tuple[DBRoundTrips, ...]] = (
+            ContextVar('context_round_trips', default=())
+        )
+        self._query_listeners: list[QueryListener] = []
+
+    def add_query_listener(self, listener: QueryListener) -> None:
+        """
+        Добавляет обработчик выполненных запросов (метрики, журнал
+        медленных запросов)
+        """
+        self._query_listeners.append(listener)
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """
+        Подписывается на события движка
+        """
+        sync_engine = engine.sync_engine
+        event.listen(
+            sync_engine, 'before_cursor_execute', self._on_before_execute
+        )
+        event.listen(
+            sync_engine, 'after_cursor_execute', self._on_after_execute
+        )
+        event.listen(sync_engine, 'handle_error', self._on_error)
+        event.listen(sync_engine, 'commit', self._on_round_trip)
+        event.listen(sync_engine, 'rollback', self._on_round_trip)
+
+    @contextmanager
+    def track(self, record_statements: bool = False) -> Iterator[DBRoundTrips]:
+        """
+        Считает обращения к БД внутри контекстного менеджера
+
+        :param record_statements: считать выполнения каждого запроса
+        """
+        round_trips = DBRoundTrips(record_statements=record_statements)
+        token = self._context_round_trips.set(
+            self._context_round_trips.get() + (round_trips,)
+        )
+        try:
+            yield round_trips
+        finally:
+            self._context_round_trips.reset(token)
+
+    @contextmanager
+    def assert_max_queries(self, max_count: int) -> Iterator[DBRoundTrips]:
+        """
+        Проверка для тестов: внутри контекстного менеджера выполняется
+        не больше `max_count` запросов (без учёта commit и rollback).
+
+        :raises TooManyDBQueriesError:
+        """
+        with self.track(record_statements=True) as round_trips:
+            yield round_trips
+
+        if round_trips.queries_count > max_count:
+            statements = '\n'.join(
+                f'{count} x {statement}'
+                for statement, count in (round_trips.statements or {}).items()
+            )
+            raise TooManyDBQueriesError(
+                f'Expected at most {max_count} DB queries, '
+                f'got {round_trips.queries_count}:\n{statements}'
+            )
+
+    def _on_round_trip(self, *args: Any, **kwargs: Any) -> None:
+        for round_trips in self._context_round_trips.get():
+            round_trips.count += 1
+
+    def _on_before_execute(
+        self, connection: Connection, *args: Any, **kwargs: Any
+    ) -> None:
+        connection.info.setdefault('query_started_at', []).append(
+            time.perf_counter()
+        )
+        self._on_round_trip()
+
+    def _on_after_execute(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        duration = (
+            time.perf_counter() - connection.info['query_started_at'].pop()
+        )
+        for round_trips in self._context_round_trips.get():
+            round_trips.queries_count += 1
+            round_trips.duration += duration
+            if round_trips.statements is not None:
+                round_trips.statements[statement] += 1
+
+        for listener in self._query_listeners:
+            listener(statement, duration)
+
+    def _on_error(self, exception_context: Any) -> None:
+        connection: Connection | None = exception_context.connection
+        context: ExecutionContext | None = exception_context.execution_context
+        if connection is None or context is None:
+            return
+        started_at = connection.info.get('query_started_at')
+        if started_at:
+            started_at.pop()
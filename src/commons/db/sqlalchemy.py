@@ -1,5 +1,5 @@
 from contextvars import ContextVar
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -28,7 +28,7 @@ class AsyncReadOnlyTransactionContext:
     def __init__(self, **kwargs: Any):
         self.create_session = async_sessionmaker(**kwargs)
 
-        self._context_sessions: ContextVar[AsyncSession] = ContextVar(
+        self._context_sessions: ContextVar[AsyncSession | None] = ContextVar(
             'context_sessions'
         )
 
@@ -63,6 +63,9 @@ class AsyncReadOnlyTransactionContext:
         if session is None:
             return None
 
+        # сессия не переиспользуется: задачи, созданные после выхода
+        # из контекста, не должны получить общую закрытую сессию
+        self._context_sessions.set(None)
         await session.rollback()
         await session.close()
         return False
@@ -73,18 +76,92 @@ class AsyncTransactionContext(AsyncReadOnlyTransactionContext):
     Контекст БД
     """
 
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+
+        self._context_before_commit_callbacks: ContextVar[
+            list[Callable[[], Awaitable[None]]]
+        ] = ContextVar('context_before_commit_callbacks')
+        self._context_after_commit_callbacks: ContextVar[
+            list[Callable[[], None]]
+        ] = ContextVar('context_after_commit_callbacks')
+
+    async def __aenter__(self) -> 'AsyncTransactionContext':
+        self._context_before_commit_callbacks.set([])
+        self._context_after_commit_callbacks.set([])
+        await super().__aenter__()
+        return self
+
+    def _check_is_in_transaction(self) -> None:
+        if not self._context_is_in_transaction.get(False):
+            raise TransactionHasNotStartedError(
+                'The transaction has not started or has already been completed.'
+                'The action must be performed inside the context manager.'
+            )
+
+    def call_before_commit(
+        self, callback: Callable[[], Awaitable[None]]
+    ) -> None:
+        """
+        Вызывает callback перед фиксацией текущей транзакции, в ней же
+        (например, чтобы обновить итоги одним запросом в конце транзакции
+        и держать блокировки их строк только до commit).
+
+        Ошибка callback откатывает транзакцию
+        """
+        self._check_is_in_transaction()
+        self._context_before_commit_callbacks.get().append(callback)
+
+    def call_after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Вызывает callback после успешной фиксации текущей транзакции
+        (например, чтобы сбросить кэш изменённых данных).
+
+        При откате транзакции (исключение в контексте или ошибка
+        callback перед фиксацией) callback отбрасывается: он
+        не вызывается и не переносится в следующую транзакцию
+        """
+        self._check_is_in_transaction()
+        self._context_after_commit_callbacks.get().append(callback)
+
     async def __aexit__(self, *exc: Exception) -> bool | None:
+        before_commit_callbacks = self._context_before_commit_callbacks.get([])
+        self._context_before_commit_callbacks.set([])
+
+        callback_error: BaseException | None = None
+        if exc[0] is None:
+            # вызываются в транзакции - могут использовать текущую сессию
+            try:
+                for before_commit_callback in before_commit_callbacks:
+                    await before_commit_callback()
+            except BaseException as error:
+                callback_error = error
+
         self._context_is_in_transaction.set(False)
+        callbacks = self._context_after_commit_callbacks.get([])
+        self._context_after_commit_callbacks.set([])
+
         session = self._get_session_if_exists()
         if session is None:
+            if callback_error is not None:
+                raise callback_error
             return None
+        self._context_sessions.set(None)
 
-        if exc[0] is None:
+        is_committed = exc[0] is None and callback_error is None
+        if is_committed:
             await session.commit()
         else:
             await session.rollback()
 
         await session.close()
+
+        if callback_error is not None:
+            raise callback_error
+
+        if is_committed:
+            for callback in callbacks:
+                callback()
         return False
 
 
@@ -106,5 +183,32 @@ class BaseRepository(BaseReadOnlyRepository):
     Базовый класс репозитория
     """
 
+    _transaction_context: AsyncTransactionContext
+
     def __init__(self, transaction_context: AsyncTransactionContext):
         super().__init__(transaction_context)
+
+    def call_before_commit(
+        self, callback: Callable[[], Awaitable[None]]
+    ) -> None:
+        """
+        Вызывает callback перед фиксацией транзакции, в ней же
+        """
+        self._transaction_context.call_before_commit(callback)
+
+    def call_after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Вызывает callback после успешной фиксации транзакции
+        (при откате отбрасывается)
+        """
+        self._transaction_context.call_after_commit(callback)
+
+    async def flush(self) -> None:
+        """
+        Отправляет накопленные изменения в БД, не дожидаясь commit.
+
+        По умолчанию изменения отправляются один раз при фиксации
+        транзакции. Явный flush нужен, когда ошибки БД (например,
+        нарушение ограничений) нужно получить раньше
+        """
+        await self.session.flush()
@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
@@ -8,11 +11,84 @@ from commons.datetime_utils import now_tz
 EntityId = NewType('EntityId', uuid.UUID)
 
 
+class _UUIDv7Generator:
+    """
+    Генератор идентификаторов UUIDv7 (RFC 9562).
+
+    Первые 48 бит - время в миллисекундах, поэтому новые идентификаторы
+    попадают в конец индекса первичного ключа, а не в случайное место.
+    12 бит rand_a используются как счётчик внутри одной миллисекунды,
+    что гарантирует монотонность в рамках процесса.
+
+    Потокобезопасен.
+    """
+
+    _MAX_COUNTER = 0xFFF
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_timestamp_ms = 0
+        self._counter = 0
+
+    def generate(self, count: int = 1) -> list[uuid.UUID]:
+        """
+        Создаёт `count` возрастающих идентификаторов
+        """
+        random_bytes = os.urandom(8 * count)
+        ids = []
+
+        with self._lock:
+            for i in range(count):
+                timestamp_ms, counter = self._next_timestamp_and_counter()
+                rand_b = int.from_bytes(random_bytes[i * 8 : i * 8 + 8])
+                ids.append(self._build(timestamp_ms, counter, rand_b))
+
+        return ids
+
+    def _next_timestamp_and_counter(self) -> tuple[int, int]:
+        timestamp_ms = time.time_ns() // 1_000_000
+
+        if timestamp_ms > self._last_timestamp_ms:
+            self._last_timestamp_ms = timestamp_ms
+            # старший бит оставляем нулевым, чтобы было место для счётчика
+            self._counter = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            # часы не сдвинулись (или пошли назад) - продолжаем счётчик
+            self._counter += 1
+            if self._counter > self._MAX_COUNTER:
+                self._last_timestamp_ms += 1
+                self._counter = 0
+
+        return self._last_timestamp_ms, self._counter
+
+    @staticmethod
+    def _build(timestamp_ms: int, counter: int, rand_b: int) -> uuid.UUID:
+        value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        value |= 0x7 << 76  # версия
+        value |= counter << 64
+        value |= 0b10 << 62  # вариант RFC 9562
+        value |= rand_b & 0x3FFF_FFFF_FFFF_FFFF
+        return uuid.UUID(int=value)
+
+
+_uuid7_generator = _UUIDv7Generator()
+
+
 def create_entity_id() -> EntityId:
     """
-    Создаёт идентификатор сущности
+    Создаёт идентификатор сущности (UUIDv7, упорядочен по времени)
+    """
+    return EntityId(_uuid7_generator.generate()[0])
+
+
+def create_entity_ids(count: int) -> list[EntityId]:
+    """
+    Создаёт пачку возрастающих идентификаторов сущностей.
+
+    Дешевле, чем `count` вызовов `create_entity_id` - случайные байты
+    читаются и блокировка берётся один раз
     """
-    return EntityId(uuid.uuid4())
+    return [EntityId(id_) for id_ in _uuid7_generator.generate(count)]
 
 
 @dataclass
@@ -0,0 +1,7 @@
+from .histogram import LatencyHistogram
+from .open_loop import (
+    ArrivalProcess,
+    OpenLoopResult,
+    SendRequest,
+    run_open_loop,
+)
@@ -0,0 +1,80 @@
+import math
+
+SIGNIFICANT_BITS = 7
+"""
+Точность корзин гистограммы: значения в корзине отличаются
+не больше чем на 1/2**(SIGNIFICANT_BITS - 1) (меньше 2%)
+"""
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек (в микросекундах) с логарифмическими корзинами.
+
+    Память не зависит от количества значений, гистограммы можно
+    складывать (`merge`). Процентили считаются по верхней границе
+    корзины - не занижаются
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @staticmethod
+    def _get_bucket(value: int) -> int:
+        """
+        Нижняя граница корзины значения
+        """
+        shift = max(value.bit_length() - SIGNIFICANT_BITS, 0)
+        return (value >> shift) << shift
+
+    @staticmethod
+    def _get_bucket_upper(bucket: int) -> int:
+        shift = max(bucket.bit_length() - SIGNIFICANT_BITS, 0)
+        return bucket + (1 << shift) - 1
+
+    def record(self, value: float) -> None:
+        """
+        :param value: задержка в секундах
+        """
+        value_us = max(round(value * 1_000_000), 0)
+        bucket = self._get_bucket(value_us)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+
+        self.min = value_us if self.count == 0 else min(self.min, value_us)
+        self.max = max(self.max, value_us)
+        self.count += 1
+        self.total += value_us
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+        if other.count:
+            self.min = other.min if not self.count else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def get_percentile(self, fraction: float) -> float:
+        """
+        Задержка (мс), не меньше которой `fraction` всех значений
+        """
+        if not self.count:
+            return math.nan
+        rank = max(math.ceil(fraction * self.count), 1)
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                return min(self._get_bucket_upper(bucket), self.max) / 1000
+        return self.max / 1000
+
+    @property
+    def mean(self) -> float:
+        """
+        Средняя задержка (мс)
+        """
+        return self.total / self.count / 1000 if self.count else math.nan
@@ -0,0 +1,119 @@
+import asyncio
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Awaitable, Callable
+
+from .histogram import LatencyHistogram
+
+SendRequest = Callable[[], Awaitable[str | None]]
+"""Отправка одного запроса. Возвращает описание ошибки или None"""
+
+
+class ArrivalProcess(StrEnum):
+    # равные интервалы между запросами
+    CONSTANT = 'constant'
+    # пуассоновский поток (случайные интервалы со средним 1 / rate)
+    POISSON = 'poisson'
+
+
+@dataclass
+class OpenLoopResult:
+    """
+    Результат нагрузки
+    """
+
+    duration: float
+
+    # задержка от запланированного времени отправки. Учитывает ожидание
+    # запросов, которые не удалось отправить вовремя (coordinated omission)
+    response_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    # задержка от фактического начала отправки
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    scheduled: int = 0
+    completed: int = 0
+    # не отправлены: превышен лимит одновременных запросов
+    dropped: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def achieved_rps(self) -> float:
+        return self.completed / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        total = self.completed + self.dropped
+        return (
+            (sum(self.errors.values()) + self.dropped) / total if total else 0.0
+        )
+
+
+async def run_open_loop(
+    send_request: SendRequest,
+    rate: float,
+    duration: float,
+    arrival_process: ArrivalProcess = ArrivalProcess.POISSON,
+    max_in_flight: int = 10_000,
+    rng: random.Random | None = None,
+) -> OpenLoopResult:
+    """
+    Нагрузка с открытым циклом: запросы отправляются по расписанию
+    (`rate` в секунду в течение `duration` секунд), не дожидаясь ответов
+    на предыдущие.
+
+    Если сервер (или пул соединений клиента) не успевает, задержка
+    запросов считается от запланированного, а не от фактического
+    времени отправки - медленные ответы не уменьшают число замеров
+    """
+    rng = rng or random.Random()
+    result = OpenLoopResult(duration=duration)
+    in_flight: set[asyncio.Task[None]] = set()
+
+    async def send(scheduled_at: float) -> None:
+        started_at = time.perf_counter()
+        try:
+            error = await send_request()
+        except Exception as exc:
+            error = type(exc).__name__
+        finished_at = time.perf_counter()
+
+        result.completed += 1
+        result.response_time.record(finished_at - scheduled_at)
+        result.service_time.record(finished_at - started_at)
+        if error is not None:
+            result.errors[error] += 1
+
+    def get_interval() -> float:
+        if arrival_process == ArrivalProcess.POISSON:
+            return rng.expovariate(rate)
+        return 1 / rate
+
+    started_at = time.perf_counter()
+    finish_at = started_at + duration
+    scheduled_at = started_at
+    while scheduled_at < finish_at:
+        delay = scheduled_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # после задержки цикла отправляются все запросы, время которых
+        # уже наступило - с их запланированным временем
+        now = time.perf_counter()
+        while scheduled_at <= now and scheduled_at < finish_at:
+            result.scheduled += 1
+            if len(in_flight) >= max_in_flight:
+                result.dropped += 1
+            else:
+                task = asyncio.create_task(send(scheduled_at))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            scheduled_at += get_interval()
+
+    if in_flight:
+        await asyncio.wait(in_flight)
+    result.duration = time.perf_counter() - started_at
+    return result
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from typing import Any, Callable, Generic, Iterable, Type, TypeVar
 
@@ -16,7 +17,11 @@ class MapperConfig(Generic[T, R]):
     target_type: Type[R]
 
     field_mappings: dict[str, str] = field(default_factory=dict)
-    """Соответствие названий полей (название_целевого_поля -> название_исходного_поля)"""
+    """
+    Соответствие названий полей (название_целевого_поля -> название_исходного_поля).
+    Для строк результата запроса sqlalchemy название исходного поля -
+    название (label) колонки
+    """
 
     computed_fields: dict[str, ComputedField] = field(default_factory=dict)
     """Вычисляемые поля (название_целевого_поля -> функция_вычисления)"""
@@ -26,6 +31,13 @@ class MapperConfig(Generic[T, R]):
     )
     """Конфиги мапперов для вложенных классов"""
 
+    validate_target: bool = True
+    """
+    Валидировать целевую pydantic модель при создании.
+    False - модель создаётся без валидации (model_construct),
+    подходит для доверенных данных
+    """
+
 
 class Mapper:
     @abstractmethod
@@ -40,3 +52,12 @@ class Mapper:
         mapper_config: C,
         extra: dict[str, Any] | None = None,
     ) -> Iterable[R]: ...
+
+    @abstractmethod
+    async def map_many_async(
+        self,
+        sources: Iterable[T],
+        mapper_config: C,
+        extra: dict[str, Any] | None = None,
+        executor: Executor | None = None,
+    ) -> Iterable[R]: ...
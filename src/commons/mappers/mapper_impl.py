@@ -1,9 +1,14 @@
-from dataclasses import fields, is_dataclass
+import asyncio
+import importlib
+import sys
+from collections.abc import Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
 from enum import StrEnum, auto
 from inspect import isclass
 from typing import Any, Iterable, Type, get_type_hints
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from commons.mappers.mapper import (
     C,
@@ -12,6 +17,7 @@ from commons.mappers.mapper import (
     R,
     T,
 )
+from commons.tracing import tracer
 
 
 class MapperError(Exception):
@@ -118,11 +124,25 @@ class ValidationMappingError(MapperError):
         )
 
 
+class MapperConfigTransferError(MapperError):
+    """Ошибка при передаче конфигурации маппера в другой процесс"""
+
+    def __init__(self, mapper_config: MapperConfig[Any, Any]):
+        self.mapper_config = mapper_config
+        super().__init__(
+            f'MapperConfig {mapper_config.source_type.__name__} -> '
+            f'{mapper_config.target_type.__name__} cannot be sent to a '
+            f'worker process: define it at module level'
+        )
+
+
 class ObjectType(StrEnum):
     """Типы объектов, поддерживаемые маппером"""
 
     DATACLASS = auto()
     PYDANTIC = auto()
+    ROW = auto()
+    MAPPING = auto()
     DICT_LIKE = auto()
     UNSUPPORTED = auto()
 
@@ -137,6 +157,12 @@ class ObjectTypeDetector:
             return ObjectType.DATACLASS
         elif isinstance(obj, BaseModel):
             return ObjectType.PYDANTIC
+        elif hasattr(obj, '_fields') and hasattr(obj, '_asdict'):
+            # sqlalchemy Row, namedtuple
+            return ObjectType.ROW
+        elif isinstance(obj, Mapping):
+            # dict, sqlalchemy RowMapping
+            return ObjectType.MAPPING
         elif hasattr(obj, '__dict__'):
             return ObjectType.DICT_LIKE
         else:
@@ -187,7 +213,16 @@ class ObjectConverter:
                     for field in fields(obj)
                 }
             elif obj_type == ObjectType.PYDANTIC:
-                return obj.dict()
+                # без рекурсии (в отличие от model_dump) - вложенные модели
+                # остаются объектами и маппятся вложенными мапперами
+                return {
+                    field_name: getattr(obj, field_name)
+                    for field_name in type(obj).model_fields
+                }
+            elif obj_type == ObjectType.ROW:
+                return obj._asdict()
+            elif obj_type == ObjectType.MAPPING:
+                return dict(obj)
             elif obj_type == ObjectType.DICT_LIKE:
                 return obj.__dict__
             else:
@@ -236,7 +271,7 @@ class FieldExtractor:
             if cls_type == ObjectType.DATACLASS:
                 return self._get_dataclass_fields(cls)
             elif cls_type == ObjectType.PYDANTIC:
-                return list(cls.__annotations__.keys())
+                return list(cls.model_fields)
             else:
                 raise MapperConfigTypeError(cls)
         except MapperError:
@@ -426,15 +461,36 @@ class NestedMapperInitializer:
 
 
 class ObjectValidator:
-    """Валидатор объектов"""
+    """
+    Создание и валидация целевого объекта.
+
+    Объект создаётся один раз. Pydantic модели в режиме валидации
+    проверяются через закэшированный TypeAdapter, в доверенном режиме
+    создаются без валидации (model_construct)
+    """
+
+    def __init__(self) -> None:
+        self._type_adapters: dict[Type[Any], TypeAdapter[Any]] = {}
+
+    def create_target(
+        self,
+        mapped_dict: dict[str, Any],
+        target_type: Type[Any],
+        validate: bool = True,
+    ) -> Any:
+        """Создаёт целевой объект из результата маппинга"""
+        is_pydantic = isclass(target_type) and issubclass(
+            target_type, BaseModel
+        )
 
-    @staticmethod
-    def validate_mapping_result(
-        mapped_dict: dict[str, Any], target_type: Type[Any]
-    ) -> None:
-        """Валидирует результат маппинга"""
         try:
-            target_type(**mapped_dict)
+            if not is_pydantic:
+                return target_type(**mapped_dict)
+            if not validate:
+                return target_type.model_construct(**mapped_dict)
+            return self._get_type_adapter(target_type).validate_python(
+                mapped_dict
+            )
         except ValidationError as e:
             raise ValidationMappingError(target_type, e)
         except Exception as e:
@@ -442,22 +498,155 @@ class ObjectValidator:
                 target_type,
                 ValidationError.from_exception_data(
                     'ValidationError',
-                    [{'loc': (), 'msg': str(e), 'type': 'value_error'}],
+                    [
+                        {
+                            'loc': (),
+                            'input': mapped_dict,
+                            'ctx': {'error': str(e)},
+                            'type': 'value_error',
+                        }
+                    ],
                 ),
             )
 
+    def _get_type_adapter(self, target_type: Type[Any]) -> TypeAdapter[Any]:
+        type_adapter = self._type_adapters.get(target_type)
+        if type_adapter is None:
+            type_adapter = TypeAdapter(target_type)
+            self._type_adapters[target_type] = type_adapter
+        return type_adapter
+
+
+@dataclass(frozen=True)
+class MapperConfigReference:
+    """Ссылка на конфигурацию маппера, объявленную на уровне модуля"""
+
+    module: str
+    name: str
+
+
+class MapperConfigTransfer:
+    """
+    Передача конфигурации маппера в другой процесс.
+
+    Вычисляемые поля часто заданы лямбдами, которые нельзя сериализовать
+    через pickle, поэтому в процесс передаётся ссылка на конфигурацию
+    (модуль и имя переменной), а сама конфигурация берётся из модуля
+    в рабочем процессе
+    """
+
+    def __init__(self) -> None:
+        self._references: dict[
+            int, tuple[MapperConfig[Any, Any], MapperConfigReference]
+        ] = {}
+
+    def get_reference(
+        self, mapper_config: MapperConfig[Any, Any]
+    ) -> MapperConfigReference:
+        """Находит ссылку на конфигурацию маппера"""
+        cached = self._references.get(id(mapper_config))
+        if cached is not None:
+            return cached[1]
+
+        reference = self._find_reference(mapper_config)
+        # конфигурация хранится вместе со ссылкой, чтобы id не переиспользовался
+        self._references[id(mapper_config)] = (mapper_config, reference)
+        return reference
+
+    @staticmethod
+    def resolve(reference: MapperConfigReference) -> MapperConfig[Any, Any]:
+        """Получает конфигурацию маппера по ссылке"""
+        module = importlib.import_module(reference.module)
+        mapper_config: MapperConfig[Any, Any] = getattr(module, reference.name)
+        return mapper_config
+
+    @staticmethod
+    def _find_reference(
+        mapper_config: MapperConfig[Any, Any],
+    ) -> MapperConfigReference:
+        # конфигурацию ищем в модулях, где объявлены вычисляемые поля
+        # и типы - обычно она объявлена рядом с ними
+        module_names = dict.fromkeys(
+            [
+                *(
+                    getattr(func, '__module__', None)
+                    for func in mapper_config.computed_fields.values()
+                ),
+                mapper_config.source_type.__module__,
+                mapper_config.target_type.__module__,
+            ]
+        )
+
+        for module_name in module_names:
+            if not module_name or module_name == '__main__':
+                continue
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            for name, value in vars(module).items():
+                if value is mapper_config:
+                    return MapperConfigReference(module=module_name, name=name)
+
+        raise MapperConfigTransferError(mapper_config)
+
+
+_worker_mapper: 'MapperImpl | None' = None
+
+
+def _map_chunk_in_worker(
+    mapper_config: MapperConfig[Any, Any] | MapperConfigReference,
+    sources: list[Any],
+    extra: dict[str, Any] | None,
+) -> list[Any]:
+    """
+    Маппинг части объектов в исполнителе (процессе или потоке)
+    """
+    global _worker_mapper
+    if _worker_mapper is None:
+        _worker_mapper = MapperImpl()
+
+    resolved_config: MapperConfig[Any, Any] = (
+        MapperConfigTransfer.resolve(mapper_config)
+        if isinstance(mapper_config, MapperConfigReference)
+        else mapper_config
+    )
+
+    try:
+        return _worker_mapper.map_many(sources, resolved_config, extra)
+    except MapperError as e:
+        # наследники MapperError не всегда восстанавливаются из pickle
+        raise MapperError(str(e)) from None
+
 
 class MapperImpl(Mapper):
     """
     Реализация маппера
 
     Поддерживает мапинг датаклассов и pydantic моделей.
+    Источником также может быть строка результата запроса sqlalchemy
+    (Row, RowMapping) или словарь - поля берутся по названиям колонок.
     Для маппинга используется Pydantic.
 
     Потокобезопаен.
+
+    map_many_async может выполняться параллельно в executor (пул
+    процессов): объекты делятся на части по `parallel_chunk_size`.
+    Передача объектов в процессы дороже маппинга небольших пачек,
+    поэтому executor используется только для пачек от
+    `parallel_threshold` объектов. Порог подбирается бенчмарком
+    benchmarks.mapper_parallel на целевой машине; по умолчанию
+    (None) маппинг всегда выполняется в текущем потоке
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        parallel_threshold: int | None = None,
+        parallel_chunk_size: int = 2_000,
+    ):
+        self._parallel_threshold = parallel_threshold
+        self._parallel_chunk_size = parallel_chunk_size
+        self._config_transfer = MapperConfigTransfer()
+
         # Инициализация зависимостей
         self._type_detector = ObjectTypeDetector()
         self._converter = ObjectConverter(self._type_detector)
@@ -475,7 +664,17 @@ class MapperImpl(Mapper):
         extra: dict[str, Any] | None = None,
     ) -> R:
         """Маппинг одного объекта"""
-        return self._map_with_cache(source, mapper_config, extra)
+        if not tracer.is_enabled:
+            return self._map_with_cache(source, mapper_config, extra)
+
+        with tracer.start_span(
+            'mapper.map',
+            attributes={
+                'mapper.source': type(source).__name__,
+                'mapper.target': mapper_config.target_type.__name__,
+            },
+        ):
+            return self._map_with_cache(source, mapper_config, extra)
 
     def map_many(
         self,
@@ -483,7 +682,67 @@ class MapperImpl(Mapper):
         mapper_config: C,
         extra: dict[str, Any] | None = None,
     ) -> list[R]:
-        """Маппинг множества объектов"""
+        """Маппинг множества объектов в текущем потоке"""
+        return self._map_many_inline(sources, mapper_config, extra)
+
+    async def map_many_async(
+        self,
+        sources: Iterable[T],
+        mapper_config: C,
+        extra: dict[str, Any] | None = None,
+        executor: Executor | None = None,
+    ) -> list[R]:
+        """
+        Маппинг множества объектов. Большие пачки маппятся в `executor`
+        без блокировки event loop на время его работы
+        """
+        sources = list(sources)
+        if (
+            executor is None
+            or self._parallel_threshold is None
+            or len(sources) < self._parallel_threshold
+        ):
+            return self._map_many_inline(sources, mapper_config, extra)
+
+        futures = self._submit_chunks(executor, sources, mapper_config, extra)
+        chunks_results = await asyncio.gather(
+            *(asyncio.wrap_future(future) for future in futures)
+        )
+        return [result for results in chunks_results for result in results]
+
+    def _submit_chunks(
+        self,
+        executor: Executor,
+        sources: list[Any],
+        mapper_config: MapperConfig[Any, Any],
+        extra: dict[str, Any] | None,
+    ) -> list[Future[list[Any]]]:
+        """Делит объекты на части и отправляет их в executor"""
+        transferable_config: MapperConfig[Any, Any] | MapperConfigReference
+        if isinstance(executor, ProcessPoolExecutor):
+            transferable_config = self._config_transfer.get_reference(
+                mapper_config
+            )
+        else:
+            transferable_config = mapper_config
+
+        return [
+            executor.submit(
+                _map_chunk_in_worker,
+                transferable_config,
+                sources[start : start + self._parallel_chunk_size],
+                extra,
+            )
+            for start in range(0, len(sources), self._parallel_chunk_size)
+        ]
+
+    def _map_many_inline(
+        self,
+        sources: Iterable[T],
+        mapper_config: C,
+        extra: dict[str, Any] | None = None,
+    ) -> list[R]:
+        """Маппинг множества объектов в текущем потоке"""
         # Создаем кэш один раз для всех объектов
         nested_mappers = {}
 
@@ -580,7 +839,11 @@ class MapperImpl(Mapper):
                 )
 
             # Создаем целевой объект
-            return mapper_config.target_type(**mapped_dict)
+            return self._object_validator.create_target(
+                mapped_dict,
+                mapper_config.target_type,
+                validate=mapper_config.validate_target,
+            )
 
         except MapperError:
             # Пробрасываем кастомные ошибки маппера
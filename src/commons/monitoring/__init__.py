@@ -0,0 +1,28 @@
+from .event_loop import (
+    BlockingListener,
+    EventLoopLagMonitor,
+    LagListener,
+    log_blocking,
+)
+from .memory import (
+    AllocationSite,
+    MemoryProfiler,
+    MemoryReport,
+    ReportListener,
+    count_live_objects,
+)
+from .metrics import (
+    GaugeMultiprocessMode,
+    MetricsRegistry,
+    metrics_registry,
+)
+from .profiling import (
+    ContinuousProfiler,
+    SampleListener,
+    Stack,
+    TaskSamplingProfiler,
+    get_task_stack,
+    get_thread_stack,
+    to_folded,
+    to_speedscope,
+)
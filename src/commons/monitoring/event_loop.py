@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Callable
+
+LagListener = Callable[[float], None]
+"""Получает задержку цикла событий (сек)"""
+
+BlockingListener = Callable[[float, str], None]
+"""Получает время блокировки цикла событий (сек) и стек его потока"""
+
+
+class EventLoopLagMonitor:
+    """
+    Измеряет задержку цикла событий: насколько позже запланированного
+    просыпается задача, которая каждые `interval_seconds` засыпает.
+    Задержка - время, когда цикл был занят синхронным кодом
+    (и не обрабатывал другие запросы).
+
+    Отладочный режим (`blocking_threshold_seconds`): фоновый поток
+    следит, что задача просыпается вовремя, и если цикл занят дольше
+    порога - снимает стек потока цикла событий (код, который его
+    блокирует)
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        on_lag: LagListener,
+        blocking_threshold_seconds: float | None = None,
+        on_blocking: BlockingListener | None = None,
+    ):
+        self._interval_seconds = interval_seconds
+        self._on_lag = on_lag
+        self._blocking_threshold_seconds = blocking_threshold_seconds
+        self._on_blocking = on_blocking or log_blocking
+
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._is_stopped = threading.Event()
+        self._loop_thread_id = 0
+        # время последнего пробуждения задачи (time.monotonic)
+        self._heartbeat = 0.0
+
+    def start(self) -> None:
+        """
+        Запускает мониторинг (вызывается в работающем цикле событий)
+        """
+        self._is_stopped.clear()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._measure())
+
+        if self._blocking_threshold_seconds is not None:
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                name='event-loop-watchdog',
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._is_stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started_at = loop.time()
+            await asyncio.sleep(self._interval_seconds)
+            self._heartbeat = time.monotonic()
+            lag = loop.time() - started_at - self._interval_seconds
+            self._on_lag(max(lag, 0.0))
+
+    def _watch(self) -> None:
+        assert self._blocking_threshold_seconds is not None
+        threshold = self._blocking_threshold_seconds
+        # задача просыпается не позже, чем через interval
+        # (если цикл не заблокирован)
+        max_silence = self._interval_seconds + threshold
+        reported_heartbeat = 0.0
+
+        while not self._is_stopped.wait(min(threshold / 2, 0.1)):
+            heartbeat = self._heartbeat
+            silence = time.monotonic() - heartbeat
+            if silence < max_silence or heartbeat == reported_heartbeat:
+                continue
+
+            # одна блокировка - один отчёт
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = ''.join(traceback.format_stack(frame))
+            self._on_blocking(silence - self._interval_seconds, stack)
+
+
+def log_blocking(blocked_seconds: float, stack: str) -> None:
+    logging.getLogger('event_loop_monitor').warning(
+        'Event loop is blocked for at least %.3f s:\n%s', blocked_seconds, stack
+    )
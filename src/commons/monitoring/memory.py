@@ -0,0 +1,182 @@
+import asyncio
+import gc
+import logging
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+"""Выделения памяти, не относящиеся к приложению"""
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationSite:
+    """
+    Место выделения памяти (файл:строка): размер и количество блоков,
+    изменение с предыдущего снимка
+    """
+
+    location: str
+    size: int
+    count: int
+    size_diff: int = 0
+    count_diff: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryReport:
+    """
+    Отчёт по снимку памяти
+    """
+
+    # время снимка (unix time)
+    taken_at: float
+    # память, выделенная при включённом tracemalloc (байт)
+    traced_size: int
+    traced_peak_size: int
+    top_allocations: list[AllocationSite]
+    # наибольший рост с предыдущего снимка
+    top_growth: list[AllocationSite]
+    # живые объекты отслеживаемых типов
+    live_objects: dict[str, int]
+
+
+ReportListener = Callable[[MemoryReport], None]
+
+
+def count_live_objects(types: Sequence[type]) -> dict[str, int]:
+    """
+    Количество живых объектов заданных типов (точное совпадение типа).
+
+    Обходит все объекты, отслеживаемые сборщиком мусора - время
+    пропорционально размеру кучи
+    """
+    counts = Counter(map(type, gc.get_objects()))
+    return {cls.__name__: counts[cls] for cls in types}
+
+
+def _get_location(traceback: tracemalloc.Traceback) -> str:
+    frame = traceback[0]
+    return f'{frame.filename}:{frame.lineno}'
+
+
+class MemoryProfiler:
+    """
+    Профилировщик памяти для поиска утечек.
+
+    Включает tracemalloc (замедляет выделение памяти - включается
+    на время поиска) и каждые `interval_seconds` снимает снимок:
+    места, где выделено больше всего памяти, и места наибольшего роста
+    с предыдущего снимка. Считает живые объекты `tracked_types`
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        tracked_types: Sequence[type] = (),
+        top_count: int = 20,
+        traceback_frames: int = 1,
+        on_report: ReportListener | None = None,
+    ):
+        self._interval_seconds = interval_seconds
+        self._tracked_types = tracked_types
+        self._top_count = top_count
+        self._traceback_frames = traceback_frames
+        self._on_report = on_report
+
+        self._task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+        self._is_tracing_started = False
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self.last_report: MemoryReport | None = None
+
+    def start(self) -> None:
+        """
+        Запускает профилирование (вызывается в работающем цикле событий)
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._traceback_frames)
+            self._is_tracing_started = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._is_tracing_started:
+            tracemalloc.stop()
+            self._is_tracing_started = False
+        self._snapshot = None
+
+    async def take_report(self) -> MemoryReport:
+        """
+        Снимает снимок памяти и сравнивает с предыдущим
+        """
+        async with self._lock:
+            # снимок и подсчёт объектов занимают заметное время -
+            # вне задачи цикла событий
+            report = await asyncio.to_thread(self._take_report)
+        self.last_report = report
+        if self._on_report is not None:
+            self._on_report(report)
+        return report
+
+    def _take_report(self) -> MemoryReport:
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        traced_size, traced_peak_size = tracemalloc.get_traced_memory()
+
+        statistics = snapshot.statistics('lineno')[: self._top_count]
+        top_allocations = [
+            AllocationSite(
+                location=_get_location(statistic.traceback),
+                size=statistic.size,
+                count=statistic.count,
+            )
+            for statistic in statistics
+        ]
+
+        top_growth = []
+        if self._snapshot is not None:
+            differences = snapshot.compare_to(self._snapshot, 'lineno')
+            top_growth = [
+                AllocationSite(
+                    location=_get_location(difference.traceback),
+                    size=difference.size,
+                    count=difference.count,
+                    size_diff=difference.size_diff,
+                    count_diff=difference.count_diff,
+                )
+                for difference in differences[: self._top_count]
+                if difference.size_diff > 0
+            ]
+        self._snapshot = snapshot
+
+        return MemoryReport(
+            taken_at=time.time(),
+            traced_size=traced_size,
+            traced_peak_size=traced_peak_size,
+            top_allocations=top_allocations,
+            top_growth=top_growth,
+            live_objects=count_live_objects(self._tracked_types),
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            try:
+                await self.take_report()
+            except Exception:
+                logging.getLogger('memory_profiler').exception(
+                    'Failed to take memory report'
+                )
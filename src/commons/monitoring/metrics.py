@@ -0,0 +1,155 @@
+import glob
+import os
+import re
+from typing import Literal, Sequence
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+)
+
+MULTIPROCESS_DIRECTORY_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+# файлы значений gauge, которые учитываются только у живых процессов
+LIVE_GAUGE_FILE_PATTERN = re.compile(r'^gauge_live\w+?_(\d+)\.db$')
+
+GaugeMultiprocessMode = Literal[
+    'livesum', 'liveall', 'livemin', 'livemax', 'livemostrecent'
+]
+"""Как значения gauge процессов объединяются при сборе"""
+
+
+def is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик Prometheus приложения - все метрики создаются через
+    него.
+
+    Многопроцессный режим (несколько воркеров uvicorn/gunicorn)
+    включается переменной окружения PROMETHEUS_MULTIPROC_DIR до запуска:
+    процессы пишут значения метрик в файлы каталога (mmap), при сборе
+    они объединяются - метрики не зависят от того, какой воркер ответил
+    на запрос. Каталог очищается перед запуском сервера
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY):
+        self.registry = registry
+
+    @property
+    def multiprocess_directory(self) -> str | None:
+        return os.environ.get(MULTIPROCESS_DIRECTORY_ENV)
+
+    @property
+    def is_multiprocess(self) -> bool:
+        return self.multiprocess_directory is not None
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> Counter:
+        return Counter(name, documentation, labelnames, registry=self.registry)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return Histogram(
+            name,
+            documentation,
+            labelnames,
+            buckets=buckets,
+            registry=self.registry,
+        )
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        multiprocess_mode: GaugeMultiprocessMode = 'livesum',
+    ) -> Gauge:
+        """
+        :param multiprocess_mode: объединение значений процессов
+            (liveall - по отдельности, с меткой pid)
+        """
+        return Gauge(
+            name,
+            documentation,
+            labelnames,
+            registry=self.registry,
+            multiprocess_mode=multiprocess_mode,
+        )
+
+    def clear_gauge(self, gauge: Gauge) -> None:
+        """
+        Удаляет все серии метрики. В многопроцессном режиме серии
+        из файлов процесса не удаляются - значения обнуляются
+        """
+        if not self.is_multiprocess:
+            gauge.clear()
+            return
+        for metric in gauge.collect():
+            for sample in metric.samples:
+                gauge.labels(**sample.labels).set(0)
+
+    def get_collector_registry(self) -> CollectorRegistry:
+        """
+        Реестр для отдачи метрик: в многопроцессном режиме - значения
+        всех процессов из файлов каталога
+        """
+        if not self.is_multiprocess:
+            return self.registry
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        return registry
+
+    def mark_process_dead(self, pid: int) -> None:
+        """
+        Удаляет значения gauge завершившегося процесса (счётчики
+        и гистограммы сохраняются, чтобы не уменьшались суммы)
+        """
+        if self.is_multiprocess:
+            multiprocess.mark_process_dead(  # type: ignore[no-untyped-call]
+                pid, self.multiprocess_directory
+            )
+
+    def remove_dead_processes(self) -> list[int]:
+        """
+        Удаляет значения gauge процессов, завершившихся без очистки
+        (например, упавших воркеров). Возвращает их pid
+        """
+        directory = self.multiprocess_directory
+        if directory is None:
+            return []
+
+        dead_pids = set()
+        for path in glob.glob(os.path.join(directory, 'gauge_live*.db')):
+            match = LIVE_GAUGE_FILE_PATTERN.match(os.path.basename(path))
+            if match is not None and not is_process_alive(int(match[1])):
+                dead_pids.add(int(match[1]))
+
+        for pid in dead_pids:
+            self.mark_process_dead(pid)
+        return sorted(dead_pids)
+
+
+metrics_registry = MetricsRegistry()
+"""Реестр метрик приложения"""
@@ -0,0 +1,303 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from types import FrameType
+from typing import Any, Callable, Mapping
+
+FrameKey = tuple[str, str, int]
+"""Функция: имя, файл, первая строка"""
+
+Stack = tuple[FrameKey, ...]
+"""Стек от внешней функции к внутренней"""
+
+
+def get_frame_key(frame: FrameType) -> FrameKey:
+    code = frame.f_code
+    return code.co_qualname, code.co_filename, code.co_firstlineno
+
+
+def get_thread_stack(frame: FrameType | None) -> Stack:
+    """
+    Стек потока от его текущего кадра
+    """
+    stack = []
+    while frame is not None:
+        stack.append(get_frame_key(frame))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+def get_coroutine_frame(coroutine: Any) -> FrameType | None:
+    for attr_name in ('cr_frame', 'gi_frame', 'ag_frame'):
+        frame: FrameType | None = getattr(coroutine, attr_name, None)
+        if frame is not None:
+            return frame
+    return None
+
+
+def get_awaited(coroutine: Any) -> Any:
+    for attr_name in ('cr_await', 'gi_yieldfrom', 'ag_await'):
+        awaited = getattr(coroutine, attr_name, None)
+        if awaited is not None:
+            return awaited
+    return None
+
+
+def is_running(coroutine: Any) -> bool:
+    return any(
+        getattr(coroutine, attr_name, False)
+        for attr_name in ('cr_running', 'gi_running', 'ag_running')
+    )
+
+
+def get_task_stack(
+    task: asyncio.Task[Any], thread_frame: FrameType | None
+) -> Stack:
+    """
+    Стек задачи: цепочка ожидающих друг друга корутин, а если задача
+    выполняется - и синхронные вызовы потока цикла событий над последней
+    из них (в том числе в greenlet SQLAlchemy, где стек потока
+    не доходит до корутин)
+    """
+    stack = []
+    coroutine = task.get_coro()
+    while True:
+        coroutine_frame = get_coroutine_frame(coroutine)
+        if coroutine_frame is None:
+            # ждёт future (ввод-вывод, блокировка, таймер)
+            stack.append((f'<await {type(coroutine).__name__}>', '', 0))
+            return tuple(stack)
+        stack.append(get_frame_key(coroutine_frame))
+
+        awaited = get_awaited(coroutine)
+        if awaited is None:
+            break
+        coroutine = awaited
+
+    if not is_running(coroutine):
+        return tuple(stack)
+
+    calls = []
+    frame = thread_frame
+    while frame is not None and frame is not coroutine_frame:
+        calls.append(get_frame_key(frame))
+        frame = frame.f_back
+    return tuple(stack) + tuple(reversed(calls))
+
+
+class TaskSamplingProfiler:
+    """
+    Сэмплирующий профилировщик одной задачи asyncio по реальному
+    времени: фоновый поток каждые `interval_seconds` снимает её стек -
+    и когда задача выполняется, и когда ждёт (БД, сеть).
+
+    Другие задачи цикла событий в профиль не попадают. Задача
+    профилировщика не замедляет (стек читается из другого потока)
+    """
+
+    def __init__(self, task: asyncio.Task[Any], interval_seconds: float):
+        self._task = task
+        self._interval_seconds = interval_seconds
+        self._loop_thread_id = threading.get_ident()
+        self._is_stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        # время, проведённое в каждом стеке (сек)
+        self.stacks: defaultdict[Stack, float] = defaultdict(float)
+        self.duration = 0.0
+
+    def start(self) -> None:
+        """
+        Запускает профилирование (вызывается в потоке цикла событий)
+        """
+        self._loop_thread_id = threading.get_ident()
+        self._thread = threading.Thread(
+            target=self._run, name='task-profiler', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._is_stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        started_at = sampled_at = time.perf_counter()
+        while not self._is_stopped.wait(self._interval_seconds):
+            thread_frame = sys._current_frames().get(self._loop_thread_id)
+            stack = get_task_stack(self._task, thread_frame)
+
+            now = time.perf_counter()
+            self.stacks[stack] += now - sampled_at
+            sampled_at = now
+        self.duration = time.perf_counter() - started_at
+
+
+SampleListener = Callable[[float], None]
+"""Получает время, затраченное на снятие стека (сек)"""
+
+
+class ContinuousProfiler:
+    """
+    Постоянный сэмплирующий профилировщик потока цикла событий: фоновый
+    поток каждые `interval_seconds` снимает его стек.
+
+    Стеки считаются по окнам `window_seconds`, хранятся последние
+    `windows_count` окон (память ограничена).
+
+    Накладные расходы ограничены: если снятие стека занимает больше
+    `max_overhead` от интервала (стек глубокий, поток GIL занят),
+    интервал увеличивается
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        window_seconds: float,
+        windows_count: int,
+        max_overhead: float = 0.01,
+        on_sample: SampleListener | None = None,
+    ):
+        self._interval_seconds = interval_seconds
+        self._window_seconds = window_seconds
+        self._max_overhead = max_overhead
+        self._on_sample = on_sample
+
+        self._windows: deque[Counter[Stack]] = deque(maxlen=windows_count)
+        # окна читаются из потока цикла событий
+        self._lock = threading.Lock()
+        self._loop_thread_id = 0
+        self._is_stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.samples_count = 0
+        # время снятия стеков и работы профилировщика (сек)
+        self.sampling_seconds = 0.0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def overhead(self) -> float:
+        """
+        Доля времени, затраченная на снятие стеков
+        """
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.sampling_seconds / self.elapsed_seconds
+
+    def start(self) -> None:
+        """
+        Запускает профилирование (вызывается в потоке цикла событий)
+        """
+        self._is_stopped.clear()
+        self._loop_thread_id = threading.get_ident()
+        self._thread = threading.Thread(
+            target=self._run, name='continuous-profiler', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._is_stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_stacks(self, windows_count: int | None = None) -> Counter[Stack]:
+        """
+        Количество сэмплов по стекам за последние `windows_count` окон
+        (по умолчанию - за все хранимые)
+        """
+        with self._lock:
+            windows = list(self._windows)
+            if windows_count is not None:
+                windows = windows[-windows_count:]
+            stacks: Counter[Stack] = Counter()
+            for window in windows:
+                stacks.update(window)
+        return stacks
+
+    def _run(self) -> None:
+        started_at = time.perf_counter()
+        window_ends_at = started_at
+        window: Counter[Stack] = Counter()
+        delay = self._interval_seconds
+
+        while not self._is_stopped.wait(delay):
+            sampled_at = time.perf_counter()
+            stack = get_thread_stack(
+                sys._current_frames().get(self._loop_thread_id)
+            )
+            with self._lock:
+                if sampled_at >= window_ends_at:
+                    window = Counter()
+                    self._windows.append(window)
+                    window_ends_at = sampled_at + self._window_seconds
+                window[stack] += 1
+
+            sampling_seconds = time.perf_counter() - sampled_at
+            self.samples_count += 1
+            self.sampling_seconds += sampling_seconds
+            self.elapsed_seconds = time.perf_counter() - started_at
+            if self._on_sample is not None:
+                self._on_sample(sampling_seconds)
+
+            delay = max(
+                self._interval_seconds, sampling_seconds / self._max_overhead
+            )
+
+
+def to_folded(stacks: Mapping[Stack, int]) -> str:
+    """
+    Стеки в свёрнутом формате (строка на стек: функции через `;`
+    и количество сэмплов) - для flamegraph.pl, speedscope, Pyroscope
+    """
+    return ''.join(
+        ';'.join(
+            f'{function_name} ({file}:{line})'
+            for function_name, file, line in stack
+        )
+        + f' {count}\n'
+        for stack, count in stacks.items()
+        if stack
+    )
+
+
+def to_speedscope(
+    stacks: dict[Stack, float], name: str, duration: float
+) -> dict[str, Any]:
+    """
+    Профиль в формате speedscope (https://www.speedscope.app)
+    """
+    frame_indexes: dict[FrameKey, int] = {}
+    samples = []
+    weights = []
+    for stack, weight in stacks.items():
+        samples.append(
+            [frame_indexes.setdefault(key, len(frame_indexes)) for key in stack]
+        )
+        weights.append(weight)
+
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'family_apiary',
+        'shared': {
+            'frames': [
+                {'name': function_name, 'file': file, 'line': line}
+                for function_name, file, line in frame_indexes
+            ]
+        },
+        'profiles': [
+            {
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': duration,
+                'samples': samples,
+                'weights': weights,
+            }
+        ],
+    }
@@ -11,6 +11,8 @@ from typing import (
     TypeVar,
 )
 
+from commons.tracing import tracer
+
 T = TypeVar('T')
 P = ParamSpec('P')
 
@@ -40,12 +42,15 @@ class AsyncOperation:
         if calls_count == 0:
             exit_stack = AsyncExitStack()
             self._context_exit_stack.set(exit_stack)
-            try:
-                await exit_stack.__aenter__()
-                for context in self._context_managers:
-                    await exit_stack.enter_async_context(context)
-            except Exception as exc:
-                await exit_stack.__aexit__(type(exc), exc, exc.__traceback__)
+            with tracer.start_span('operation.enter'):
+                try:
+                    await exit_stack.__aenter__()
+                    for context in self._context_managers:
+                        await exit_stack.enter_async_context(context)
+                except Exception as exc:
+                    await exit_stack.__aexit__(
+                        type(exc), exc, exc.__traceback__
+                    )
 
         self._context_calls.set(calls_count + 1)
 
@@ -62,7 +67,11 @@ class AsyncOperation:
             return False
 
         exit_stack = self._context_exit_stack.get()
-        await exit_stack.__aexit__(exc_type, exc_val, traceback)
+        # выход из контекстных менеджеров - commit (или rollback)
+        with tracer.start_span(
+            'operation.exit', attributes={'operation.failed': bool(exc_type)}
+        ):
+            await exit_stack.__aexit__(exc_type, exc_val, traceback)
 
         return None
 
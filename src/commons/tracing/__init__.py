@@ -0,0 +1,10 @@
+from .exporters import (
+    BatchSpanProcessor,
+    InMemorySpanExporter,
+    JsonLinesFileSpanExporter,
+    OtlpHttpSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+)
+from .sqlalchemy import trace_engine
+from .tracer import Span, SpanContext, SpanKind, SpanProcessor, Tracer, tracer
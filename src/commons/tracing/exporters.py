@@ -0,0 +1,245 @@
+import json
+import logging
+import queue
+import threading
+import time
+import urllib.request
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Protocol, Sequence
+
+from .tracer import Span, SpanProcessor
+
+logger = logging.getLogger('tracing')
+
+
+class SpanExporter(Protocol):
+    """
+    Отправляет завершённые спаны во внешнюю систему
+    """
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None: ...
+
+    def shutdown(self) -> None:
+        return None
+
+
+class InMemorySpanExporter(SpanExporter):
+    """
+    Хранит спаны в памяти (для тестов и бенчмарков)
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+def span_to_dict(span: Span) -> dict[str, Any]:
+    return {
+        'trace_id': span.context.trace_id,
+        'span_id': span.context.span_id,
+        'parent_span_id': span.parent_span_id,
+        'name': span.name,
+        'kind': span.kind.name,
+        'start_time_ns': span.start_time_ns,
+        'end_time_ns': span.end_time_ns,
+        'attributes': span.attributes,
+        'error': span.error,
+    }
+
+
+class JsonLinesFileSpanExporter(SpanExporter):
+    """
+    Дописывает спаны в файл (JSON на строку)
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._path.open('a', encoding='utf-8') as file:
+            for span in spans:
+                file.write(
+                    json.dumps(
+                        span_to_dict(span), ensure_ascii=False, default=str
+                    )
+                )
+                file.write('\n')
+
+
+def _to_otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _to_otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {'key': key, 'value': _to_otlp_value(value)}
+        for key, value in attributes.items()
+    ]
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Отправляет спаны коллектору по OTLP/HTTP в JSON кодировке
+    (например, OpenTelemetry Collector: http://localhost:4318/v1/traces)
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        timeout_seconds: float = 10,
+    ):
+        self._endpoint = endpoint
+        self._resource = {
+            'attributes': _to_otlp_attributes({'service.name': service_name})
+        }
+        self._timeout_seconds = timeout_seconds
+
+    def _to_otlp_span(self, span: Span) -> dict[str, Any]:
+        otlp_span = {
+            'traceId': span.context.trace_id,
+            'spanId': span.context.span_id,
+            'name': span.name,
+            'kind': int(span.kind),
+            'startTimeUnixNano': str(span.start_time_ns),
+            'endTimeUnixNano': str(span.end_time_ns),
+            'attributes': _to_otlp_attributes(span.attributes),
+            # 1 - OK, 2 - ERROR
+            'status': (
+                {'code': 2, 'message': span.error}
+                if span.error
+                else {'code': 1}
+            ),
+        }
+        if span.parent_span_id:
+            otlp_span['parentSpanId'] = span.parent_span_id
+        return otlp_span
+
+    def export(self, spans: Sequence[Span]) -> None:
+        body = {
+            'resourceSpans': [
+                {
+                    'resource': self._resource,
+                    'scopeSpans': [
+                        {
+                            'scope': {'name': 'family_apiary'},
+                            'spans': [
+                                self._to_otlp_span(span) for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+        request = urllib.request.Request(
+            self._endpoint,
+            data=json.dumps(body, default=str).encode(),
+            headers={'Content-Type': 'application/json'},
+            method='POST',
+        )
+        with urllib.request.urlopen(request, timeout=self._timeout_seconds):
+            pass
+
+
+class SimpleSpanProcessor(SpanProcessor):
+    """
+    Экспортирует каждый спан сразу при завершении (для тестов)
+    """
+
+    def __init__(self, exporter: SpanExporter):
+        self._exporter = exporter
+
+    def on_end(self, span: Span) -> None:
+        self._exporter.export([span])
+
+    def shutdown(self) -> None:
+        self._exporter.shutdown()
+
+
+class BatchSpanProcessor(SpanProcessor):
+    """
+    Экспортирует спаны пачками в фоновом потоке - запись и отправка
+    не блокируют цикл событий.
+
+    Очередь ограничена: если экспорт не успевает, спаны отбрасываются
+    (счётчик `dropped_count`)
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        schedule_delay_seconds: float = 1,
+    ):
+        self._exporter = exporter
+        self._max_batch_size = max_batch_size
+        self._schedule_delay_seconds = schedule_delay_seconds
+        self._queue: queue.Queue[Span | None] = queue.Queue(max_queue_size)
+        self.dropped_count = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name='span-exporter', daemon=True
+        )
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def shutdown(self) -> None:
+        """
+        Отправляет оставшиеся спаны и останавливает поток
+        """
+        self._queue.put(None)
+        self._thread.join()
+        self._exporter.shutdown()
+
+    def _export(self, batch: list[Span]) -> None:
+        try:
+            self._exporter.export(batch)
+        except Exception:
+            logger.exception('Failed to export %s spans', len(batch))
+
+    def _run(self) -> None:
+        batch: list[Span] = []
+        export_at = time.monotonic() + self._schedule_delay_seconds
+        while True:
+            try:
+                span = self._queue.get(
+                    timeout=max(export_at - time.monotonic(), 0)
+                )
+            except queue.Empty:
+                pass
+            else:
+                if span is None:
+                    if batch:
+                        self._export(batch)
+                    return
+                batch.append(span)
+
+            # пачка отправляется, когда заполнена или прошла задержка
+            now = time.monotonic()
+            if len(batch) >= self._max_batch_size or now >= export_at:
+                if batch:
+                    self._export(batch)
+                    batch = []
+                export_at = now + self._schedule_delay_seconds
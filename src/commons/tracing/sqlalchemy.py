@@ -0,0 +1,55 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .tracer import SpanKind, Tracer
+
+# длина текста запроса в атрибуте спана
+STATEMENT_MAX_LENGTH = 2000
+
+
+def trace_engine(engine: AsyncEngine, tracer: Tracer) -> None:
+    """
+    Создаёт спан на каждый запрос к БД (текст запроса без параметров)
+    """
+    sync_engine = engine.sync_engine
+    db_system = sync_engine.dialect.name
+
+    def on_before_execute(
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        span = tracer.create_span(
+            'db.query',
+            attributes={
+                'db.system': db_system,
+                'db.statement': statement[:STATEMENT_MAX_LENGTH],
+            },
+            kind=SpanKind.CLIENT,
+        )
+        if span is not None:
+            connection.info.setdefault('query_spans', []).append(span)
+
+    def on_after_execute(connection: Connection, *args: Any, **_: Any) -> None:
+        spans = connection.info.get('query_spans')
+        if spans:
+            tracer.end_span(spans.pop())
+
+    def on_error(exception_context: Any) -> None:
+        connection: Connection | None = exception_context.connection
+        if connection is None or exception_context.execution_context is None:
+            return
+        spans = connection.info.get('query_spans')
+        if spans:
+            span = spans.pop()
+            span.record_exception(exception_context.original_exception)
+            tracer.end_span(span)
+
+    event.listen(sync_engine, 'before_cursor_execute', on_before_execute)
+    event.listen(sync_engine, 'after_cursor_execute', on_after_execute)
+    event.listen(sync_engine, 'handle_error', on_error)
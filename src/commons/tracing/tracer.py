@@ -0,0 +1,215 @@
+import os
+import random
+import time
+from abc import abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Iterator, Protocol
+
+HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+class SpanKind(IntEnum):
+    # значения совпадают с OTLP
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    """
+    Идентификаторы спана (в том числе полученного из другого сервиса)
+    """
+
+    trace_id: str
+    span_id: str
+    is_sampled: bool = True
+
+    def to_traceparent(self) -> str:
+        """
+        Заголовок W3C traceparent
+        """
+        flags = '01' if self.is_sampled else '00'
+        return f'00-{self.trace_id}-{self.span_id}-{flags}'
+
+    @classmethod
+    def from_traceparent(cls, traceparent: str) -> 'SpanContext | None':
+        parts = traceparent.strip().split('-')
+        if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+            return None
+        _, trace_id, span_id, flags = parts
+        if not all(
+            value and set(value) <= HEX_DIGITS
+            for value in (trace_id, span_id, flags)
+        ):
+            return None
+        return cls(
+            trace_id=trace_id,
+            span_id=span_id,
+            is_sampled=bool(int(flags, 16) & 1),
+        )
+
+
+@dataclass(slots=True)
+class Span:
+    """
+    Отрезок выполнения (обработка запроса, SQL запрос, ...)
+    """
+
+    name: str
+    context: SpanContext
+    parent_span_id: str | None = None
+    kind: SpanKind = SpanKind.INTERNAL
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    # текст ошибки, если выполнение завершилось ошибкой
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.error = f'{type(exc).__name__}: {exc}'
+
+    @property
+    def duration(self) -> float | None:
+        """
+        Длительность (сек)
+        """
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000_000
+
+
+class SpanProcessor(Protocol):
+    """
+    Получает завершённые спаны (для экспорта)
+    """
+
+    @abstractmethod
+    def on_end(self, span: Span) -> None: ...
+
+    @abstractmethod
+    def shutdown(self) -> None: ...
+
+
+class Tracer:
+    """
+    Трассировка выполнения.
+
+    Текущий спан хранится в contextvars - вложенные спаны (в том числе
+    в задачах asyncio, созданных внутри спана) получают его родителем.
+    Пока не настроен обработчик спанов (`configure`), трассировка
+    выключена и спаны не создаются
+    """
+
+    def __init__(self) -> None:
+        self._processor: SpanProcessor | None = None
+        self._sample_ratio = 1.0
+        self._context_span: ContextVar[SpanContext | None] = ContextVar(
+            'context_span', default=None
+        )
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._processor is not None
+
+    def configure(
+        self,
+        processor: SpanProcessor | None,
+        sample_ratio: float = 1.0,
+    ) -> None:
+        """
+        :param processor: обработчик завершённых спанов (None - выключить)
+        :param sample_ratio: доля записываемых трасс (решение принимается
+            для корневого спана и наследуется вложенными)
+        """
+        if self._processor is not None:
+            self._processor.shutdown()
+        self._processor = processor
+        self._sample_ratio = sample_ratio
+
+    def shutdown(self) -> None:
+        self.configure(processor=None)
+
+    def get_current_span_context(self) -> SpanContext | None:
+        return self._context_span.get()
+
+    def create_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        parent: SpanContext | None = None,
+    ) -> Span | None:
+        """
+        Создаёт спан, не делая его текущим (для спанов без вложенных,
+        которые начинаются и завершаются в разных обработчиках событий).
+
+        Завершается вызовом `end_span`. None - трассировка выключена
+        или трасса не записывается
+        """
+        if self._processor is None:
+            return None
+
+        parent = parent or self._context_span.get()
+        if parent is None:
+            context = SpanContext(
+                trace_id=os.urandom(16).hex(),
+                span_id=os.urandom(8).hex(),
+                is_sampled=random.random() < self._sample_ratio,
+            )
+        else:
+            context = SpanContext(
+                trace_id=parent.trace_id,
+                span_id=os.urandom(8).hex(),
+                is_sampled=parent.is_sampled,
+            )
+
+        return Span(
+            name=name,
+            context=context,
+            parent_span_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=attributes or {},
+        )
+
+    def end_span(self, span: Span) -> None:
+        span.end_time_ns = time.time_ns()
+        if self._processor is not None and span.context.is_sampled:
+            self._processor.on_end(span)
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        parent: SpanContext | None = None,
+    ) -> Iterator[Span | None]:
+        """
+        Выполняет блок в новом спане (текущем для вложенных).
+        Исключение записывается в спан и пробрасывается дальше
+        """
+        span = self.create_span(name, attributes, kind=kind, parent=parent)
+        if span is None:
+            yield None
+            return
+
+        token = self._context_span.set(span.context)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            self._context_span.reset(token)
+            self.end_span(span)
+
+
+tracer = Tracer()
+"""Трассировщик приложения (настраивается при запуске)"""
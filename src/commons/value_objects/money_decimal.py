@@ -1,8 +1,22 @@
 from decimal import Context, Decimal
-from typing import Any
+from typing import Any, Iterable
 
 from commons.app_errors import AppError
 
+_ZERO = Decimal(0)
+
+
+def _to_decimal(value: Decimal | int | float) -> Decimal:
+    """
+    Значение для арифметики Decimal (float - через строку, без ошибки
+    двоичного представления)
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return Decimal(value)
+
 
 class MoneyValueCannotBeLessThanZero(AppError):
     message_template = 'Money value cannot be less than zero'
@@ -24,27 +38,44 @@ class MoneyDecimal(Decimal):
 
         return decimal_value
 
+    @classmethod
+    def _from_result(cls, result: Decimal | int) -> 'MoneyDecimal':
+        """
+        Создание из результата арифметической операции Decimal.
+
+        Значение уже является числом, поэтому повторно через конструктор
+        MoneyDecimal не проходит - проверяется только знак
+        """
+        if result < _ZERO:
+            raise MoneyValueCannotBeLessThanZero()
+
+        return Decimal.__new__(cls, result)
+
     def __add__(self, other: Any) -> 'MoneyDecimal':
         """Сложение с другим значением"""
-        result = super().__add__(other)
-        return MoneyDecimal(result)
+        return self._from_result(Decimal.__add__(self, other))
+
+    def __radd__(self, other: Any) -> 'MoneyDecimal':
+        """Сложение с другим значением (нужно для sum())"""
+        return self._from_result(Decimal.__radd__(self, other))
 
     def __sub__(self, other: Any) -> 'MoneyDecimal':
         """Вычитание другого значения"""
-        result = super().__sub__(other)
-        return MoneyDecimal(result)
+        return self._from_result(Decimal.__sub__(self, other))
 
     def __mul__(self, other: Any) -> 'MoneyDecimal':
         """Умножение на число"""
-        result = super().__mul__(other)
-        return MoneyDecimal(result)
+        return self._from_result(Decimal.__mul__(self, other))
+
+    def __rmul__(self, other: Any) -> 'MoneyDecimal':
+        """Умножение числа на денежную сумму"""
+        return self._from_result(Decimal.__rmul__(self, other))
 
     def __truediv__(self, other: Any) -> 'MoneyDecimal':
         """Деление на число"""
         if other == 0:
             raise ValueError('Деление на ноль невозможно')
-        result = super().__truediv__(other)
-        return MoneyDecimal(result)
+        return self._from_result(Decimal.__truediv__(self, other))
 
     @classmethod
     def from_int(cls, value: int) -> 'MoneyDecimal':
@@ -60,3 +91,42 @@ class MoneyDecimal(Decimal):
     def zero(cls) -> 'MoneyDecimal':
         """Создание нулевой суммы"""
         return cls('0')
+
+    @classmethod
+    def sum(cls, values: Iterable[Decimal | int | float]) -> 'MoneyDecimal':
+        """
+        Сумма значений за один проход.
+
+        Промежуточные суммы считаются в обычном Decimal,
+        MoneyDecimal создаётся один раз для итогового значения
+        """
+        total = _ZERO
+        for value in values:
+            # Decimal.__add__ напрямую - иначе для MoneyDecimal вызывается
+            # __radd__, создающий MoneyDecimal на каждом шаге
+            total = Decimal.__add__(total, _to_decimal(value))
+        return cls._from_result(total)
+
+    @classmethod
+    def multiply(
+        cls, price: Decimal | int | float, count: int
+    ) -> 'MoneyDecimal':
+        """Стоимость `count` единиц по цене `price`"""
+        return cls._from_result(Decimal.__mul__(_to_decimal(price), count))
+
+    @classmethod
+    def sum_multiplied(
+        cls, items: Iterable[tuple[Decimal | int | float, int]]
+    ) -> 'MoneyDecimal':
+        """
+        Сумма стоимостей позиций (цена, количество) за один проход.
+
+        Стоимости позиций и промежуточные суммы считаются в обычном
+        Decimal, MoneyDecimal создаётся один раз для итогового значения
+        """
+        total = _ZERO
+        for price, count in items:
+            total = Decimal.__add__(
+                total, Decimal.__mul__(_to_decimal(price), count)
+            )
+        return cls._from_result(total)
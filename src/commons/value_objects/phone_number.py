@@ -25,3 +25,14 @@ class PhoneNumber(str):
         regex = r'^(\+)[1-9][0-9\-\(\)\.]{9,18}$'
         if value and not re.search(regex, value, re.I):
             raise PhoneNumberInvalid()
+
+    def to_e164(self) -> 'PhoneNumber':
+        """
+        Приводит номер к формату E.164 ("+" и не больше 15 цифр)
+
+        :raises PhoneNumberInvalid: если цифр больше 15
+        """
+        digits = re.sub(r'\D', '', self)
+        if len(digits) > 15:
+            raise PhoneNumberInvalid()
+        return PhoneNumber(f'+{digits}')
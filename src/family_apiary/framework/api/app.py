@@ -1,4 +1,5 @@
 import logging
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -13,13 +14,30 @@ from commons.api.exception_handlers import app_error_handler
 from commons.app_errors import AppError
 from commons.cqrs.base import CommandMediator, QueryMediator
 from commons.cqrs.impl import CommandMediatorImpl, QueryMediatorImpl
+from commons.monitoring import (
+    ContinuousProfiler,
+    EventLoopLagMonitor,
+    MemoryProfiler,
+    metrics_registry,
+)
 from family_apiary.framework.api.metrics import (
+    DBQueriesMiddleware,
     configure_prometheus_metrics_endpoint,
 )
+from family_apiary.framework.api.profiling import (
+    configure_continuous_profiling_endpoint,
+    configure_memory_profiling_endpoint,
+    configure_request_profiling,
+)
 from family_apiary.framework.api.settings import (
     ApiPrometheusMetricsSettings,
     ApiSettings,
+    ContinuousProfilingSettings,
+    EventLoopMonitorSettings,
+    MemoryProfilingSettings,
+    RequestProfilingSettings,
 )
+from family_apiary.framework.api.tracing import TracingMiddleware
 from family_apiary.products.infrastructure.api_controllers import (
     products_router,
 )
@@ -47,9 +65,52 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     )
     command_mediator.resolve_handlers()
 
+    # метрики упавших воркеров (многопроцессный режим Prometheus)
+    dead_pids = metrics_registry.remove_dead_processes()
+    if dead_pids:
+        logger.info('Removed metrics of dead processes: %s', dead_pids)
+
+    # задержка цикла событий (синхронный код в обработке запросов)
+    event_loop_monitor: EventLoopLagMonitor | None = None
+    event_loop_monitor_settings: EventLoopMonitorSettings = (
+        await app.state.dishka_container.get(EventLoopMonitorSettings)
+    )
+    if event_loop_monitor_settings.EVENT_LOOP_MONITOR_ENABLED:
+        event_loop_monitor = await app.state.dishka_container.get(
+            EventLoopLagMonitor
+        )
+        event_loop_monitor.start()
+
+    # постоянный профилировщик потока цикла событий
+    continuous_profiler: ContinuousProfiler | None = None
+    continuous_profiling_settings: ContinuousProfilingSettings = (
+        await app.state.dishka_container.get(ContinuousProfilingSettings)
+    )
+    if continuous_profiling_settings.CONTINUOUS_PROFILING_ENABLED:
+        continuous_profiler = await app.state.dishka_container.get(
+            ContinuousProfiler
+        )
+        continuous_profiler.start()
+
+    # снимки памяти для поиска утечек
+    memory_profiler: MemoryProfiler | None = None
+    memory_profiling_settings: MemoryProfilingSettings = (
+        await app.state.dishka_container.get(MemoryProfilingSettings)
+    )
+    if memory_profiling_settings.MEMORY_PROFILING_ENABLED:
+        memory_profiler = await app.state.dishka_container.get(MemoryProfiler)
+        memory_profiler.start()
+
     logger.info('Lifespan loaded')
     yield
     logger.info('Lifespan cleaning up...')
+    if event_loop_monitor is not None:
+        await event_loop_monitor.stop()
+    if continuous_profiler is not None:
+        continuous_profiler.stop()
+    if memory_profiler is not None:
+        await memory_profiler.stop()
+    metrics_registry.mark_process_dead(os.getpid())
     await app.state.dishka_container.close()
     logger.info('Lifespan cleaned up')
 
@@ -58,6 +119,9 @@ def create_app(
     api_settings: ApiSettings,
     container: AsyncContainer,
     api_prometheus_metrics_settings: ApiPrometheusMetricsSettings,
+    request_profiling_settings: RequestProfilingSettings,
+    continuous_profiling_settings: ContinuousProfilingSettings,
+    memory_profiling_settings: MemoryProfilingSettings,
 ) -> FastAPI:
     """
     Создаёт инстанс fast api
@@ -73,7 +137,9 @@ def create_app(
                 allow_credentials=True,
                 allow_methods=['*'],
                 allow_headers=['*'],
-            )
+            ),
+            Middleware(TracingMiddleware),
+            Middleware(DBQueriesMiddleware),
         ],
         debug=api_settings.API_DEBUG_MODE,
     )
@@ -92,6 +158,21 @@ def create_app(
         settings=api_prometheus_metrics_settings,
     )
 
+    configure_continuous_profiling_endpoint(
+        app=app,
+        settings=continuous_profiling_settings,
+    )
+
+    configure_memory_profiling_endpoint(
+        app=app,
+        settings=memory_profiling_settings,
+    )
+
+    configure_request_profiling(
+        app=app,
+        settings=request_profiling_settings,
+    )
+
     setup_dishka(container=container, app=app)
 
     return app
@@ -0,0 +1,163 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import HTTPException, Request, Response
+from starlette import status
+
+Watermark = int | datetime | str | None
+"""
+Отметка изменения данных: счётчик версии, максимальный updated_at
+или любая строка, которая меняется при изменении данных
+"""
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Значение Cache-Control для ответов роутера
+    """
+
+    # сколько секунд клиент может не сверять ответ
+    max_age: int = 0
+
+    # ответ можно хранить в общих кэшах (прокси, CDN)
+    public: bool = False
+
+    # сверять ответ перед каждым использованием (по ETag)
+    no_cache: bool = True
+
+    def to_header(self) -> str:
+        directives = ['public' if self.public else 'private']
+        if self.no_cache:
+            directives.append('no-cache')
+        directives.append(f'max-age={self.max_age}')
+        return ', '.join(directives)
+
+
+class NotModified(HTTPException):
+    """
+    Данные не изменились - ответ 304 без тела
+    """
+
+    def __init__(self, headers: dict[str, str]):
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers,
+        )
+
+
+def make_etag(name: str, watermark: Watermark, variant: str = '') -> str:
+    """
+    Сильный ETag по отметке изменения данных.
+
+    Тело ответа не нужно: одинаковые данные (отметка) и параметры
+    запроса (`variant`) дают одинаковый ответ
+    """
+    if isinstance(watermark, datetime):
+        watermark = watermark.isoformat()
+    digest = hashlib.blake2b(
+        f'{name}\0{watermark}\0{variant}'.encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def is_etag_matched(if_none_match: str, etag: str) -> bool:
+    """
+    Слабое сравнение ETag с заголовком If-None-Match (RFC 9110)
+    """
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag = etag.removeprefix('W/')
+    return any(
+        tag.strip().removeprefix('W/') == opaque_tag
+        for tag in if_none_match.split(',')
+    )
+
+
+def _is_not_modified_since(
+    if_modified_since: str, last_modified: datetime
+) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # Last-Modified передаётся с точностью до секунды
+    return last_modified.replace(microsecond=0) <= since
+
+
+class ConditionalGet:
+    """
+    Условные GET запросы (ETag / Last-Modified) для роутера.
+
+    Если клиент уже получил данные с этой отметкой изменения, отвечает
+    304. Иначе добавляет в ответ ETag, Last-Modified (для
+    отметки-времени) и Cache-Control роутера.
+
+    Проверка - вызов `check` в обработчике с отметкой данных, из которых
+    построен ответ (ETag всегда соответствует телу). Чтобы 304 был дешёвым,
+    отметка и данные должны читаться без запросов к БД (снимок в памяти).
+
+    Пример:
+        conditional_get = ConditionalGet(CachePolicy(max_age=10))
+
+        @router.get('/snapshot')
+        async def get_snapshot(request: Request, response: Response):
+            snapshot = await load_snapshot()
+            conditional_get.check(
+                request, response, 'snapshot', snapshot.version
+            )
+            return snapshot
+    """
+
+    def __init__(self, cache_policy: CachePolicy = CachePolicy()):
+        self._cache_policy = cache_policy
+
+    def check(
+        self,
+        request: Request,
+        response: Response,
+        name: str,
+        watermark: Watermark,
+        vary_on_query: bool = True,
+    ) -> None:
+        """
+        Проверяет условный запрос по отметке изменения данных ответа.
+
+        :param name: имя данных (разные маршруты с одной отметкой
+            получают разные ETag)
+        :param watermark: отметка изменения данных, из которых построен
+            ответ
+        :param vary_on_query: ответ зависит от параметров запроса
+        :raises NotModified: клиент уже получил эти данные
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return
+
+        variant = str(request.query_params) if vary_on_query else ''
+        headers = {
+            'ETag': make_etag(name, watermark, variant),
+            'Cache-Control': self._cache_policy.to_header(),
+        }
+        if isinstance(watermark, datetime):
+            headers['Last-Modified'] = format_datetime(
+                watermark.astimezone(UTC), usegmt=True
+            )
+
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            if is_etag_matched(if_none_match, headers['ETag']):
+                raise NotModified(headers)
+        elif isinstance(watermark, datetime):
+            # If-Modified-Since учитывается, только если нет If-None-Match
+            if_modified_since = request.headers.get('if-modified-since')
+            if if_modified_since is not None and _is_not_modified_since(
+                if_modified_since, watermark
+            ):
+                raise NotModified(headers)
+
+        response.headers.update(headers)
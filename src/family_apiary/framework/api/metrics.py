@@ -1,9 +1,87 @@
 import logging
 
-from fastapi import FastAPI
+from dishka import AsyncContainer
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from prometheus_fastapi_instrumentator import Instrumentator
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from family_apiary.framework.api.settings import ApiPrometheusMetricsSettings
+from commons.db.instrumentation import DBRoundTripsCounter
+from commons.monitoring import (
+    ContinuousProfiler,
+    EventLoopLagMonitor,
+    MemoryProfiler,
+    MemoryReport,
+    log_blocking,
+    metrics_registry,
+)
+from family_apiary.framework.api.settings import (
+    ApiPrometheusMetricsSettings,
+    ContinuousProfilingSettings,
+    EventLoopMonitorSettings,
+    MemoryProfilingSettings,
+)
+from family_apiary.framework.database.metrics import (
+    db_duration_per_http_request,
+    db_queries_per_http_request,
+)
+from family_apiary.products.domain.entities import (
+    PurchaseRequest,
+    PurchaseRequestProduct,
+)
+
+event_loop_lag = metrics_registry.histogram(
+    'event_loop_lag_seconds',
+    'Задержка цикла событий (время, занятое синхронным кодом)',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+event_loop_blockings = metrics_registry.counter(
+    'event_loop_blockings',
+    'Блокировки цикла событий дольше порога (в отладочном режиме)',
+)
+
+continuous_profiler_sampling_seconds = metrics_registry.counter(
+    'continuous_profiler_sampling_seconds',
+    'Время, затраченное постоянным профилировщиком на снятие стеков',
+)
+
+memory_traced = metrics_registry.gauge(
+    'memory_traced_bytes',
+    'Память, выделенная с момента включения профилировщика памяти',
+    multiprocess_mode='liveall',
+)
+
+memory_traced_peak = metrics_registry.gauge(
+    'memory_traced_peak_bytes',
+    'Пиковая память с момента включения профилировщика памяти',
+    multiprocess_mode='liveall',
+)
+
+memory_allocation_site = metrics_registry.gauge(
+    'memory_allocation_site_bytes',
+    'Память по местам наибольшего выделения',
+    ['location'],
+    multiprocess_mode='liveall',
+)
+
+memory_allocation_site_growth = metrics_registry.gauge(
+    'memory_allocation_site_growth_bytes',
+    'Рост памяти по местам с предыдущего снимка',
+    ['location'],
+    multiprocess_mode='liveall',
+)
+
+memory_live_objects = metrics_registry.gauge(
+    'memory_live_objects',
+    'Живые объекты отслеживаемых типов',
+    ['type'],
+    multiprocess_mode='liveall',
+)
+
+# объекты, которые не должны накапливаться между запросами
+MEMORY_TRACKED_TYPES = (PurchaseRequest, PurchaseRequestProduct, AsyncSession)
 
 
 def configure_prometheus_metrics_endpoint(
@@ -15,11 +93,130 @@ def configure_prometheus_metrics_endpoint(
     """
     logger = logging.getLogger('configure_metrics_endpoint')
 
-    if settings.PROMETHEUS_METRICS_ENABLED:
-        logger.info('Prometheus metrics enabled')
-        Instrumentator().instrument(app=app).expose(
-            app=app,
-            endpoint=settings.PROMETHEUS_METRICS_ENDPOINT,
-        )
-    else:
+    if not settings.PROMETHEUS_METRICS_ENABLED:
         logger.info('Prometheus metrics disabled')
+        return
+
+    Instrumentator(registry=metrics_registry.registry).instrument(app=app)
+
+    @app.get(settings.PROMETHEUS_METRICS_ENDPOINT, include_in_schema=False)
+    def get_metrics() -> Response:
+        # в многопроцессном режиме - значения всех воркеров
+        registry = metrics_registry.get_collector_registry()
+        return Response(
+            content=generate_latest(registry),
+            media_type=CONTENT_TYPE_LATEST,
+        )
+
+    logger.info(
+        'Prometheus metrics enabled (%s)',
+        'multiprocess' if metrics_registry.is_multiprocess else 'in-process',
+    )
+
+
+class DBQueriesMiddleware:
+    """
+    ASGI middleware: количество запросов к БД и время их выполнения
+    за HTTP запрос (по шаблону пути обработчика)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._round_trips_counter: DBRoundTripsCounter | None = None
+
+    async def _get_round_trips_counter(
+        self, scope: Scope
+    ) -> DBRoundTripsCounter:
+        if self._round_trips_counter is None:
+            container: AsyncContainer = scope['app'].state.dishka_container
+            self._round_trips_counter = await container.get(DBRoundTripsCounter)
+        return self._round_trips_counter
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        round_trips_counter = await self._get_round_trips_counter(scope)
+        with round_trips_counter.track() as round_trips:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # маршрут появляется в scope после выбора обработчика
+                handler = getattr(scope.get('route'), 'path', 'unmatched')
+                db_queries_per_http_request.labels(
+                    scope['method'], handler
+                ).observe(round_trips.queries_count)
+                db_duration_per_http_request.labels(
+                    scope['method'], handler
+                ).observe(round_trips.duration)
+
+
+def create_event_loop_lag_monitor(
+    settings: EventLoopMonitorSettings,
+) -> EventLoopLagMonitor:
+    """
+    Создаёт монитор задержки цикла событий с записью в метрики
+    """
+
+    def on_blocking(blocked_seconds: float, stack: str) -> None:
+        event_loop_blockings.inc()
+        log_blocking(blocked_seconds, stack)
+
+    return EventLoopLagMonitor(
+        interval_seconds=settings.EVENT_LOOP_MONITOR_INTERVAL_SECONDS,
+        on_lag=event_loop_lag.observe,
+        blocking_threshold_seconds=(
+            settings.EVENT_LOOP_MONITOR_BLOCKING_THRESHOLD_SECONDS
+        ),
+        on_blocking=on_blocking,
+    )
+
+
+def create_continuous_profiler(
+    settings: ContinuousProfilingSettings,
+) -> ContinuousProfiler:
+    """
+    Создаёт постоянный профилировщик с записью накладных расходов
+    в метрики
+    """
+    return ContinuousProfiler(
+        interval_seconds=settings.CONTINUOUS_PROFILING_INTERVAL_SECONDS,
+        window_seconds=settings.CONTINUOUS_PROFILING_WINDOW_SECONDS,
+        windows_count=settings.CONTINUOUS_PROFILING_WINDOWS_COUNT,
+        max_overhead=settings.CONTINUOUS_PROFILING_MAX_OVERHEAD,
+        on_sample=continuous_profiler_sampling_seconds.inc,
+    )
+
+
+def record_memory_report(report: MemoryReport) -> None:
+    memory_traced.set(report.traced_size)
+    memory_traced_peak.set(report.traced_peak_size)
+
+    # места меняются от снимка к снимку - старые серии удаляются
+    metrics_registry.clear_gauge(memory_allocation_site)
+    for site in report.top_allocations:
+        memory_allocation_site.labels(site.location).set(site.size)
+    metrics_registry.clear_gauge(memory_allocation_site_growth)
+    for site in report.top_growth:
+        memory_allocation_site_growth.labels(site.location).set(site.size_diff)
+
+    for type_name, count in report.live_objects.items():
+        memory_live_objects.labels(type_name).set(count)
+
+
+def create_memory_profiler(
+    settings: MemoryProfilingSettings,
+) -> MemoryProfiler:
+    """
+    Создаёт профилировщик памяти с записью отчётов в метрики
+    """
+    return MemoryProfiler(
+        interval_seconds=settings.MEMORY_PROFILING_INTERVAL_SECONDS,
+        tracked_types=MEMORY_TRACKED_TYPES,
+        top_count=settings.MEMORY_PROFILING_TOP_COUNT,
+        traceback_frames=settings.MEMORY_PROFILING_TRACEBACK_FRAMES,
+        on_report=record_memory_report,
+    )
@@ -0,0 +1,320 @@
+import asyncio
+import cProfile
+import json
+import logging
+import marshal
+import re
+import threading
+import uuid
+from dataclasses import asdict
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
+from starlette import status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from commons.api.access import (
+    AccessTokenSettings,
+    access_token_guard,
+    is_access_token_valid,
+)
+from commons.monitoring import (
+    ContinuousProfiler,
+    MemoryProfiler,
+    TaskSamplingProfiler,
+    to_folded,
+    to_speedscope,
+)
+from family_apiary.framework.api.settings import (
+    ContinuousProfilingSettings,
+    MemoryProfilingSettings,
+    RequestProfilingSettings,
+)
+
+PROFILES_PATH = '/internal/profiles'
+
+PROFILE_NAME_PATTERN = re.compile(r'^[0-9a-f]{32}\.(speedscope\.json|pstats)$')
+
+
+class ProfilingMode(StrEnum):
+    # сэмплирование задачи запроса, профиль speedscope (по умолчанию)
+    SAMPLING = 'sampling'
+    # cProfile, профиль pstats. Учитывает весь код потока цикла событий,
+    # в том числе других запросов - одновременно не больше одного
+    DETERMINISTIC = 'deterministic'
+
+
+class ProfileStorage:
+    """
+    Профили в локальном каталоге (сохраняются последние `max_profiles`)
+    """
+
+    def __init__(self, directory: Path, max_profiles: int):
+        self._directory = directory
+        self._max_profiles = max_profiles
+
+    def get_path(self, name: str) -> Path | None:
+        if not PROFILE_NAME_PATTERN.match(name):
+            return None
+        path = self._directory / name
+        return path if path.is_file() else None
+
+    def save(self, name: str, data: bytes) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        (self._directory / name).write_bytes(data)
+
+        profiles = sorted(
+            self._directory.iterdir(), key=lambda path: path.stat().st_mtime
+        )
+        for path in profiles[: -self._max_profiles]:
+            path.unlink(missing_ok=True)
+
+
+class RequestProfilingMiddleware:
+    """
+    ASGI middleware: профилирует запрос с заголовком X-Profile-Token
+    (режим - заголовок X-Profile-Mode). Профиль сохраняется локально,
+    его адрес возвращается в заголовке X-Profile-Url.
+
+    Запросы без заголовка выполняются без профилирования
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: RequestProfilingSettings,
+        storage: ProfileStorage,
+    ) -> None:
+        self.app = app
+        self._settings = settings
+        self._storage = storage
+        self._deterministic_lock = threading.Lock()
+        self._logger = logging.getLogger('request_profiling')
+
+    def _is_profiling_requested(self, headers: Headers) -> bool:
+        return is_access_token_valid(
+            headers.get('x-profile-token'),
+            self._settings.REQUEST_PROFILING_TOKEN,
+        )
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not self._is_profiling_requested(headers):
+            await self.app(scope, receive, send)
+            return
+
+        mode = (
+            ProfilingMode.DETERMINISTIC
+            if headers.get('x-profile-mode') == ProfilingMode.DETERMINISTIC
+            # cProfile нельзя запустить дважды в одном потоке
+            and self._deterministic_lock.acquire(blocking=False)
+            else ProfilingMode.SAMPLING
+        )
+        name = f'{uuid.uuid4().hex}.' + (
+            'pstats'
+            if mode == ProfilingMode.DETERMINISTIC
+            else 'speedscope.json'
+        )
+
+        async def send_with_profile_url(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                response_headers = MutableHeaders(scope=message)
+                response_headers['X-Profile-Mode'] = mode
+                response_headers['X-Profile-Url'] = f'{PROFILES_PATH}/{name}'
+            await send(message)
+
+        if mode == ProfilingMode.DETERMINISTIC:
+            try:
+                data = await self._profile_deterministic(
+                    scope, receive, send_with_profile_url
+                )
+            finally:
+                self._deterministic_lock.release()
+        else:
+            data = await self._profile_sampling(
+                scope, receive, send_with_profile_url
+            )
+
+        # запись на диск - не в цикле событий
+        await asyncio.to_thread(self._storage.save, name, data)
+        self._logger.info('Request %s is profiled: %s', scope['path'], name)
+
+    async def _profile_sampling(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> bytes:
+        task = asyncio.current_task()
+        assert task is not None
+        profiler = TaskSamplingProfiler(
+            task=task,
+            interval_seconds=(
+                self._settings.REQUEST_PROFILING_SAMPLING_INTERVAL_SECONDS
+            ),
+        )
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+
+        profile = to_speedscope(
+            profiler.stacks,
+            name=f'{scope["method"]} {scope["path"]}',
+            duration=profiler.duration,
+        )
+        return json.dumps(profile).encode()
+
+    async def _profile_deterministic(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> bytes:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+
+        # формат файла pstats (pstats.Stats, snakeviz)
+        profiler.create_stats()
+        return marshal.dumps(profiler.stats)
+
+
+def create_profiles_router(
+    settings: RequestProfilingSettings,
+    storage: ProfileStorage,
+) -> APIRouter:
+    require_profile_token = access_token_guard(
+        'X-Profile-Token',
+        AccessTokenSettings(TOKEN=settings.REQUEST_PROFILING_TOKEN),
+    )
+    router = APIRouter(
+        prefix=PROFILES_PATH,
+        include_in_schema=False,
+        dependencies=[Depends(require_profile_token)],
+    )
+
+    @router.get('/{name}')
+    async def get_profile(name: str) -> FileResponse:
+        """
+        Профиль запроса (speedscope JSON или pstats)
+        """
+        path = storage.get_path(name)
+        if path is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        return FileResponse(path, filename=name)
+
+    return router
+
+
+def configure_request_profiling(
+    app: FastAPI,
+    settings: RequestProfilingSettings,
+) -> None:
+    """
+    Подключает профилирование отдельных запросов (если задан токен)
+    """
+    logger = logging.getLogger('configure_request_profiling')
+
+    if settings.REQUEST_PROFILING_TOKEN is None:
+        logger.info('Request profiling disabled')
+        return
+
+    storage = ProfileStorage(
+        directory=Path(settings.REQUEST_PROFILING_DIRECTORY),
+        max_profiles=settings.REQUEST_PROFILING_MAX_STORED_PROFILES,
+    )
+    app.add_middleware(
+        RequestProfilingMiddleware,
+        settings=settings,
+        storage=storage,
+    )
+    app.include_router(create_profiles_router(settings, storage))
+    logger.info('Request profiling enabled')
+
+
+def configure_continuous_profiling_endpoint(
+    app: FastAPI,
+    settings: ContinuousProfilingSettings,
+) -> None:
+    """
+    Конфигурирует эндпоинт профиля постоянного профилировщика
+    (рядом с метриками Prometheus, только с токеном)
+    """
+    logger = logging.getLogger('configure_continuous_profiling_endpoint')
+
+    if not settings.CONTINUOUS_PROFILING_ENABLED:
+        logger.info('Continuous profiling disabled')
+        return
+
+    require_profile_token = access_token_guard(
+        'X-Profile-Token',
+        AccessTokenSettings(TOKEN=settings.CONTINUOUS_PROFILING_TOKEN),
+    )
+    router = APIRouter(
+        route_class=DishkaRoute,
+        include_in_schema=False,
+        dependencies=[Depends(require_profile_token)],
+    )
+
+    @router.get(settings.CONTINUOUS_PROFILING_ENDPOINT)
+    async def get_continuous_profile(
+        profiler: FromDishka[ContinuousProfiler],
+        windows: int | None = Query(default=None, ge=1),
+    ) -> PlainTextResponse:
+        """
+        Стеки потока цикла событий в свёрнутом формате (flamegraph)
+        за последние `windows` окон
+        """
+        return PlainTextResponse(to_folded(profiler.get_stacks(windows)))
+
+    app.include_router(router)
+    logger.info('Continuous profiling enabled')
+
+
+def configure_memory_profiling_endpoint(
+    app: FastAPI,
+    settings: MemoryProfilingSettings,
+) -> None:
+    """
+    Конфигурирует эндпоинт отчёта профилировщика памяти (только с
+    токеном)
+    """
+    logger = logging.getLogger('configure_memory_profiling_endpoint')
+
+    if not settings.MEMORY_PROFILING_ENABLED:
+        logger.info('Memory profiling disabled')
+        return
+
+    require_profile_token = access_token_guard(
+        'X-Profile-Token',
+        AccessTokenSettings(TOKEN=settings.MEMORY_PROFILING_TOKEN),
+    )
+    router = APIRouter(
+        route_class=DishkaRoute,
+        include_in_schema=False,
+        dependencies=[Depends(require_profile_token)],
+    )
+
+    @router.get(settings.MEMORY_PROFILING_ENDPOINT)
+    async def get_memory_report(
+        profiler: FromDishka[MemoryProfiler],
+    ) -> dict[str, Any]:
+        """
+        Последний снимок памяти: места наибольшего выделения и роста,
+        живые объекты отслеживаемых типов
+        """
+        report = profiler.last_report or await profiler.take_report()
+        return asdict(report)
+
+    app.include_router(router)
+    logger.info('Memory profiling enabled')
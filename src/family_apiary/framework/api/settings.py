@@ -1,3 +1,5 @@
+import os
+import tempfile
 from typing import Any
 
 from pydantic_settings import BaseSettings
@@ -55,3 +57,51 @@ class ApiSettings(BaseSettings):
 class ApiPrometheusMetricsSettings(BaseSettings):
     PROMETHEUS_METRICS_ENABLED: bool = True
     PROMETHEUS_METRICS_ENDPOINT: str = '/metrics'
+
+
+class EventLoopMonitorSettings(BaseSettings):
+    EVENT_LOOP_MONITOR_ENABLED: bool = True
+    EVENT_LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    # отладка: стек потока цикла событий, если он занят дольше порога
+    # (None - не снимать)
+    EVENT_LOOP_MONITOR_BLOCKING_THRESHOLD_SECONDS: float | None = None
+
+
+class RequestProfilingSettings(BaseSettings):
+    # Токен профилирования запросов (заголовок X-Profile-Token).
+    # Если не задан, профилирование отключено
+    REQUEST_PROFILING_TOKEN: str | None = None
+    REQUEST_PROFILING_DIRECTORY: str = os.path.join(
+        tempfile.gettempdir(), 'family_apiary_profiles'
+    )
+    REQUEST_PROFILING_SAMPLING_INTERVAL_SECONDS: float = 0.001
+    # сохранённых профилей (старые удаляются)
+    REQUEST_PROFILING_MAX_STORED_PROFILES: int = 50
+
+
+class ContinuousProfilingSettings(BaseSettings):
+    CONTINUOUS_PROFILING_ENABLED: bool = True
+    CONTINUOUS_PROFILING_INTERVAL_SECONDS: float = 0.01
+    CONTINUOUS_PROFILING_WINDOW_SECONDS: float = 60
+    # хранимых окон (профиль доступен за последние 15 минут)
+    CONTINUOUS_PROFILING_WINDOWS_COUNT: int = 15
+    # максимальная доля времени на снятие стеков
+    CONTINUOUS_PROFILING_MAX_OVERHEAD: float = 0.01
+    CONTINUOUS_PROFILING_ENDPOINT: str = '/metrics/profile'
+    # Токен эндпоинта профиля (заголовок X-Profile-Token): профиль
+    # раскрывает пути к исходникам и стеки вызовов. Если не задан,
+    # эндпоинт отвечает 403
+    CONTINUOUS_PROFILING_TOKEN: str | None = None
+
+
+class MemoryProfilingSettings(BaseSettings):
+    # tracemalloc замедляет выделение памяти - включается для поиска утечек
+    MEMORY_PROFILING_ENABLED: bool = False
+    MEMORY_PROFILING_INTERVAL_SECONDS: float = 60
+    # мест выделения памяти в отчёте
+    MEMORY_PROFILING_TOP_COUNT: int = 20
+    MEMORY_PROFILING_TRACEBACK_FRAMES: int = 1
+    MEMORY_PROFILING_ENDPOINT: str = '/metrics/memory'
+    # Токен эндпоинта отчёта (заголовок X-Profile-Token): снимок памяти
+    # обходит всю кучу. Если не задан, эндпоинт отвечает 403
+    MEMORY_PROFILING_TOKEN: str | None = None
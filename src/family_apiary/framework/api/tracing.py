@@ -0,0 +1,54 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from commons.tracing import SpanContext, SpanKind, tracer
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware: спан на HTTP запрос (по шаблону пути обработчика).
+
+    Контекст трассы принимается из заголовка W3C `traceparent`
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http' or not tracer.is_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = Headers(scope=scope).get('traceparent')
+        parent = (
+            SpanContext.from_traceparent(traceparent) if traceparent else None
+        )
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        with tracer.start_span(
+            scope['method'],
+            attributes={
+                'http.method': scope['method'],
+                'http.target': scope['path'],
+            },
+            kind=SpanKind.SERVER,
+            parent=parent,
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if span is not None:
+                    # маршрут появляется в scope после выбора обработчика
+                    route = getattr(scope.get('route'), 'path', None)
+                    if route is not None:
+                        span.name = f'{scope["method"]} {route}'
+                        span.set_attribute('http.route', route)
+                    span.set_attribute('http.status_code', status_code)
@@ -1,10 +1,29 @@
-from dishka import AsyncContainer, make_async_container
+from typing import Sequence
+
+from dishka import AsyncContainer, Provider, make_async_container
 
 from family_apiary.framework.api.settings import (
     ApiPrometheusMetricsSettings,
     ApiSettings,
+    ContinuousProfilingSettings,
+    EventLoopMonitorSettings,
+    MemoryProfilingSettings,
 )
 from family_apiary.framework.database.settings import DBSettings
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    CatalogApiSettings,
+    CustomerProfilesApiSettings,
+    PurchaseRequestsExportApiSettings,
+    PurchaseRequestsSearchApiSettings,
+    SalesReportsApiSettings,
+)
+from family_apiary.products.infrastructure.database import (
+    CatalogSnapshotCacheSettings,
+    PurchaseRequestsGroupCommitSettings,
+)
+from family_apiary.products.infrastructure.export import (
+    PurchaseRequestsExportSettings,
+)
 from family_apiary.products.infrastructure.tg_chat_bot import TgChatBotSettings
 
 from .providers import (
@@ -13,7 +32,9 @@ from .providers import (
     DBRepositoriesProvider,
     MapperProvider,
     MediatorProvider,
+    MonitoringProvider,
     OperationsProvider,
+    QueryHandlersProvider,
     TgChatBotProvider,
 )
 
@@ -23,20 +44,50 @@ def create_api_container(
     api_prometheus_metrics_settings: ApiPrometheusMetricsSettings,
     tg_chat_bot_settings: TgChatBotSettings,
     db_settings: DBSettings,
+    purchase_requests_group_commit_settings: PurchaseRequestsGroupCommitSettings,
+    purchase_requests_export_settings: PurchaseRequestsExportSettings,
+    purchase_requests_export_api_settings: PurchaseRequestsExportApiSettings,
+    sales_reports_api_settings: SalesReportsApiSettings,
+    customer_profiles_api_settings: CustomerProfilesApiSettings,
+    purchase_requests_search_api_settings: PurchaseRequestsSearchApiSettings,
+    catalog_api_settings: CatalogApiSettings,
+    catalog_snapshot_cache_settings: CatalogSnapshotCacheSettings,
+    event_loop_monitor_settings: EventLoopMonitorSettings,
+    continuous_profiling_settings: ContinuousProfilingSettings,
+    memory_profiling_settings: MemoryProfilingSettings,
+    override_providers: Sequence[Provider] = (),
 ) -> AsyncContainer:
+    """
+    :param override_providers: провайдеры, заменяющие зависимости
+        (например, Telegram бот на стендах и в бенчмарках)
+    """
     container = make_async_container(
         TgChatBotProvider(),
         CommandHandlersProvider(),
+        QueryHandlersProvider(),
         MediatorProvider(),
         OperationsProvider(),
         DBRepositoriesProvider(),
         MapperProvider(),
         DBProvider(),
+        MonitoringProvider(),
+        *override_providers,
         context={
             ApiSettings: api_settings,
             ApiPrometheusMetricsSettings: api_prometheus_metrics_settings,
             TgChatBotSettings: tg_chat_bot_settings,
             DBSettings: db_settings,
+            PurchaseRequestsGroupCommitSettings: purchase_requests_group_commit_settings,
+            PurchaseRequestsExportSettings: purchase_requests_export_settings,
+            PurchaseRequestsExportApiSettings: purchase_requests_export_api_settings,
+            SalesReportsApiSettings: sales_reports_api_settings,
+            CustomerProfilesApiSettings: customer_profiles_api_settings,
+            PurchaseRequestsSearchApiSettings: purchase_requests_search_api_settings,
+            CatalogApiSettings: catalog_api_settings,
+            CatalogSnapshotCacheSettings: catalog_snapshot_cache_settings,
+            EventLoopMonitorSettings: event_loop_monitor_settings,
+            ContinuousProfilingSettings: continuous_profiling_settings,
+            MemoryProfilingSettings: memory_profiling_settings,
         },
     )
     return container
@@ -4,4 +4,6 @@ from .db import DBProvider
 from .db_repositories import DBRepositoriesProvider
 from .mappers import MapperProvider
 from .mediators import MediatorProvider
+from .monitoring import MonitoringProvider
 from .operations import OperationsProvider
+from .query_handlers import QueryHandlersProvider
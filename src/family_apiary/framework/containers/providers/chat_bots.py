@@ -3,6 +3,7 @@ from typing import AsyncIterable
 from aiogram import Bot
 from dishka import Provider, Scope, from_context, provide
 
+from family_apiary.framework.tracing import TracingBotRequestMiddleware
 from family_apiary.products.application.interfaces import (
     ProductPurchaseRequestNotificator,
 )
@@ -27,6 +28,7 @@ class TgChatBotProvider(Provider):
         tg_bot = Bot(
             token=tg_chat_bot_settings.TOKEN,
         )
+        tg_bot.session.middleware(TracingBotRequestMiddleware())
         async with tg_bot:
             yield tg_bot
 
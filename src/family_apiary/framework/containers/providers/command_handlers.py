@@ -1,13 +1,22 @@
-from dishka import Provider, Scope, provide
+from dishka import Provider, Scope, from_context, provide
 
 from family_apiary.products.application.use_cases.commands import (
     CreatePurchaseRequestHandler,
+    SaveCatalogProductHandler,
+)
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    CatalogApiSettings,
 )
 
 
 class CommandHandlersProvider(Provider):
     scope = Scope.REQUEST
 
+    catalog_api_settings = from_context(
+        provides=CatalogApiSettings, scope=Scope.APP
+    )
+
     create_product_purchase_request_handler = provide(
         CreatePurchaseRequestHandler
     )
+    save_catalog_product_handler = provide(SaveCatalogProductHandler)
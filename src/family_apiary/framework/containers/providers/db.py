@@ -1,6 +1,7 @@
 from dishka import Provider, Scope, from_context, provide
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from commons.db.instrumentation import DBRoundTripsCounter
 from commons.db.sqlalchemy import (
     AsyncReadOnlyTransactionContext,
     AsyncTransactionContext,
@@ -11,6 +12,7 @@ from family_apiary.framework.database.engine import (
     create_db_transaction_context,
 )
 from family_apiary.framework.database.settings import DBSettings
+from family_apiary.products.infrastructure.database import ProductsSession
 
 
 class DBProvider(Provider):
@@ -18,19 +20,27 @@ class DBProvider(Provider):
 
     db_settings = from_context(provides=DBSettings, scope=Scope.APP)
 
+    db_round_trips_counter = provide(DBRoundTripsCounter)
+
     @provide
     def create_db_engine(
         self,
         db_settings: DBSettings,
+        db_round_trips_counter: DBRoundTripsCounter,
     ) -> AsyncEngine:
-        return create_async_engine_from_settings(settings=db_settings)
+        return create_async_engine_from_settings(
+            settings=db_settings,
+            round_trips_counter=db_round_trips_counter,
+        )
 
     @provide
     def create_db_transaction_context(
         self,
         db_engine: AsyncEngine,
     ) -> AsyncTransactionContext:
-        return create_db_transaction_context(db_engine=db_engine)
+        return create_db_transaction_context(
+            db_engine=db_engine, session_class=ProductsSession
+        )
 
     @provide
     def create_db_read_only_transaction_context(
@@ -1,15 +1,157 @@
-from dishka import Provider, Scope, provide
+from typing import AsyncIterable
 
-from family_apiary.products.domain.repositories import PurchaseRequestRepo
+from dishka import Provider, Scope, from_context, provide
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from commons.db.group_commit import AsyncGroupCommitWriter
+from commons.db.sqlalchemy import (
+    AsyncReadOnlyTransactionContext,
+    AsyncTransactionContext,
+)
+from commons.mappers import Mapper
+from family_apiary.products.application.interfaces import (
+    CatalogSnapshotProvider,
+    CustomerProfilesReader,
+    PurchaseRequestsExportReader,
+    PurchaseRequestsSearchReader,
+    SalesRollupsReader,
+)
+from family_apiary.products.domain.entities import PurchaseRequest
+from family_apiary.products.domain.repositories import (
+    CatalogProductRepo,
+    PurchaseRequestRepo,
+)
+from family_apiary.products.infrastructure.database import (
+    CatalogSnapshotCacheSettings,
+    PurchaseRequestsGroupCommitSettings,
+)
+from family_apiary.products.infrastructure.database.group_commit import (
+    create_purchase_requests_group_commit_writer,
+)
+from family_apiary.products.infrastructure.database.readers import (
+    CachedCatalogSnapshotProviderImpl,
+    CustomerProfilesReaderImpl,
+    PostgresPurchaseRequestsSearchReaderImpl,
+    PurchaseRequestsExportReaderImpl,
+    SalesRollupsReaderImpl,
+    SqlitePurchaseRequestsSearchReaderImpl,
+)
+from family_apiary.products.infrastructure.database.repositories.catalog_product_repo import (
+    CatalogProductRepoImpl,
+)
 from family_apiary.products.infrastructure.database.repositories.purchase_request_repo import (
+    GroupCommitPurchaseRequestRepoImpl,
     PurchaseRequestRepoImpl,
 )
+from family_apiary.products.infrastructure.export import (
+    PurchaseRequestsExportSettings,
+)
 
 
 class DBRepositoriesProvider(Provider):
     scope = Scope.REQUEST
 
-    purchase_request_repo = provide(
-        PurchaseRequestRepoImpl,
-        provides=PurchaseRequestRepo,
+    purchase_requests_group_commit_settings = from_context(
+        provides=PurchaseRequestsGroupCommitSettings, scope=Scope.APP
+    )
+    purchase_requests_export_settings = from_context(
+        provides=PurchaseRequestsExportSettings, scope=Scope.APP
     )
+    catalog_snapshot_cache_settings = from_context(
+        provides=CatalogSnapshotCacheSettings, scope=Scope.APP
+    )
+
+    @provide(scope=Scope.APP)
+    async def create_purchase_requests_group_commit_writer(
+        self,
+        db_engine: AsyncEngine,
+        settings: PurchaseRequestsGroupCommitSettings,
+    ) -> AsyncIterable[AsyncGroupCommitWriter[PurchaseRequest] | None]:
+        """
+        Групповая запись заявок (None, если выключена)
+        """
+        if not settings.ENABLED:
+            yield None
+            return
+
+        writer = create_purchase_requests_group_commit_writer(
+            db_engine=db_engine,
+            settings=settings,
+        )
+        yield writer
+        await writer.close()
+
+    @provide
+    def create_purchase_request_repo(
+        self,
+        db_transaction_context: AsyncTransactionContext,
+        group_commit_writer: AsyncGroupCommitWriter[PurchaseRequest] | None,
+    ) -> PurchaseRequestRepo:
+        if group_commit_writer is not None:
+            return GroupCommitPurchaseRequestRepoImpl(
+                writer=group_commit_writer
+            )
+        return PurchaseRequestRepoImpl(db_transaction_context)
+
+    @provide(scope=Scope.APP)
+    def create_purchase_requests_export_reader(
+        self,
+        db_engine: AsyncEngine,
+        mapper: Mapper,
+        settings: PurchaseRequestsExportSettings,
+    ) -> PurchaseRequestsExportReader:
+        return PurchaseRequestsExportReaderImpl(
+            db_engine=db_engine,
+            mapper=mapper,
+            batch_size=settings.BATCH_SIZE,
+        )
+
+    @provide
+    def create_sales_rollups_reader(
+        self,
+        db_read_only_transaction_context: AsyncReadOnlyTransactionContext,
+    ) -> SalesRollupsReader:
+        return SalesRollupsReaderImpl(db_read_only_transaction_context)
+
+    @provide
+    def create_customer_profiles_reader(
+        self,
+        db_read_only_transaction_context: AsyncReadOnlyTransactionContext,
+    ) -> CustomerProfilesReader:
+        return CustomerProfilesReaderImpl(db_read_only_transaction_context)
+
+    @provide
+    def create_purchase_requests_search_reader(
+        self,
+        db_engine: AsyncEngine,
+        db_read_only_transaction_context: AsyncReadOnlyTransactionContext,
+    ) -> PurchaseRequestsSearchReader:
+        if db_engine.dialect.name == 'sqlite':
+            return SqlitePurchaseRequestsSearchReaderImpl(
+                db_read_only_transaction_context
+            )
+        return PostgresPurchaseRequestsSearchReaderImpl(
+            db_read_only_transaction_context
+        )
+
+    @provide(scope=Scope.APP)
+    def create_catalog_snapshot_provider(
+        self,
+        db_engine: AsyncEngine,
+        settings: CatalogSnapshotCacheSettings,
+    ) -> CatalogSnapshotProvider:
+        return CachedCatalogSnapshotProviderImpl(
+            db_engine=db_engine,
+            ttl_seconds=settings.TTL_SECONDS,
+        )
+
+    @provide
+    def create_catalog_product_repo(
+        self,
+        db_transaction_context: AsyncTransactionContext,
+        catalog_snapshot_provider: CatalogSnapshotProvider,
+    ) -> CatalogProductRepo:
+        return CatalogProductRepoImpl(
+            db_transaction_context,
+            catalog_snapshot_provider=catalog_snapshot_provider,
+        )
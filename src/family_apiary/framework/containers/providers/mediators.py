@@ -1,11 +1,61 @@
-from dishka import Provider, Scope, provide
+from dishka import AsyncContainer, Provider, Scope, provide
 
 from commons.cqrs.base import CommandMediator, QueryMediator
-from commons.cqrs.impl import CommandMediatorImpl, QueryMediatorImpl
+from commons.cqrs.impl import (
+    CommandMediatorImpl,
+    QueryMediatorImpl,
+    RequestMiddleware,
+)
+from commons.db.instrumentation import DBRoundTripsCounter
+from commons.operations.operations import AsyncOperation
+from family_apiary.framework.database.metrics import (
+    create_db_round_trips_middleware,
+)
+from family_apiary.framework.database.settings import DBSettings
+from family_apiary.framework.tracing import create_tracing_middleware
 
 
 class MediatorProvider(Provider):
     scope = Scope.APP
 
-    query_mediator = provide(QueryMediatorImpl, provides=QueryMediator)
-    command_mediator = provide(CommandMediatorImpl, provides=CommandMediator)
+    @provide
+    def create_request_middlewares(
+        self,
+        db_round_trips_counter: DBRoundTripsCounter,
+        db_settings: DBSettings,
+    ) -> list[RequestMiddleware]:
+        return [
+            create_tracing_middleware(),
+            create_db_round_trips_middleware(
+                round_trips_counter=db_round_trips_counter,
+                repeated_query_warning_threshold=(
+                    db_settings.DB_REPEATED_QUERY_WARNING_THRESHOLD
+                ),
+            ),
+        ]
+
+    @provide
+    def create_query_mediator(
+        self,
+        container: AsyncContainer,
+        operation: AsyncOperation,
+        middlewares: list[RequestMiddleware],
+    ) -> QueryMediator:
+        return QueryMediatorImpl(
+            container=container,
+            operation=operation,
+            middlewares=middlewares,
+        )
+
+    @provide
+    def create_command_mediator(
+        self,
+        container: AsyncContainer,
+        operation: AsyncOperation,
+        middlewares: list[RequestMiddleware],
+    ) -> CommandMediator:
+        return CommandMediatorImpl(
+            container=container,
+            operation=operation,
+            middlewares=middlewares,
+        )
@@ -0,0 +1,56 @@
+from dishka import Provider, Scope, from_context, provide
+
+from commons.monitoring import (
+    ContinuousProfiler,
+    EventLoopLagMonitor,
+    MemoryProfiler,
+)
+from family_apiary.framework.api.metrics import (
+    create_continuous_profiler,
+    create_event_loop_lag_monitor,
+    create_memory_profiler,
+)
+from family_apiary.framework.api.settings import (
+    ContinuousProfilingSettings,
+    EventLoopMonitorSettings,
+    MemoryProfilingSettings,
+)
+
+
+class MonitoringProvider(Provider):
+    scope = Scope.APP
+
+    event_loop_monitor_settings = from_context(
+        provides=EventLoopMonitorSettings, scope=Scope.APP
+    )
+    continuous_profiling_settings = from_context(
+        provides=ContinuousProfilingSettings, scope=Scope.APP
+    )
+    memory_profiling_settings = from_context(
+        provides=MemoryProfilingSettings, scope=Scope.APP
+    )
+
+    @provide
+    def create_event_loop_lag_monitor(
+        self,
+        event_loop_monitor_settings: EventLoopMonitorSettings,
+    ) -> EventLoopLagMonitor:
+        return create_event_loop_lag_monitor(
+            settings=event_loop_monitor_settings
+        )
+
+    @provide
+    def create_continuous_profiler(
+        self,
+        continuous_profiling_settings: ContinuousProfilingSettings,
+    ) -> ContinuousProfiler:
+        return create_continuous_profiler(
+            settings=continuous_profiling_settings
+        )
+
+    @provide
+    def create_memory_profiler(
+        self,
+        memory_profiling_settings: MemoryProfilingSettings,
+    ) -> MemoryProfiler:
+        return create_memory_profiler(settings=memory_profiling_settings)
@@ -0,0 +1,36 @@
+from dishka import Provider, Scope, from_context, provide
+
+from family_apiary.products.application.use_cases.queries import (
+    GetCatalogHandler,
+    GetCustomerProfileHandler,
+    GetSalesReportHandler,
+    SearchPurchaseRequestsHandler,
+)
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    CustomerProfilesApiSettings,
+    PurchaseRequestsExportApiSettings,
+    PurchaseRequestsSearchApiSettings,
+    SalesReportsApiSettings,
+)
+
+
+class QueryHandlersProvider(Provider):
+    scope = Scope.REQUEST
+
+    sales_reports_api_settings = from_context(
+        provides=SalesReportsApiSettings, scope=Scope.APP
+    )
+    customer_profiles_api_settings = from_context(
+        provides=CustomerProfilesApiSettings, scope=Scope.APP
+    )
+    purchase_requests_search_api_settings = from_context(
+        provides=PurchaseRequestsSearchApiSettings, scope=Scope.APP
+    )
+    purchase_requests_export_api_settings = from_context(
+        provides=PurchaseRequestsExportApiSettings, scope=Scope.APP
+    )
+
+    get_catalog_handler = provide(GetCatalogHandler)
+    get_sales_report_handler = provide(GetSalesReportHandler)
+    get_customer_profile_handler = provide(GetCustomerProfileHandler)
+    search_purchase_requests_handler = provide(SearchPurchaseRequestsHandler)
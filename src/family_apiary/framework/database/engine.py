@@ -1,20 +1,44 @@
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
 
+from commons.db.instrumentation import DBRoundTripsCounter
 from commons.db.sqlalchemy import (
     AsyncReadOnlyTransactionContext,
     AsyncTransactionContext,
 )
+from commons.tracing import trace_engine, tracer
+from family_apiary.framework.database.metrics import (
+    create_db_query_metrics_listener,
+    create_slow_query_log_listener,
+)
 from family_apiary.framework.database.settings import DBSettings
 
 
 def create_async_engine_from_settings(
     settings: DBSettings,
+    round_trips_counter: DBRoundTripsCounter | None = None,
 ) -> AsyncEngine:
-    return create_async_engine(
+    engine = create_async_engine(
         url=settings.DB_URL,
         echo=settings.DB_ECHO,
     )
 
+    trace_engine(engine, tracer)
+
+    if round_trips_counter is not None:
+        round_trips_counter.add_query_listener(
+            create_db_query_metrics_listener()
+        )
+        if settings.DB_SLOW_QUERY_THRESHOLD_SECONDS is not None:
+            round_trips_counter.add_query_listener(
+                create_slow_query_log_listener(
+                    threshold_seconds=settings.DB_SLOW_QUERY_THRESHOLD_SECONDS
+                )
+            )
+        round_trips_counter.attach(engine)
+
+    return engine
+
 
 def create_db_read_only_transaction_context(
     db_engine: AsyncEngine,
@@ -26,5 +50,10 @@ def create_db_read_only_transaction_context(
 
 def create_db_transaction_context(
     db_engine: AsyncEngine,
+    session_class: type[Session] = Session,
 ) -> AsyncTransactionContext:
-    return AsyncTransactionContext(bind=db_engine, expire_on_commit=False)
+    return AsyncTransactionContext(
+        bind=db_engine,
+        expire_on_commit=False,
+        sync_session_class=session_class,
+    )
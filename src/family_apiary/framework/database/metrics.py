@@ -0,0 +1,146 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from commons.cqrs.impl import RequestMiddleware
+from commons.db.instrumentation import DBRoundTripsCounter, QueryListener
+from commons.monitoring import metrics_registry
+
+db_round_trips_per_request = metrics_registry.histogram(
+    'db_round_trips_per_request',
+    'Количество обращений к БД за один запрос медиатора',
+    ['request_type'],
+    buckets=(0, 1, 2, 3, 4, 5, 7, 10, 15, 20, 30, 50, 100),
+)
+
+db_queries_per_request = metrics_registry.histogram(
+    'db_queries_per_request',
+    'Количество запросов к БД за один запрос медиатора',
+    ['request_type'],
+    buckets=(0, 1, 2, 3, 4, 5, 7, 10, 15, 20, 30, 50, 100),
+)
+
+db_duration_per_request = metrics_registry.histogram(
+    'db_duration_per_request_seconds',
+    'Время выполнения запросов к БД за один запрос медиатора',
+    ['request_type'],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+db_query_duration = metrics_registry.histogram(
+    'db_query_duration_seconds',
+    'Время выполнения запроса к БД',
+    ['operation'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+
+db_queries_per_http_request = metrics_registry.histogram(
+    'db_queries_per_http_request',
+    'Количество запросов к БД за один HTTP запрос',
+    ['method', 'handler'],
+    buckets=(0, 1, 2, 3, 4, 5, 7, 10, 15, 20, 30, 50, 100),
+)
+
+db_duration_per_http_request = metrics_registry.histogram(
+    'db_duration_per_http_request_seconds',
+    'Время выполнения запросов к БД за один HTTP запрос',
+    ['method', 'handler'],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+# длина текста запроса в журнале медленных запросов
+LOGGED_STATEMENT_MAX_LENGTH = 2000
+
+
+def get_statement_operation(statement: str) -> str:
+    """
+    Тип запроса (SELECT, INSERT, ...) для меток метрик
+    """
+    operation, _, _ = statement.lstrip().partition(' ')
+    return operation.upper() or 'UNKNOWN'
+
+
+def create_db_query_metrics_listener() -> QueryListener:
+    """
+    Создаёт обработчик запросов, который записывает их длительность
+    в гистограмму по типу запроса
+    """
+
+    def listener(statement: str, duration: float) -> None:
+        db_query_duration.labels(get_statement_operation(statement)).observe(
+            duration
+        )
+
+    return listener
+
+
+def create_slow_query_log_listener(threshold_seconds: float) -> QueryListener:
+    """
+    Создаёт обработчик запросов, который пишет в журнал запросы
+    дольше `threshold_seconds` (без параметров - в них персональные данные)
+    """
+    logger = logging.getLogger('db_slow_queries')
+
+    def listener(statement: str, duration: float) -> None:
+        if duration >= threshold_seconds:
+            logger.warning(
+                'Slow DB query (%.3f s): %s',
+                duration,
+                statement[:LOGGED_STATEMENT_MAX_LENGTH],
+            )
+
+    return listener
+
+
+def create_db_round_trips_middleware(
+    round_trips_counter: DBRoundTripsCounter,
+    repeated_query_warning_threshold: int | None = None,
+) -> RequestMiddleware:
+    """
+    Создаёт middleware медиатора, которая считает обращения к БД
+    и время выполнения запросов за время выполнения запроса
+    (вместе с commit).
+
+    :param repeated_query_warning_threshold: если один и тот же запрос
+        выполнен не меньше стольких раз - предупреждение о N+1
+    """
+    logger = logging.getLogger('db_round_trips')
+
+    @asynccontextmanager
+    async def middleware(request: Any) -> AsyncIterator[None]:
+        request_type = type(request).__name__
+        with round_trips_counter.track(
+            record_statements=repeated_query_warning_threshold is not None
+        ) as round_trips:
+            try:
+                yield
+            finally:
+                db_round_trips_per_request.labels(request_type).observe(
+                    round_trips.count
+                )
+                db_queries_per_request.labels(request_type).observe(
+                    round_trips.queries_count
+                )
+                db_duration_per_request.labels(request_type).observe(
+                    round_trips.duration
+                )
+                logger.debug(
+                    '%s: %s DB round-trips, %s queries, %.3f s',
+                    request_type,
+                    round_trips.count,
+                    round_trips.queries_count,
+                    round_trips.duration,
+                )
+
+                if repeated_query_warning_threshold is not None:
+                    for statement, count in round_trips.get_repeated_statements(
+                        repeated_query_warning_threshold
+                    ):
+                        logger.warning(
+                            '%s: DB query executed %s times (possible N+1): %s',
+                            request_type,
+                            count,
+                            statement[:LOGGED_STATEMENT_MAX_LENGTH],
+                        )
+
+    return middleware
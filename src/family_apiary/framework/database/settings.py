@@ -7,6 +7,12 @@ class DBSettings(BaseSettings):
     DB_URL: str
     DB_ECHO: bool = False
 
+    # запросы дольше порога пишутся в журнал (None - отключено)
+    DB_SLOW_QUERY_THRESHOLD_SECONDS: float | None = 0.5
+    # запрос, выполненный столько раз за один запрос медиатора,
+    # пишется в журнал как возможный N+1 (None - отключено)
+    DB_REPEATED_QUERY_WARNING_THRESHOLD: int | None = 10
+
     LOGGING_LEVEL: str = 'INFO'
 
     @property
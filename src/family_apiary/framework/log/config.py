@@ -12,6 +12,7 @@ def create_config(*configs: dict[str, Any]) -> dict[str, Any]:
 
     for config in configs:
         result_config['formatters'].update(config.get('formatters', {}))
+        result_config['filters'].update(config.get('filters', {}))
         result_config['handlers'].update(config.get('handlers', {}))
         result_config['loggers'].update(config.get('loggers', {}))
 
@@ -0,0 +1,45 @@
+import logging
+import random
+import time
+
+from .handlers import logging_dropped_records
+
+
+class AccessLogSamplingFilter(logging.Filter):
+    """
+    Выборка журнала запросов под нагрузкой: первые
+    `max_records_per_second` записей за секунду пропускаются все,
+    остальные - с вероятностью `sample_ratio`.
+
+    Записи других журналов пропускаются без изменений
+    """
+
+    def __init__(
+        self,
+        logger_names: list[str],
+        max_records_per_second: int,
+        sample_ratio: float,
+    ) -> None:
+        super().__init__()
+        self._logger_names = frozenset(logger_names)
+        self._max_records_per_second = max_records_per_second
+        self._sample_ratio = sample_ratio
+        self._window_started_at = 0.0
+        self._window_records = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.name not in self._logger_names:
+            return True
+
+        now = time.monotonic()
+        if now - self._window_started_at >= 1:
+            self._window_started_at = now
+            self._window_records = 0
+        self._window_records += 1
+
+        if self._window_records <= self._max_records_per_second:
+            return True
+        if random.random() < self._sample_ratio:
+            return True
+        logging_dropped_records.labels('sampled').inc()
+        return False
@@ -0,0 +1,77 @@
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from commons.monitoring import metrics_registry
+
+logging_dropped_records = metrics_registry.counter(
+    'logging_dropped_records',
+    'Записи журнала, не попавшие в вывод',
+    ['reason'],
+)
+
+
+class BlockingStopQueueListener(QueueListener):
+    """
+    Ждёт места в очереди для сигнала остановки
+    (очередь ограничена и может быть заполнена)
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Передаёт записи журнала в ограниченную очередь. Форматирование
+    и запись выполняет QueueListener в фоновом потоке - медленный вывод
+    (заполненный pipe stdout) не блокирует цикл событий.
+
+    Если очередь заполнена, запись отбрасывается
+    (метрика logging_dropped_records)
+    """
+
+    listener: QueueListener | None
+
+    def __init__(self, queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(queue)
+        self._listener_lock = threading.Lock()
+        self._is_listener_started = False
+
+    def _start_listener(self) -> None:
+        # listener создаётся dictConfig после handler и не запускается
+        with self._listener_lock:
+            if self._is_listener_started or self.listener is None:
+                return
+            self.listener.start()
+            self._is_listener_started = True
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Подставляет аргументы в сообщение (они могут измениться
+        до записи), форматирование остаётся фоновому потоку
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if not self._is_listener_started:
+            self._start_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            logging_dropped_records.labels('queue_full').inc()
+
+    def close(self) -> None:
+        """
+        Дописывает записи из очереди и останавливает фоновый поток
+        """
+        with self._listener_lock:
+            if self._is_listener_started and self.listener is not None:
+                self.listener.stop()
+                self._is_listener_started = False
+        super().close()
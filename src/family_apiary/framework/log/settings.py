@@ -7,12 +7,21 @@ class LoggingSettings(BaseSettings):
     LOGGING_LEVEL: str = 'INFO'
     LOGGING_JSON: bool = True
 
+    # форматирование и запись в фоновом потоке через ограниченную очередь
+    LOGGING_QUEUE_ENABLED: bool = False
+    LOGGING_QUEUE_MAX_SIZE: int = 10000
+
+    # выборка журнала запросов: сверх стольких записей в секунду
+    # (None - без выборки) записывается доля LOGGING_ACCESS_LOG_SAMPLE_RATIO
+    LOGGING_ACCESS_LOG_MAX_RECORDS_PER_SECOND: int | None = None
+    LOGGING_ACCESS_LOG_SAMPLE_RATIO: float = 0.1
+
     @property
     def LOGGING_CONFIG(self) -> dict[str, Any]:
         fmt = '%(asctime)s.%(msecs)03d [%(levelname)s]|[%(name)s]: %(message)s'
         datefmt = '%Y-%m-%d %H:%M:%S'
 
-        config = {
+        config: dict[str, Any] = {
             'version': 1,
             'disable_existing_loggers': True,
             'formatters': {
@@ -27,6 +36,7 @@ class LoggingSettings(BaseSettings):
                     'class': 'pythonjsonlogger.jsonlogger.JsonFormatter',
                 },
             },
+            'filters': {},
             'handlers': {
                 'default': {
                     'level': self.LOGGING_LEVEL,
@@ -44,4 +54,32 @@ class LoggingSettings(BaseSettings):
             },
         }
 
+        if self.LOGGING_QUEUE_ENABLED:
+            # логеры пишут в очередь, вывод - в фоновом потоке
+            config['handlers']['stdout'] = config['handlers']['default']
+            config['handlers']['default'] = {
+                'class': 'family_apiary.framework.log.handlers'
+                '.BoundedQueueHandler',
+                'queue': {
+                    '()': 'queue.Queue',
+                    'maxsize': self.LOGGING_QUEUE_MAX_SIZE,
+                },
+                'listener': 'family_apiary.framework.log.handlers'
+                '.BlockingStopQueueListener',
+                'handlers': ['stdout'],
+                'respect_handler_level': True,
+            }
+
+        if self.LOGGING_ACCESS_LOG_MAX_RECORDS_PER_SECOND is not None:
+            config['filters']['access_log_sampling'] = {
+                '()': 'family_apiary.framework.log.filters'
+                '.AccessLogSamplingFilter',
+                'logger_names': ['uvicorn.access', 'gunicorn.access'],
+                'max_records_per_second': (
+                    self.LOGGING_ACCESS_LOG_MAX_RECORDS_PER_SECOND
+                ),
+                'sample_ratio': self.LOGGING_ACCESS_LOG_SAMPLE_RATIO,
+            }
+            config['handlers']['default']['filters'] = ['access_log_sampling']
+
         return config
@@ -0,0 +1,11 @@
+from .config import configure
+from .middlewares import TracingBotRequestMiddleware, create_tracing_middleware
+from .settings import TracingExporter, TracingSettings
+
+__all__ = (
+    'configure',
+    'create_tracing_middleware',
+    'TracingBotRequestMiddleware',
+    'TracingExporter',
+    'TracingSettings',
+)
@@ -0,0 +1,51 @@
+import logging
+from pathlib import Path
+
+from commons.tracing import (
+    BatchSpanProcessor,
+    InMemorySpanExporter,
+    JsonLinesFileSpanExporter,
+    OtlpHttpSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+    tracer,
+)
+
+from .settings import TracingExporter, TracingSettings
+
+
+def create_span_exporter(settings: TracingSettings) -> SpanExporter:
+    match settings.TRACING_EXPORTER:
+        case TracingExporter.OTLP:
+            return OtlpHttpSpanExporter(
+                endpoint=settings.TRACING_OTLP_ENDPOINT,
+                service_name=settings.TRACING_SERVICE_NAME,
+            )
+        case TracingExporter.FILE:
+            return JsonLinesFileSpanExporter(
+                path=Path(settings.TRACING_FILE_PATH)
+            )
+        case TracingExporter.MEMORY:
+            return InMemorySpanExporter()
+
+
+def configure(settings: TracingSettings) -> None:
+    """
+    Включает трассировку приложения (если включена в настройках)
+    """
+    logger = logging.getLogger('configure_tracing')
+
+    if not settings.TRACING_ENABLED:
+        logger.info('Tracing disabled')
+        return
+
+    exporter = create_span_exporter(settings)
+    tracer.configure(
+        processor=(
+            SimpleSpanProcessor(exporter)
+            if isinstance(exporter, InMemorySpanExporter)
+            else BatchSpanProcessor(exporter)
+        ),
+        sample_ratio=settings.TRACING_SAMPLE_RATIO,
+    )
+    logger.info('Tracing enabled (%s)', settings.TRACING_EXPORTER)
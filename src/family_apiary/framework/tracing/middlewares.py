@@ -0,0 +1,52 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from commons.cqrs.impl import RequestMiddleware
+from commons.tracing import SpanKind, tracer
+
+
+def create_tracing_middleware() -> RequestMiddleware:
+    """
+    Создаёт middleware медиатора, которая выполняет запрос
+    (вместе с операцией) в отдельном спане
+    """
+
+    @asynccontextmanager
+    async def middleware(request: Any) -> AsyncIterator[None]:
+        with tracer.start_span(
+            f'mediator {type(request).__name__}',
+            attributes={'mediator.request_type': type(request).__name__},
+        ):
+            yield
+
+    return middleware
+
+
+class TracingBotRequestMiddleware(BaseRequestMiddleware):
+    """
+    Middleware сессии aiogram: спан на каждый запрос к Telegram Bot API
+    """
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not tracer.is_enabled:
+            return await make_request(bot, method)
+
+        with tracer.start_span(
+            f'telegram {method.__api_method__}',
+            attributes={'telegram.method': method.__api_method__},
+            kind=SpanKind.CLIENT,
+        ):
+            return await make_request(bot, method)
@@ -0,0 +1,22 @@
+from enum import StrEnum
+
+from pydantic_settings import BaseSettings
+
+
+class TracingExporter(StrEnum):
+    # коллектор OpenTelemetry (OTLP/HTTP, JSON)
+    OTLP = 'otlp'
+    # файл, JSON на строку
+    FILE = 'file'
+    # в памяти процесса (тесты, бенчмарки)
+    MEMORY = 'memory'
+
+
+class TracingSettings(BaseSettings):
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: TracingExporter = TracingExporter.OTLP
+    TRACING_OTLP_ENDPOINT: str = 'http://localhost:4318/v1/traces'
+    TRACING_FILE_PATH: str = 'traces.jsonl'
+    TRACING_SERVICE_NAME: str = 'family_apiary'
+    # доля записываемых трасс
+    TRACING_SAMPLE_RATIO: float = 1.0
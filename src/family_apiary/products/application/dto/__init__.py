@@ -1,4 +1,12 @@
+from .catalog import CatalogSnapshot, CatalogSnapshotProduct
+from .customer_profiles import CustomerProfile
 from .product_purchase_request_notifications import (
     NewPurchaseRequestNotification,
     NewPurchaseRequestNotificationProduct,
 )
+from .purchase_requests_export import PurchaseRequestExportRow
+from .purchase_requests_search import (
+    PurchaseRequestSearchHit,
+    PurchaseRequestsSearchCursor,
+)
+from .sales_reports import SalesReportPeriod, SalesReportRow
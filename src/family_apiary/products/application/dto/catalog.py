@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+
+from commons.entities.base import EntityId
+
+
+@dataclass(frozen=True)
+class CatalogSnapshotProduct:
+    """
+    Продукт в снимке каталога
+    """
+
+    id: EntityId
+    name: str
+    description: str
+    category: str
+    price: float
+    is_available: bool
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    Снимок каталога продукции (неизменяемый, общий для всех запросов)
+    """
+
+    # версия каталога, с которой прочитан снимок
+    version: int
+    products: list[CatalogSnapshotProduct]
+
+    _products_by_id: dict[EntityId, CatalogSnapshotProduct] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            '_products_by_id',
+            {product.id: product for product in self.products},
+        )
+
+    def get_product(
+        self, product_id: EntityId
+    ) -> CatalogSnapshotProduct | None:
+        return self._products_by_id.get(product_id)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from commons.value_objects import PhoneNumber
+
+
+@dataclass
+class CustomerProfile:
+    """
+    Итоги заявок покупателя
+    """
+
+    phone_number: PhoneNumber
+    orders_count: int
+    lifetime_value: float
+    first_order_at: datetime
+    last_order_at: datetime
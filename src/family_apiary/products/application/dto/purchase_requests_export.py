@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from commons.entities.base import EntityId
+
+
+@dataclass
+class PurchaseRequestExportRow:
+    """
+    Строка выгрузки заявок на покупку продукции
+    (заявка и один продукт из её корзины)
+    """
+
+    purchase_request_id: EntityId
+    created_at: datetime
+    phone_number: str
+    name: str
+    product_name: str | None
+    product_category: str | None
+    product_description: str | None
+    price: float | None
+    count: int | None
+    total_price: float | None
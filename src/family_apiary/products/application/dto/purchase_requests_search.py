@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from commons.entities.base import EntityId
+
+
+@dataclass(frozen=True)
+class PurchaseRequestsSearchCursor:
+    """
+    Позиция в результатах поиска: последняя заявка предыдущей страницы.
+
+    Результаты упорядочены по (rank, created_at, id) по убыванию
+    """
+
+    rank: float
+    created_at: datetime
+    id: EntityId
+
+
+@dataclass
+class PurchaseRequestSearchHit:
+    """
+    Заявка, найденная поиском
+    """
+
+    id: EntityId
+    created_at: datetime
+    name: str
+    phone_number: str
+    total_price: float
+    items_count: int
+    rank: float
+
+    def to_cursor(self) -> PurchaseRequestsSearchCursor:
+        return PurchaseRequestsSearchCursor(
+            rank=self.rank,
+            created_at=self.created_at,
+            id=self.id,
+        )
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import date
+from enum import StrEnum
+
+
+class SalesReportPeriod(StrEnum):
+    """
+    Период агрегации отчёта о продажах
+    """
+
+    DAY = 'day'
+    MONTH = 'month'
+
+
+@dataclass
+class SalesReportRow:
+    """
+    Продажи продукта за период
+    """
+
+    period_start: date
+    category: str
+    product_name: str
+    revenue: float
+    orders_count: int
+    units_count: int
@@ -1,3 +1,8 @@
+from .catalog_snapshot_provider import CatalogSnapshotProvider
+from .customer_profiles_reader import CustomerProfilesReader
 from .product_purchase_request_notificator import (
     ProductPurchaseRequestNotificator,
 )
+from .purchase_requests_export_reader import PurchaseRequestsExportReader
+from .purchase_requests_search_reader import PurchaseRequestsSearchReader
+from .sales_rollups_reader import SalesRollupsReader
@@ -0,0 +1,24 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from family_apiary.products.application.dto import CatalogSnapshot
+
+
+class CatalogSnapshotProvider(Protocol):
+    """
+    Снимок каталога продукции (кэшируется в памяти процесса)
+    """
+
+    @abstractmethod
+    async def get_snapshot(self) -> CatalogSnapshot:
+        """
+        Возвращает актуальный снимок каталога
+        """
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """
+        Сбрасывает закэшированный снимок (каталог изменился)
+        """
+        ...
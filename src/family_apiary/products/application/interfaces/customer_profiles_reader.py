@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from commons.value_objects import PhoneNumber
+from family_apiary.products.application.dto import CustomerProfile
+
+
+class CustomerProfilesReader(Protocol):
+    """
+    Чтение итогов заявок покупателей
+    """
+
+    @abstractmethod
+    async def get_by_phone_number(
+        self,
+        phone_number: PhoneNumber,
+    ) -> CustomerProfile | None:
+        """
+        Возвращает итоги покупателя по номеру телефона в формате E.164
+        """
+        ...
@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Protocol
+
+from family_apiary.products.application.dto import PurchaseRequestExportRow
+
+
+class PurchaseRequestsExportReader(Protocol):
+    """
+    Чтение заявок на покупку продукции для выгрузки
+    """
+
+    @abstractmethod
+    def stream_batches(
+        self,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[list[PurchaseRequestExportRow]]:
+        """
+        Читает заявки (по строке на продукт) пачками в порядке создания.
+
+        Память не зависит от количества заявок - в памяти только
+        текущая пачка
+        """
+        ...
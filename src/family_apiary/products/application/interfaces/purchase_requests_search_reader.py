@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from family_apiary.products.application.dto import (
+    PurchaseRequestSearchHit,
+    PurchaseRequestsSearchCursor,
+)
+
+
+class PurchaseRequestsSearchReader(Protocol):
+    """
+    Поиск заявок по имени покупателя, части номера телефона
+    и названию продукта
+    """
+
+    @abstractmethod
+    async def search(
+        self,
+        text: str,
+        limit: int,
+        after: PurchaseRequestsSearchCursor | None = None,
+    ) -> list[PurchaseRequestSearchHit]:
+        """
+        Возвращает не больше `limit` заявок после `after`
+        (по убыванию релевантности, затем времени создания)
+        """
+        ...
@@ -0,0 +1,28 @@
+from abc import abstractmethod
+from datetime import date
+from typing import Protocol
+
+from family_apiary.products.application.dto import (
+    SalesReportPeriod,
+    SalesReportRow,
+)
+
+
+class SalesRollupsReader(Protocol):
+    """
+    Чтение предрассчитанных продаж по периодам
+    """
+
+    @abstractmethod
+    async def get_rows(
+        self,
+        period: SalesReportPeriod,
+        date_from: date,
+        date_to: date,
+        category: str | None = None,
+    ) -> list[SalesReportRow]:
+        """
+        Возвращает продажи за периоды, начинающиеся
+        в [date_from, date_to]
+        """
+        ...
@@ -5,3 +5,8 @@ from .create_product_purchase_request import (
     notification_mapper_config,
     purchase_request_mapper_config,
 )
+from .save_catalog_product import (
+    SaveCatalogProductCommand,
+    SaveCatalogProductHandler,
+    SaveCatalogProductResult,
+)
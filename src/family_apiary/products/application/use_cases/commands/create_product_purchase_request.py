@@ -2,17 +2,26 @@ from dataclasses import dataclass, field
 
 from commons.cqrs.base import CommandHandler
 from commons.datetime_utils import now_tz
-from commons.entities.base import create_entity_id
+from commons.entities.base import (
+    EntityId,
+    create_entity_id,
+    create_entity_ids,
+)
 from commons.mappers import Mapper, MapperConfig
 from commons.value_objects import MoneyDecimal, PhoneNumber, PositiveInt
 from family_apiary.products.application.dto import (
+    CatalogSnapshot,
+    CatalogSnapshotProduct,
     NewPurchaseRequestNotification,
     NewPurchaseRequestNotificationProduct,
 )
 from family_apiary.products.application.interfaces import (
+    CatalogSnapshotProvider,
     ProductPurchaseRequestNotificator,
 )
 from family_apiary.products.domain.entities import (
+    CatalogProductNotAvailable,
+    CatalogProductNotFound,
     PurchaseRequest,
     PurchaseRequestProduct,
 )
@@ -21,10 +30,8 @@ from family_apiary.products.domain.repositories import PurchaseRequestRepo
 
 @dataclass
 class CreatePurchaseRequestCommandProduct:
-    name: str
-    description: str
-    category: str
-    price: float
+    # название, описание, категория и цена берутся из каталога
+    product_id: EntityId
     count: PositiveInt
 
 
@@ -41,23 +48,19 @@ class CreatePurchaseRequestCommand:
     )
 
 
+# идентификаторы продуктов создаются пачкой и передаются через extra
 product_mapper_config = MapperConfig(
-    source_type=CreatePurchaseRequestCommandProduct,
+    source_type=CatalogSnapshotProduct,
     target_type=PurchaseRequestProduct,
-    computed_fields={
-        'id': lambda value: create_entity_id(),
-    },
 )
 
+# продукты заявки строятся из каталога и передаются через extra
 purchase_request_mapper_config = MapperConfig(
     source_type=CreatePurchaseRequestCommand,
     target_type=PurchaseRequest,
     computed_fields={
         'id': lambda source: create_entity_id(),
     },
-    nested_mapper_configs=[
-        product_mapper_config,
-    ],
 )
 
 notification_product_mapper_config = MapperConfig(
@@ -84,28 +87,68 @@ class CreatePurchaseRequestHandler(
     CommandHandler[CreatePurchaseRequestCommand, None]
 ):
     """
-    Создание заявки на покупку продукции
+    Создание заявки на покупку продукции.
+
+    Продукты заявки (в том числе цены) берутся из снимка каталога
+    в памяти - без запроса к БД на каждый продукт
     """
 
     def __init__(
         self,
         purchase_request_repo: PurchaseRequestRepo,
+        catalog_snapshot_provider: CatalogSnapshotProvider,
         mapper: Mapper,
         product_purchase_request_notificator: ProductPurchaseRequestNotificator,
     ):
         self._purchase_request_repo = purchase_request_repo
+        self._catalog_snapshot_provider = catalog_snapshot_provider
         self._mapper = mapper
         self._product_purchase_request_notificator = (
             product_purchase_request_notificator
         )
 
+    def _get_catalog_product(
+        self, catalog: CatalogSnapshot, product_id: EntityId
+    ) -> CatalogSnapshotProduct:
+        """
+        :raises CatalogProductNotFound: если продукта нет в каталоге
+        :raises CatalogProductNotAvailable: если продукт снят с продажи
+        """
+        catalog_product = catalog.get_product(product_id)
+        if catalog_product is None:
+            raise CatalogProductNotFound(product_id=str(product_id))
+        if not catalog_product.is_available:
+            raise CatalogProductNotAvailable(product_id=str(product_id))
+        return catalog_product
+
     async def handle(self, command: CreatePurchaseRequestCommand) -> None:
         now = now_tz()
 
+        catalog = await self._catalog_snapshot_provider.get_snapshot()
+        product_ids = create_entity_ids(len(command.products))
+        products: list[PurchaseRequestProduct] = [
+            self._mapper.map(
+                source=self._get_catalog_product(
+                    catalog, command_product.product_id
+                ),
+                mapper_config=product_mapper_config,
+                extra={
+                    'id': product_id,
+                    'count': command_product.count,
+                    'created_at': now,
+                    'updated_at': now,
+                },
+            )
+            for command_product, product_id in zip(
+                command.products, product_ids
+            )
+        ]
+
         purchase_request = self._mapper.map(
             source=command,
             mapper_config=purchase_request_mapper_config,
             extra={
+                'products': products,
                 'created_at': now,
                 'updated_at': now,
             },
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+
+from commons.cqrs.base import CommandHandler
+from commons.datetime_utils import now_tz
+from commons.entities.base import EntityId, create_entity_id
+from family_apiary.products.domain.entities import (
+    CatalogProduct,
+    CatalogProductNotFound,
+)
+from family_apiary.products.domain.repositories import CatalogProductRepo
+
+
+@dataclass
+class SaveCatalogProductCommand:
+    """
+    Команда на добавление или изменение продукта каталога
+    """
+
+    # None - новый продукт
+    id: EntityId | None
+    name: str
+    description: str
+    category: str
+    price: float
+    is_available: bool = True
+
+
+@dataclass
+class SaveCatalogProductResult:
+    id: EntityId
+
+
+class SaveCatalogProductHandler(
+    CommandHandler[SaveCatalogProductCommand, SaveCatalogProductResult]
+):
+    """
+    Добавление или изменение продукта каталога
+    """
+
+    def __init__(self, catalog_product_repo: CatalogProductRepo):
+        self._catalog_product_repo = catalog_product_repo
+
+    async def handle(
+        self, command: SaveCatalogProductCommand
+    ) -> SaveCatalogProductResult:
+        if command.id is None:
+            now = now_tz()
+            product = CatalogProduct(
+                id=create_entity_id(),
+                created_at=now,
+                updated_at=now,
+                name=command.name,
+                description=command.description,
+                category=command.category,
+                price=command.price,
+                is_available=command.is_available,
+            )
+        else:
+            existing_product = await self._catalog_product_repo.get(command.id)
+            if existing_product is None:
+                raise CatalogProductNotFound(product_id=str(command.id))
+
+            product = existing_product
+            product.name = command.name
+            product.description = command.description
+            product.category = command.category
+            product.price = command.price
+            product.is_available = command.is_available
+            product.set_updated_at()
+
+        await self._catalog_product_repo.save(product)
+        return SaveCatalogProductResult(id=product.id)
@@ -0,0 +1,20 @@
+from .get_catalog import (
+    GetCatalogHandler,
+    GetCatalogQuery,
+    GetCatalogResult,
+)
+from .get_customer_profile import (
+    GetCustomerProfileHandler,
+    GetCustomerProfileQuery,
+    GetCustomerProfileResult,
+)
+from .get_sales_report import (
+    GetSalesReportHandler,
+    GetSalesReportQuery,
+    GetSalesReportResult,
+)
+from .search_purchase_requests import (
+    SearchPurchaseRequestsHandler,
+    SearchPurchaseRequestsQuery,
+    SearchPurchaseRequestsResult,
+)
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from commons.cqrs.base import QueryHandler
+from family_apiary.products.application.dto import CatalogSnapshotProduct
+from family_apiary.products.application.interfaces import (
+    CatalogSnapshotProvider,
+)
+
+
+@dataclass
+class GetCatalogQuery:
+    """
+    Запрос витрины: доступные продукты каталога
+    """
+
+    category: str | None = None
+
+
+@dataclass
+class GetCatalogResult:
+    # версия каталога - меняется при любом изменении каталога
+    version: int
+    products: list[CatalogSnapshotProduct]
+
+
+class GetCatalogHandler(QueryHandler[GetCatalogQuery, GetCatalogResult]):
+    """
+    Витрина. Читается из снимка каталога в памяти, без запросов к БД
+    """
+
+    def __init__(self, catalog_snapshot_provider: CatalogSnapshotProvider):
+        self._catalog_snapshot_provider = catalog_snapshot_provider
+
+    async def handle(self, query: GetCatalogQuery) -> GetCatalogResult:
+        snapshot = await self._catalog_snapshot_provider.get_snapshot()
+        products = [
+            product
+            for product in snapshot.products
+            if product.is_available
+            and (query.category is None or product.category == query.category)
+        ]
+        return GetCatalogResult(version=snapshot.version, products=products)
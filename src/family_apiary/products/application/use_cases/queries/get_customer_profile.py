@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from commons.cqrs.base import QueryHandler
+from commons.value_objects import PhoneNumber
+from family_apiary.products.application.dto import CustomerProfile
+from family_apiary.products.application.interfaces import (
+    CustomerProfilesReader,
+)
+
+
+@dataclass
+class GetCustomerProfileQuery:
+    """
+    Запрос итогов заявок покупателя
+    """
+
+    phone_number: PhoneNumber
+
+
+@dataclass
+class GetCustomerProfileResult:
+    profile: CustomerProfile | None
+
+
+class GetCustomerProfileHandler(
+    QueryHandler[GetCustomerProfileQuery, GetCustomerProfileResult]
+):
+    """
+    Итоги заявок покупателя.
+
+    Номер телефона приводится к E.164 - итоги не зависят от того,
+    как номер был записан в заявках
+    """
+
+    def __init__(self, customer_profiles_reader: CustomerProfilesReader):
+        self._customer_profiles_reader = customer_profiles_reader
+
+    async def handle(
+        self, query: GetCustomerProfileQuery
+    ) -> GetCustomerProfileResult:
+        profile = await self._customer_profiles_reader.get_by_phone_number(
+            phone_number=query.phone_number.to_e164(),
+        )
+        return GetCustomerProfileResult(profile=profile)
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+from commons.cqrs.base import QueryHandler
+from family_apiary.products.application.dto import (
+    SalesReportPeriod,
+    SalesReportRow,
+)
+from family_apiary.products.application.interfaces import SalesRollupsReader
+
+
+@dataclass
+class GetSalesReportQuery:
+    """
+    Запрос отчёта о продажах по периодам
+    """
+
+    period: SalesReportPeriod
+    date_from: date
+    date_to: date
+    category: str | None = None
+
+
+@dataclass
+class GetSalesReportResult:
+    rows: list[SalesReportRow] = field(default_factory=list)
+
+
+class GetSalesReportHandler(
+    QueryHandler[GetSalesReportQuery, GetSalesReportResult]
+):
+    """
+    Отчёт о продажах.
+
+    Читаются только предрассчитанные продажи (O(дней), а не O(заявок))
+    """
+
+    def __init__(self, sales_rollups_reader: SalesRollupsReader):
+        self._sales_rollups_reader = sales_rollups_reader
+
+    async def handle(self, query: GetSalesReportQuery) -> GetSalesReportResult:
+        rows = await self._sales_rollups_reader.get_rows(
+            period=query.period,
+            date_from=query.date_from,
+            date_to=query.date_to,
+            category=query.category,
+        )
+        return GetSalesReportResult(rows=rows)
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+
+from commons.cqrs.base import QueryHandler
+from family_apiary.products.application.dto import (
+    PurchaseRequestSearchHit,
+    PurchaseRequestsSearchCursor,
+)
+from family_apiary.products.application.interfaces import (
+    PurchaseRequestsSearchReader,
+)
+
+
+@dataclass
+class SearchPurchaseRequestsQuery:
+    """
+    Запрос поиска заявок
+    """
+
+    text: str
+    limit: int = 20
+    after: PurchaseRequestsSearchCursor | None = None
+
+
+@dataclass
+class SearchPurchaseRequestsResult:
+    hits: list[PurchaseRequestSearchHit] = field(default_factory=list)
+
+    # позиция для следующей страницы (None - страница последняя)
+    next_cursor: PurchaseRequestsSearchCursor | None = None
+
+
+class SearchPurchaseRequestsHandler(
+    QueryHandler[SearchPurchaseRequestsQuery, SearchPurchaseRequestsResult]
+):
+    """
+    Поиск заявок с постраничным выводом по ключу (без OFFSET)
+    """
+
+    def __init__(self, search_reader: PurchaseRequestsSearchReader):
+        self._search_reader = search_reader
+
+    async def handle(
+        self, query: SearchPurchaseRequestsQuery
+    ) -> SearchPurchaseRequestsResult:
+        if not query.text.strip():
+            return SearchPurchaseRequestsResult()
+
+        # лишняя заявка показывает, есть ли следующая страница
+        hits = await self._search_reader.search(
+            text=query.text,
+            limit=query.limit + 1,
+            after=query.after,
+        )
+        if len(hits) <= query.limit:
+            return SearchPurchaseRequestsResult(hits=hits)
+
+        hits = hits[: query.limit]
+        return SearchPurchaseRequestsResult(
+            hits=hits,
+            next_cursor=hits[-1].to_cursor(),
+        )
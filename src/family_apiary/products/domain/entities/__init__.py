@@ -1,2 +1,7 @@
+from .catalog_product import (
+    CatalogProduct,
+    CatalogProductNotAvailable,
+    CatalogProductNotFound,
+)
 from .purchase_request import PurchaseRequest
 from .purchase_request_product import PurchaseRequestProduct
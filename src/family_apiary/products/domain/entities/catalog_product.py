@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from commons.app_errors import AppError
+from commons.entities.base import BaseEntity
+
+
+class CatalogProductNotFound(AppError):
+    message_template = 'Catalog product {product_id} not found'
+
+
+class CatalogProductNotAvailable(AppError):
+    message_template = 'Catalog product {product_id} is not available'
+
+
+@dataclass
+class CatalogProduct(BaseEntity):
+    """
+    Продукт каталога (витрины).
+
+    Цена продукта в заявке берётся из каталога, а не от клиента
+    """
+
+    name: str
+    description: str
+    category: str
+    price: float
+    is_available: bool = True
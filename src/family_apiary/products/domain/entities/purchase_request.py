@@ -21,7 +21,20 @@ class PurchaseRequest(BaseEntity):
     )
 
     def get_total_price(self) -> MoneyDecimal:
-        total_price = MoneyDecimal.zero()
-        for product in self.products:
-            total_price += product.get_total_price()
-        return total_price
+        return MoneyDecimal.sum_multiplied(
+            (product.price, product.count) for product in self.products
+        )
+
+    def get_items_count(self) -> int:
+        """
+        Количество единиц продукции в заявке
+        """
+        return sum(product.count for product in self.products)
+
+    def get_distinct_products_count(self) -> int:
+        """
+        Количество разных продуктов (категория, название) в заявке
+        """
+        return len(
+            {(product.category, product.name) for product in self.products}
+        )
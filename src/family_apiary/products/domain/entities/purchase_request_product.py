@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from decimal import Decimal
 
 from commons.entities.base import BaseEntity
 from commons.value_objects import MoneyDecimal, PositiveInt
@@ -18,4 +17,4 @@ class PurchaseRequestProduct(BaseEntity):
     count: PositiveInt
 
     def get_total_price(self) -> MoneyDecimal:
-        return self.price * self.count
+        return MoneyDecimal.multiply(self.price, self.count)
@@ -1 +1,2 @@
+from .catalog_product_repo import CatalogProductRepo
 from .purchase_request_repo import PurchaseRequestRepo
@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from commons.entities.base import EntityId
+from family_apiary.products.domain.entities import CatalogProduct
+
+
+class CatalogProductRepo(Protocol):
+    @abstractmethod
+    async def get(self, product_id: EntityId) -> CatalogProduct | None: ...
+
+    @abstractmethod
+    async def save(self, product: CatalogProduct) -> None:
+        """
+        Сохраняет новый или изменённый продукт каталога.
+
+        Меняет версию каталога - закэшированные снимки каталога
+        перечитываются
+        """
+        ...
@@ -7,3 +7,10 @@ from family_apiary.products.domain.entities import PurchaseRequest
 class PurchaseRequestRepo(Protocol):
     @abstractmethod
     async def add(self, purchase_request: PurchaseRequest) -> None: ...
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """
+        Сохраняет добавленные заявки в БД до фиксации транзакции
+        """
+        ...
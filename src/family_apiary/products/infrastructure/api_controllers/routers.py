@@ -1,15 +1,36 @@
 from fastapi import APIRouter
 
+from family_apiary.products.infrastructure.api_controllers.v1.catalog import (
+    catalog_router,
+)
+from family_apiary.products.infrastructure.api_controllers.v1.customer_profiles import (
+    customer_profiles_router,
+)
 from family_apiary.products.infrastructure.api_controllers.v1.product_purchase_requests import (
     purchase_requests_router,
 )
+from family_apiary.products.infrastructure.api_controllers.v1.sales_reports import (
+    sales_reports_router,
+)
 
 products_v1_router = APIRouter(prefix='/v1')
 
+products_v1_router.include_router(
+    catalog_router,
+    tags=['Каталог продукции'],
+)
 products_v1_router.include_router(
     purchase_requests_router,
     tags=['Заявки на покупку продукции'],
 )
+products_v1_router.include_router(
+    sales_reports_router,
+    tags=['Отчёты о продажах'],
+)
+products_v1_router.include_router(
+    customer_profiles_router,
+    tags=['Покупатели'],
+)
 
 
 products_router = APIRouter(prefix='/products')
@@ -0,0 +1,34 @@
+from commons.api.access import AccessTokenSettings
+
+# Токены доступа к служебным методам API продукции
+
+
+class PurchaseRequestsExportApiSettings(AccessTokenSettings):
+    # заголовок X-Export-Token
+    class Config:
+        env_prefix = 'PRODUCTS_PURCHASE_REQUESTS_EXPORT_'
+
+
+class SalesReportsApiSettings(AccessTokenSettings):
+    # заголовок X-Reports-Token
+    class Config:
+        env_prefix = 'PRODUCTS_SALES_REPORTS_API_'
+
+
+class CustomerProfilesApiSettings(AccessTokenSettings):
+    # заголовок X-Customers-Token
+    class Config:
+        env_prefix = 'PRODUCTS_CUSTOMER_PROFILES_API_'
+
+
+class PurchaseRequestsSearchApiSettings(AccessTokenSettings):
+    # заголовок X-Search-Token
+    class Config:
+        env_prefix = 'PRODUCTS_PURCHASE_REQUESTS_SEARCH_API_'
+
+
+class CatalogApiSettings(AccessTokenSettings):
+    # заголовок X-Catalog-Token, только изменение каталога
+    # (витрина доступна без токена)
+    class Config:
+        env_prefix = 'PRODUCTS_CATALOG_API_'
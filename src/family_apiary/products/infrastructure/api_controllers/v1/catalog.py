@@ -0,0 +1,135 @@
+from uuid import UUID
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Depends, Request, Response
+from starlette import status
+
+from commons.api.access import access_token_guard
+from commons.cqrs.base import CommandMediator, QueryMediator, require_result
+from commons.entities.base import EntityId
+from family_apiary.framework.api.conditional import (
+    CachePolicy,
+    ConditionalGet,
+)
+from family_apiary.products.application.use_cases.commands import (
+    SaveCatalogProductCommand,
+    SaveCatalogProductResult,
+)
+from family_apiary.products.application.use_cases.queries import (
+    GetCatalogQuery,
+    GetCatalogResult,
+)
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    CatalogApiSettings,
+)
+from family_apiary.products.infrastructure.api_controllers.v1.schemas import (
+    CatalogProductResponse,
+    CatalogResponse,
+    SaveCatalogProduct,
+    SaveCatalogProductResponse,
+)
+
+catalog_router = APIRouter(
+    prefix='/catalog',
+    route_class=DishkaRoute,
+)
+
+require_catalog_token = access_token_guard(
+    'X-Catalog-Token', CatalogApiSettings
+)
+
+catalog_conditional_get = ConditionalGet(
+    # витрина одна для всех покупателей, её можно хранить в общих кэшах,
+    # но каждый раз сверять по ETag
+    cache_policy=CachePolicy(public=True),
+)
+
+
+@catalog_router.get(
+    '/products',
+    responses={status.HTTP_304_NOT_MODIFIED: {}},
+)
+async def get_catalog(
+    request: Request,
+    response: Response,
+    query_mediator: FromDishka[QueryMediator],
+    category: str | None = None,
+) -> CatalogResponse:
+    """
+    Витрина: доступные продукты каталога.
+
+    Ответ содержит ETag (по версии снимка каталога, из которого построен
+    ответ). Если каталог не изменился, на запрос с If-None-Match
+    возвращается 304 без тела
+    """
+    query = GetCatalogQuery(category=category)
+    result = require_result(
+        GetCatalogResult, await query_mediator.send(query=query)
+    )
+
+    # снимок в памяти - проверка после чтения не требует запросов к БД,
+    # а ETag не расходится с телом при смене версии между чтениями
+    catalog_conditional_get.check(
+        request, response, 'catalog_products', result.version
+    )
+    return CatalogResponse(
+        version=result.version,
+        products=[
+            CatalogProductResponse(
+                id=product.id,
+                name=product.name,
+                description=product.description,
+                category=product.category,
+                price=product.price,
+            )
+            for product in result.products
+        ],
+    )
+
+
+async def _save_catalog_product(
+    product_id: EntityId | None,
+    save_catalog_product_model: SaveCatalogProduct,
+    command_mediator: CommandMediator,
+) -> SaveCatalogProductResponse:
+    command = SaveCatalogProductCommand(
+        id=product_id,
+        name=save_catalog_product_model.name,
+        description=save_catalog_product_model.description,
+        category=save_catalog_product_model.category,
+        price=float(save_catalog_product_model.price),
+        is_available=save_catalog_product_model.is_available,
+    )
+    result = require_result(
+        SaveCatalogProductResult, await command_mediator.send(command=command)
+    )
+    return SaveCatalogProductResponse(id=result.id)
+
+
+@catalog_router.post('/products', dependencies=[Depends(require_catalog_token)])
+async def create_catalog_product(
+    save_catalog_product_model: SaveCatalogProduct,
+    command_mediator: FromDishka[CommandMediator],
+) -> SaveCatalogProductResponse:
+    """
+    Добавление продукта в каталог
+    """
+    return await _save_catalog_product(
+        None, save_catalog_product_model, command_mediator
+    )
+
+
+@catalog_router.put(
+    '/products/{product_id}', dependencies=[Depends(require_catalog_token)]
+)
+async def update_catalog_product(
+    product_id: UUID,
+    save_catalog_product_model: SaveCatalogProduct,
+    command_mediator: FromDishka[CommandMediator],
+) -> SaveCatalogProductResponse:
+    """
+    Изменение продукта каталога (в том числе снятие с продажи)
+    """
+    return await _save_catalog_product(
+        EntityId(product_id), save_catalog_product_model, command_mediator
+    )
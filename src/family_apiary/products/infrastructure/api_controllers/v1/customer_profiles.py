@@ -0,0 +1,55 @@
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+
+from commons.api.access import access_token_guard
+from commons.cqrs.base import QueryMediator, require_result
+from commons.value_objects import PhoneNumber
+from family_apiary.products.application.use_cases.queries import (
+    GetCustomerProfileQuery,
+    GetCustomerProfileResult,
+)
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    CustomerProfilesApiSettings,
+)
+from family_apiary.products.infrastructure.api_controllers.v1.schemas import (
+    CustomerProfileResponse,
+)
+
+customer_profiles_router = APIRouter(
+    prefix='/customer_profiles',
+    route_class=DishkaRoute,
+    dependencies=[
+        Depends(
+            access_token_guard('X-Customers-Token', CustomerProfilesApiSettings)
+        )
+    ],
+)
+
+
+@customer_profiles_router.get('')
+async def get_customer_profile(
+    phone_number: str,
+    query_mediator: FromDishka[QueryMediator],
+) -> CustomerProfileResponse:
+    """
+    Количество заявок, их сумма, время первой и последней заявки покупателя
+    """
+    query = GetCustomerProfileQuery(phone_number=PhoneNumber(phone_number))
+    result = require_result(
+        GetCustomerProfileResult, await query_mediator.send(query=query)
+    )
+    if result.profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Customer profile not found',
+        )
+
+    profile = result.profile
+    return CustomerProfileResponse(
+        phone_number=profile.phone_number,
+        orders_count=profile.orders_count,
+        lifetime_value=profile.lifetime_value,
+        first_order_at=profile.first_order_at,
+        last_order_at=profile.last_order_at,
+    )
@@ -1,14 +1,48 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette import status
 
-from commons.cqrs.base import CommandMediator
+from commons.api.access import access_token_guard
+from commons.cqrs.base import (
+    CommandMediator,
+    QueryMediator,
+    require_result,
+)
+from commons.entities.base import EntityId
 from commons.value_objects import MoneyDecimal, PhoneNumber, PositiveInt
+from family_apiary.products.application.dto import (
+    PurchaseRequestsSearchCursor,
+)
+from family_apiary.products.application.interfaces import (
+    PurchaseRequestsExportReader,
+)
 from family_apiary.products.application.use_cases.commands import (
     CreatePurchaseRequestCommand,
     CreatePurchaseRequestCommandProduct,
 )
+from family_apiary.products.application.use_cases.queries import (
+    SearchPurchaseRequestsQuery,
+    SearchPurchaseRequestsResult,
+)
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    PurchaseRequestsExportApiSettings,
+    PurchaseRequestsSearchApiSettings,
+)
 from family_apiary.products.infrastructure.api_controllers.v1.schemas import (
     CreatePurchaseRequest,
+    PurchaseRequestSearchHitResponse,
+    PurchaseRequestsSearchResponse,
+)
+from family_apiary.products.infrastructure.export import (
+    ExportFormat,
+    create_export_encoder,
+    encode_export,
 )
 
 purchase_requests_router = APIRouter(
@@ -16,6 +50,13 @@ purchase_requests_router = APIRouter(
     route_class=DishkaRoute,
 )
 
+require_export_token = access_token_guard(
+    'X-Export-Token', PurchaseRequestsExportApiSettings
+)
+require_search_token = access_token_guard(
+    'X-Search-Token', PurchaseRequestsSearchApiSettings
+)
+
 
 @purchase_requests_router.post('/create')
 async def create_purchase_request(
@@ -27,10 +68,7 @@ async def create_purchase_request(
         name=create_purchase_request_model.name,
         products=[
             CreatePurchaseRequestCommandProduct(
-                name=req_product.name,
-                description=req_product.description,
-                price=req_product.price,  # MoneyDecimal(req_product.price),
-                category=req_product.category,
+                product_id=EntityId(req_product.product_id),
                 count=PositiveInt(req_product.count),
             )
             for req_product in create_purchase_request_model.products
@@ -38,3 +76,98 @@ async def create_purchase_request(
     )
     await command_mediator.send(command=command)
     return None
+
+
+@purchase_requests_router.get(
+    '/export', dependencies=[Depends(require_export_token)]
+)
+async def export_purchase_requests(
+    export_reader: FromDishka[PurchaseRequestsExportReader],
+    format: ExportFormat = ExportFormat.CSV,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> StreamingResponse:
+    """
+    Потоковая выгрузка заявок (строка на каждый продукт заявки)
+    """
+    encoder = create_export_encoder(format)
+    batches = export_reader.stream_batches(
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return StreamingResponse(
+        encode_export(batches, encoder),
+        media_type=encoder.media_type,
+        headers={
+            'Content-Disposition': (
+                'attachment; '
+                f'filename="purchase_requests.{encoder.file_extension}"'
+            ),
+        },
+    )
+
+
+def _encode_search_cursor(cursor: PurchaseRequestsSearchCursor) -> str:
+    data = json.dumps(
+        [cursor.rank, cursor.created_at.isoformat(), str(cursor.id)]
+    )
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def _decode_search_cursor(value: str) -> PurchaseRequestsSearchCursor:
+    try:
+        rank, created_at, id_ = json.loads(base64.urlsafe_b64decode(value))
+        return PurchaseRequestsSearchCursor(
+            rank=float(rank),
+            created_at=datetime.fromisoformat(created_at),
+            id=EntityId(UUID(id_)),
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid cursor',
+        ) from None
+
+
+@purchase_requests_router.get(
+    '/search', dependencies=[Depends(require_search_token)]
+)
+async def search_purchase_requests(
+    q: str,
+    query_mediator: FromDishka[QueryMediator],
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+) -> PurchaseRequestsSearchResponse:
+    """
+    Поиск заявок по имени покупателя, части номера телефона
+    и названию продукта (по убыванию релевантности).
+
+    Следующая страница запрашивается с cursor=next_cursor
+    """
+    query = SearchPurchaseRequestsQuery(
+        text=q,
+        limit=limit,
+        after=_decode_search_cursor(cursor) if cursor else None,
+    )
+    result = require_result(
+        SearchPurchaseRequestsResult, await query_mediator.send(query=query)
+    )
+    return PurchaseRequestsSearchResponse(
+        hits=[
+            PurchaseRequestSearchHitResponse(
+                id=hit.id,
+                created_at=hit.created_at,
+                name=hit.name,
+                phone_number=hit.phone_number,
+                total_price=hit.total_price,
+                items_count=hit.items_count,
+                rank=hit.rank,
+            )
+            for hit in result.hits
+        ],
+        next_cursor=(
+            _encode_search_cursor(result.next_cursor)
+            if result.next_cursor is not None
+            else None
+        ),
+    )
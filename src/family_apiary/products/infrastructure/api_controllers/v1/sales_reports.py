@@ -0,0 +1,45 @@
+from datetime import date
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Depends
+
+from commons.api.access import access_token_guard
+from commons.cqrs.base import QueryMediator, require_result
+from family_apiary.products.application.dto import SalesReportPeriod
+from family_apiary.products.application.use_cases.queries import (
+    GetSalesReportQuery,
+    GetSalesReportResult,
+)
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    SalesReportsApiSettings,
+)
+
+sales_reports_router = APIRouter(
+    prefix='/sales_reports',
+    route_class=DishkaRoute,
+    dependencies=[
+        Depends(access_token_guard('X-Reports-Token', SalesReportsApiSettings))
+    ],
+)
+
+
+@sales_reports_router.get('')
+async def get_sales_report(
+    date_from: date,
+    date_to: date,
+    query_mediator: FromDishka[QueryMediator],
+    period: SalesReportPeriod = SalesReportPeriod.DAY,
+    category: str | None = None,
+) -> GetSalesReportResult:
+    """
+    Выручка, количество заказов и единиц продукции по дням или месяцам
+    """
+    query = GetSalesReportQuery(
+        period=period,
+        date_from=date_from,
+        date_to=date_to,
+        category=category,
+    )
+    return require_result(
+        GetSalesReportResult, await query_mediator.send(query=query)
+    )
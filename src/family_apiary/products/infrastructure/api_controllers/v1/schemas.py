@@ -1,4 +1,6 @@
+from datetime import datetime
 from decimal import Decimal
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -19,17 +21,92 @@ class CreatePurchaseRequest(BaseModel):
 
     class CreatePurchaseRequestProduct(BaseModel):
         """
-        Продукт из заявки на покупку
+        Продукт из заявки на покупку (цена берётся из каталога)
         """
 
-        name: str
-        description: str
-        price: Decimal = Field(
-            ...,
-            ge=1,
-        )
-        category: str
+        product_id: UUID
         count: int = Field(
             ...,
             ge=1,
         )
+
+
+class SaveCatalogProduct(BaseModel):
+    """
+    Добавление или изменение продукта каталога
+    """
+
+    name: str
+    description: str
+    price: Decimal = Field(
+        ...,
+        ge=1,
+    )
+    category: str
+    is_available: bool = True
+
+
+class CatalogProductResponse(BaseModel):
+    """
+    Продукт витрины
+    """
+
+    id: UUID
+    name: str
+    description: str
+    category: str
+    price: float
+
+
+class CatalogResponse(BaseModel):
+    """
+    Витрина: доступные продукты каталога
+    """
+
+    version: int
+    products: list[CatalogProductResponse]
+
+
+class SaveCatalogProductResponse(BaseModel):
+    id: UUID
+
+
+class CustomerProfileResponse(BaseModel):
+    """
+    Итоги заявок покупателя
+    """
+
+    phone_number: str = Field(
+        ...,
+        examples=['+79999999999'],
+    )
+    orders_count: int
+    lifetime_value: float
+    first_order_at: datetime
+    last_order_at: datetime
+
+
+class PurchaseRequestSearchHitResponse(BaseModel):
+    """
+    Заявка, найденная поиском
+    """
+
+    id: UUID
+    created_at: datetime
+    name: str
+    phone_number: str
+    total_price: float
+    items_count: int
+    rank: float
+
+
+class PurchaseRequestsSearchResponse(BaseModel):
+    """
+    Страница результатов поиска заявок
+    """
+
+    hits: list[PurchaseRequestSearchHitResponse]
+
+    # передаётся в cursor для следующей страницы
+    # (None - страница последняя)
+    next_cursor: str | None = None
@@ -1,2 +1,7 @@
-from .mapping import mapper
-from .settings import ProductsAlembicSettings
+from .mapping import ProductsSession, mapper
+from .settings import (
+    CatalogSnapshotCacheSettings,
+    ProductsAlembicSettings,
+    ProductsPartitioningSettings,
+    PurchaseRequestsGroupCommitSettings,
+)
@@ -8,6 +8,12 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from family_apiary.products.infrastructure.database import tables
 from family_apiary.products.infrastructure.database.meta import metadata
+from family_apiary.products.infrastructure.database.partitioning import (
+    is_partition_name,
+)
+from family_apiary.products.infrastructure.database.search import (
+    SQLITE_SEARCH_TABLE_NAME,
+)
 
 app_tables = tables
 
@@ -75,7 +81,13 @@ def include_only_current_schema(
     """
     Проверят, что схема является схемой из metadata.
     Для SQLite пропускает проверку схемы.
+    Секции секционированных таблиц и таблицы поиска SQLite (FTS5)
+    не сравниваются с metadata.
     """
+    if type_ == 'table' and name is not None:
+        if is_partition_name(name) or name.startswith(SQLITE_SEARCH_TABLE_NAME):
+            return False
+
     # Для SQLite пропускаем проверку схемы
     if context.get_bind().dialect.name == 'sqlite':
         return True
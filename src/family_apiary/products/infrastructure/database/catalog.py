@@ -0,0 +1,51 @@
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from commons.datetime_utils import now_tz
+from family_apiary.products.infrastructure.database.tables import (
+    CATALOG_VERSION_ROW_ID,
+    catalog_version_table,
+)
+from family_apiary.products.infrastructure.database.upsert import (
+    create_dialect_insert,
+)
+
+
+async def bump_catalog_version(session: AsyncSession) -> None:
+    """
+    Увеличивает версию каталога (в транзакции изменения каталога).
+
+    Строка версии создаётся, если её нет
+    """
+    statement = create_dialect_insert(
+        session.bind.dialect.name,
+        catalog_version_table,
+        [
+            {
+                'id': CATALOG_VERSION_ROW_ID,
+                'version': 1,
+                'updated_at': now_tz(),
+            },
+        ],
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[catalog_version_table.c.id],
+            set_={
+                'version': catalog_version_table.c.version + 1,
+                'updated_at': statement.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def get_catalog_version(connection: AsyncConnection) -> int:
+    """
+    Текущая версия каталога (0 - каталог ещё не менялся)
+    """
+    version = await connection.scalar(
+        sa.select(catalog_version_table.c.version).where(
+            catalog_version_table.c.id == CATALOG_VERSION_ROW_ID
+        )
+    )
+    return version or 0
@@ -0,0 +1,192 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from commons.datetime_utils import now_tz
+from commons.value_objects import PhoneNumber
+from commons.value_objects.phone_number import PhoneNumberInvalid
+from family_apiary.products.domain.entities import PurchaseRequest
+from family_apiary.products.infrastructure.database.mapping import (
+    get_purchase_request_total_price,
+)
+from family_apiary.products.infrastructure.database.tables import (
+    customer_profiles_table,
+    purchase_requests_table,
+)
+from family_apiary.products.infrastructure.database.upsert import (
+    execute_upserts,
+)
+
+logger = logging.getLogger('CustomerProfiles')
+
+
+@dataclass
+class _CustomerDelta:
+    orders_count: int
+    lifetime_value: float
+    first_order_at: datetime
+    last_order_at: datetime
+
+
+class CustomerProfilesAggregator:
+    """
+    Накапливает изменения итогов покупателей
+    (ключ - номер телефона в формате E.164).
+
+    Заявки с номером, который нельзя привести к E.164, пропускаются
+    """
+
+    def __init__(self) -> None:
+        self.deltas: dict[PhoneNumber, _CustomerDelta] = {}
+        self.skipped_count = 0
+
+    def add_order(
+        self,
+        phone_number: str,
+        created_at: datetime,
+        total_price: float,
+    ) -> None:
+        try:
+            key = PhoneNumber(phone_number).to_e164()
+        except PhoneNumberInvalid:
+            self.skipped_count += 1
+            return
+
+        delta = self.deltas.get(key)
+        if delta is None:
+            self.deltas[key] = _CustomerDelta(
+                orders_count=1,
+                lifetime_value=total_price,
+                first_order_at=created_at,
+                last_order_at=created_at,
+            )
+            return
+
+        delta.orders_count += 1
+        delta.lifetime_value += total_price
+        delta.first_order_at = min(delta.first_order_at, created_at)
+        delta.last_order_at = max(delta.last_order_at, created_at)
+
+    def get_values(self) -> list[dict[str, Any]]:
+        updated_at = now_tz()
+        return [
+            {
+                'phone_number': phone_number,
+                'orders_count': delta.orders_count,
+                'lifetime_value': delta.lifetime_value,
+                'first_order_at': delta.first_order_at,
+                'last_order_at': delta.last_order_at,
+                'updated_at': updated_at,
+            }
+            for phone_number, delta in self.deltas.items()
+        ]
+
+
+def _add_to_existing(statement: Any, table: sa.Table) -> sa.Executable:
+    """
+    Прибавляет заказы к уже существующим итогам покупателя
+    """
+    excluded = statement.excluded
+    upsert: sa.Executable = statement.on_conflict_do_update(
+        index_elements=[table.c.phone_number],
+        set_={
+            'orders_count': table.c.orders_count + excluded.orders_count,
+            'lifetime_value': table.c.lifetime_value + excluded.lifetime_value,
+            'first_order_at': sa.case(
+                (
+                    excluded.first_order_at < table.c.first_order_at,
+                    excluded.first_order_at,
+                ),
+                else_=table.c.first_order_at,
+            ),
+            'last_order_at': sa.case(
+                (
+                    excluded.last_order_at > table.c.last_order_at,
+                    excluded.last_order_at,
+                ),
+                else_=table.c.last_order_at,
+            ),
+            'updated_at': excluded.updated_at,
+        },
+    )
+    return upsert
+
+
+async def _write_aggregated(
+    executor: AsyncSession | AsyncConnection,
+    dialect_name: str,
+    aggregator: CustomerProfilesAggregator,
+) -> None:
+    if aggregator.skipped_count:
+        logger.warning(
+            'Skipped %s purchase requests with invalid phone number',
+            aggregator.skipped_count,
+        )
+
+    await execute_upserts(
+        executor,
+        dialect_name,
+        customer_profiles_table,
+        aggregator.get_values(),
+        on_conflict=_add_to_existing,
+    )
+
+
+async def apply_customer_profiles(
+    session: AsyncSession,
+    purchase_requests: Iterable[PurchaseRequest],
+) -> None:
+    """
+    Добавляет заявки к итогам покупателей
+    в текущей транзакции сессии (многострочным INSERT без чтения итогов)
+    """
+    aggregator = CustomerProfilesAggregator()
+    for purchase_request in purchase_requests:
+        aggregator.add_order(
+            phone_number=purchase_request.phone_number,
+            created_at=purchase_request.created_at,
+            total_price=get_purchase_request_total_price(purchase_request),
+        )
+
+    # заявки сессии не нужны для итогов - они отправятся в БД при commit
+    with session.no_autoflush:
+        await _write_aggregated(
+            session, session.get_bind().dialect.name, aggregator
+        )
+
+
+async def rebuild_customer_profiles(
+    db_engine: AsyncEngine,
+    batch_size: int = 1000,
+) -> None:
+    """
+    Пересчитывает итоги всех покупателей по заявкам.
+
+    Итоги удаляются и считаются заново в одной транзакции. Заявки
+    читаются курсором пачками, продукты заявок не читаются (используется
+    сохранённая сумма заявки). В памяти только итоги покупателей.
+    """
+    requests = purchase_requests_table.c
+    query = sa.select(
+        requests.phone_number,
+        requests.created_at,
+        requests.total_price,
+    ).execution_options(yield_per=batch_size)
+
+    async with db_engine.begin() as connection:
+        await connection.execute(sa.delete(customer_profiles_table))
+
+        aggregator = CustomerProfilesAggregator()
+        result = await connection.stream(query)
+        async for phone_number, created_at, total_price in result:
+            aggregator.add_order(
+                phone_number=phone_number,
+                created_at=created_at,
+                total_price=total_price,
+            )
+
+        await _write_aggregated(connection, connection.dialect.name, aggregator)
@@ -0,0 +1,62 @@
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from commons.db.group_commit import AsyncGroupCommitWriter
+from commons.monitoring import metrics_registry
+from family_apiary.products.domain.entities import PurchaseRequest
+
+from .customer_profiles import apply_customer_profiles
+from .mapping import ProductsSession, set_purchase_request_summary
+from .sales_rollups import apply_sales_rollups
+from .settings import PurchaseRequestsGroupCommitSettings
+
+purchase_requests_group_commit_batch_size = metrics_registry.histogram(
+    'purchase_requests_group_commit_batch_size',
+    'Количество заявок в одной транзакции групповой записи',
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+purchase_requests_group_commit_wait_seconds = metrics_registry.histogram(
+    'purchase_requests_group_commit_wait_seconds',
+    'Время ожидания заявки в очереди групповой записи',
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+
+def _observe_batch(batch_size: int, wait_seconds: list[float]) -> None:
+    purchase_requests_group_commit_batch_size.observe(batch_size)
+    for item_wait_seconds in wait_seconds:
+        purchase_requests_group_commit_wait_seconds.observe(item_wait_seconds)
+
+
+def create_purchase_requests_group_commit_writer(
+    db_engine: AsyncEngine,
+    settings: PurchaseRequestsGroupCommitSettings,
+) -> AsyncGroupCommitWriter[PurchaseRequest]:
+    """
+    Создаёт групповую запись заявок на покупку продукции.
+
+    Пачка заявок сохраняется в отдельной сессии одной транзакцией,
+    строки каждой таблицы вставляются многострочными INSERT.
+    Итоги продаж и итоги покупателей обновляются сразу за всю пачку
+    """
+    create_session = async_sessionmaker(
+        bind=db_engine,
+        expire_on_commit=False,
+        sync_session_class=ProductsSession,
+    )
+
+    async def write_batch(purchase_requests: list[PurchaseRequest]) -> None:
+        for purchase_request in purchase_requests:
+            set_purchase_request_summary(purchase_request)
+
+        async with create_session() as session, session.begin():
+            session.add_all(purchase_requests)
+            await apply_sales_rollups(session, purchase_requests)
+            await apply_customer_profiles(session, purchase_requests)
+
+    return AsyncGroupCommitWriter(
+        write_batch=write_batch,
+        max_batch_size=settings.MAX_BATCH_SIZE,
+        max_wait_seconds=settings.MAX_WAIT_MS / 1000,
+        observer=_observe_batch,
+    )
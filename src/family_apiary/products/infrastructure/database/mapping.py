@@ -1,28 +1,119 @@
-from sqlalchemy.orm import registry, relationship
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, registry, relationship
+from sqlalchemy.orm.attributes import get_attribute, set_attribute
 
 from family_apiary.products.domain.entities import (
+    CatalogProduct,
     PurchaseRequest,
     PurchaseRequestProduct,
 )
 from family_apiary.products.infrastructure.database.tables import (
+    catalog_products_table,
     purchase_request_products_table,
     purchase_requests_table,
 )
 
 mapper = registry()
 
+mapper.map_imperatively(CatalogProduct, catalog_products_table)
+
+# первичный ключ таблиц включает ключ секционирования (created_at),
+# сущности различаются только по id
 mapper.map_imperatively(
     PurchaseRequestProduct,
     purchase_request_products_table,
+    primary_key=[purchase_request_products_table.c.id],
 )
 
 mapper.map_imperatively(
     PurchaseRequest,
     purchase_requests_table,
+    primary_key=[purchase_requests_table.c.id],
     properties={
         'products': relationship(
             'PurchaseRequestProduct',
             cascade='all, delete-orphan',
         ),
+        # итоги по корзине хранятся только в БД, в сущности не нужны
+        '_total_price': purchase_requests_table.c.total_price,
+        '_items_count': purchase_requests_table.c.items_count,
+        '_distinct_products': purchase_requests_table.c.distinct_products,
     },
 )
+
+
+class ProductsSession(Session):
+    """
+    Сессия продукции: при flush пересчитывает итоги по корзине
+    новых и изменённых заявок
+    """
+
+
+def set_purchase_request_summary(purchase_request: PurchaseRequest) -> None:
+    """
+    Вычисляет итоги по корзине заявки (сохраняются в БД вместе с ней)
+    """
+    set_attribute(
+        purchase_request,
+        '_total_price',
+        float(purchase_request.get_total_price()),
+    )
+    set_attribute(
+        purchase_request, '_items_count', purchase_request.get_items_count()
+    )
+    set_attribute(
+        purchase_request,
+        '_distinct_products',
+        purchase_request.get_distinct_products_count(),
+    )
+
+
+def has_purchase_request_summary(purchase_request: PurchaseRequest) -> bool:
+    return get_attribute(purchase_request, '_total_price') is not None
+
+
+def get_purchase_request_total_price(
+    purchase_request: PurchaseRequest,
+) -> float:
+    """
+    Сумма заявки из итогов по корзине (вычисляются, если ещё не вычислены)
+    """
+    if not has_purchase_request_summary(purchase_request):
+        set_purchase_request_summary(purchase_request)
+    total_price: float = get_attribute(purchase_request, '_total_price')
+    return total_price
+
+
+@event.listens_for(ProductsSession, 'before_flush')
+def _update_purchase_request_summaries(
+    session: Session, flush_context: Any, instances: Any
+) -> None:
+    """
+    Вычисляет итоги по корзине у новых заявок (если не вычислены
+    заранее) и пересчитывает у изменённых.
+
+    Изменение продукта пересчитывает итоги его заявки, если заявка
+    загружена в сессию
+    """
+    purchase_requests: dict[int, PurchaseRequest] = {}
+    for instance in session.new:
+        if isinstance(
+            instance, PurchaseRequest
+        ) and not has_purchase_request_summary(instance):
+            purchase_requests[id(instance)] = instance
+
+    for instance in session.dirty:
+        if isinstance(instance, PurchaseRequestProduct):
+            purchase_request_id = getattr(instance, 'purchase_request_id')
+            if purchase_request_id is None:
+                continue
+            instance = session.identity_map.get(
+                session.identity_key(PurchaseRequest, purchase_request_id)
+            )
+        if isinstance(instance, PurchaseRequest):
+            purchase_requests[id(instance)] = instance
+
+    for purchase_request in purchase_requests.values():
+        set_purchase_request_summary(purchase_request)
@@ -0,0 +1,55 @@
+"""Create sales rollups tables
+
+Итоги заполняются при создании заявок. Для уже существующих заявок
+итоги считаются командой `python -m family_apiary.run.products_sales_rollups`
+
+Revision ID: 57c9ea640fe1
+Revises: f1b9d92998f3
+Create Date: 2026-10-19 12:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '57c9ea640fe1'
+down_revision = 'f1b9d92998f3'
+branch_labels = None
+depends_on = None
+
+
+def _create_sales_rollups_table(name: str, comment: str) -> None:
+    op.create_table(
+        name,
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('product_name', sa.String(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.Column('orders_count', sa.INTEGER(), nullable=False),
+        sa.Column('units_count', sa.INTEGER(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            'period_start',
+            'category',
+            'product_name',
+            name=op.f(f'pk_{name}'),
+        ),
+        comment=comment,
+    )
+
+
+def upgrade() -> None:
+    _create_sales_rollups_table(
+        'sales_daily_rollups',
+        comment='Продажи по дням (категория, продукт)',
+    )
+    _create_sales_rollups_table(
+        'sales_monthly_rollups',
+        comment='Продажи по месяцам (категория, продукт)',
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sales_monthly_rollups')
+    op.drop_table('sales_daily_rollups')
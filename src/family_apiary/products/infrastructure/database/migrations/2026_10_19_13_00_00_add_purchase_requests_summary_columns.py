@@ -0,0 +1,103 @@
+"""Add purchase_requests summary columns
+
+Итоги по корзине (total_price, items_count, distinct_products)
+заполняются для существующих заявок по их продуктам
+
+Revision ID: 8a8336429cd2
+Revises: 57c9ea640fe1
+Create Date: 2026-10-19 13:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8a8336429cd2'
+down_revision = '57c9ea640fe1'
+branch_labels = None
+depends_on = None
+
+
+def _backfill() -> None:
+    purchase_requests = sa.table(
+        'purchase_requests',
+        sa.column('id'),
+        sa.column('total_price'),
+        sa.column('items_count'),
+        sa.column('distinct_products'),
+    )
+    products = sa.table(
+        'purchase_request_products',
+        sa.column('purchase_request_id'),
+        sa.column('name', sa.String),
+        sa.column('category', sa.String),
+        sa.column('price'),
+        sa.column('count'),
+    )
+    is_request_product = (
+        products.c.purchase_request_id == purchase_requests.c.id
+    )
+
+    # продукт определяется категорией и названием
+    product_key = products.c.category + '\n' + products.c.name
+    op.execute(
+        purchase_requests.update().values(
+            total_price=sa.select(
+                sa.func.coalesce(
+                    sa.func.sum(products.c.price * products.c.count), 0
+                )
+            )
+            .where(is_request_product)
+            .scalar_subquery(),
+            items_count=sa.select(
+                sa.func.coalesce(sa.func.sum(products.c.count), 0)
+            )
+            .where(is_request_product)
+            .scalar_subquery(),
+            distinct_products=sa.select(sa.func.count(sa.distinct(product_key)))
+            .where(is_request_product)
+            .scalar_subquery(),
+        )
+    )
+
+
+def upgrade() -> None:
+    op.add_column(
+        'purchase_requests',
+        sa.Column(
+            'total_price', sa.Float(), server_default='0', nullable=False
+        ),
+    )
+    op.add_column(
+        'purchase_requests',
+        sa.Column(
+            'items_count', sa.INTEGER(), server_default='0', nullable=False
+        ),
+    )
+    op.add_column(
+        'purchase_requests',
+        sa.Column(
+            'distinct_products',
+            sa.INTEGER(),
+            server_default='0',
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        op.f('ix_products_purchase_requests_total_price'),
+        'purchase_requests',
+        ['total_price'],
+        unique=False,
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_products_purchase_requests_total_price'),
+        table_name='purchase_requests',
+    )
+    op.drop_column('purchase_requests', 'distinct_products')
+    op.drop_column('purchase_requests', 'items_count')
+    op.drop_column('purchase_requests', 'total_price')
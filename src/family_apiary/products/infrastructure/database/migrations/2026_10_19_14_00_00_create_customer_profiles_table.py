@@ -0,0 +1,45 @@
+"""Create customer_profiles table
+
+Итоги заполняются при создании заявок. Для уже существующих заявок
+итоги считаются командой
+`python -m family_apiary.run.products_customer_profiles rebuild`
+
+Revision ID: 3d0f6b1c2e94
+Revises: 8a8336429cd2
+Create Date: 2026-10-19 14:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3d0f6b1c2e94'
+down_revision = '8a8336429cd2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'customer_profiles',
+        sa.Column(
+            'phone_number',
+            sa.String(),
+            nullable=False,
+            comment='Номер телефона в формате E.164',
+        ),
+        sa.Column('orders_count', sa.INTEGER(), nullable=False),
+        sa.Column('lifetime_value', sa.Float(), nullable=False),
+        sa.Column('first_order_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_order_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            'phone_number', name=op.f('pk_customer_profiles')
+        ),
+        comment='Итоги заявок покупателей',
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('customer_profiles')
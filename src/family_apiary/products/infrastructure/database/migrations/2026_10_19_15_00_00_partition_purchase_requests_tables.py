@@ -0,0 +1,276 @@
+"""Partition purchase_requests tables by month
+
+Только для PostgreSQL (в SQLite таблицы остаются обычными).
+
+Таблицы заявок и продуктов заявок пересоздаются секционированными
+по месяцам (RANGE по created_at), данные копируются. created_at
+входит в первичный ключ, продукт ссылается на заявку по
+(purchase_request_id, created_at) - created_at продукта приводится
+к created_at заявки.
+
+Создаются секции со старейшего месяца заявок до 3 месяцев вперёд,
+дальше секции создаются заранее командой
+`python -m family_apiary.run.products_partitions ensure`.
+Строки месяцев без секции попадают в секцию по умолчанию
+(<таблица>_default), вставка заявок не падает
+
+Revision ID: 6c2e8f4a9b17
+Revises: 3d0f6b1c2e94
+Create Date: 2026-10-19 15:00:00.000000+00:00
+
+"""
+
+from datetime import UTC, date, datetime, time
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '6c2e8f4a9b17'
+down_revision = '3d0f6b1c2e94'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+PURCHASE_REQUESTS_COLUMNS = (
+    'id, created_at, updated_at, phone_number, name, '
+    'total_price, items_count, distinct_products'
+)
+PRODUCTS_COLUMNS = (
+    'id, created_at, updated_at, purchase_request_id, '
+    'name, description, category, price, count'
+)
+
+FK_NAME = 'fk_purchase_request_products_purchase_request_id_purchase_requests'
+
+PARTITIONED_TABLES = ('purchase_requests', 'purchase_request_products')
+
+
+# Копии функций секционирования на момент ревизии: изменения модуля
+# partitioning не должны менять уже выпущенную миграцию
+
+
+def _get_month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _add_months(month: date, months: int) -> date:
+    month_index = month.year * 12 + month.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _month_bound(month: date) -> str:
+    return datetime.combine(month, time(), tzinfo=UTC).isoformat(sep=' ')
+
+
+def _create_partition(table_name: str, month: date) -> None:
+    partition_name = f'{table_name}_p{month.year:04d}_{month.month:02d}'
+    op.execute(
+        f'CREATE TABLE IF NOT EXISTS {partition_name} '
+        f'PARTITION OF {table_name} '
+        f"FOR VALUES FROM ('{_month_bound(month)}') "
+        f"TO ('{_month_bound(_add_months(month, 1))}')"
+    )
+
+
+def _create_default_partition(table_name: str) -> None:
+    op.execute(
+        f'CREATE TABLE IF NOT EXISTS {table_name}_default '
+        f'PARTITION OF {table_name} DEFAULT'
+    )
+
+
+def _create_purchase_requests_table(
+    primary_key: list[str], **kwargs: Any
+) -> None:
+    op.create_table(
+        'purchase_requests',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('phone_number', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column(
+            'total_price', sa.Float(), server_default='0', nullable=False
+        ),
+        sa.Column(
+            'items_count', sa.INTEGER(), server_default='0', nullable=False
+        ),
+        sa.Column(
+            'distinct_products',
+            sa.INTEGER(),
+            server_default='0',
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            *primary_key, name=op.f('pk_purchase_requests')
+        ),
+        comment='Заявки на покупку продукции',
+        **kwargs,
+    )
+    for column in ('created_at', 'phone_number', 'updated_at', 'total_price'):
+        op.create_index(
+            op.f(f'ix_products_purchase_requests_{column}'),
+            'purchase_requests',
+            [column],
+            unique=False,
+        )
+
+
+def _create_products_table(primary_key: list[str], **kwargs: Any) -> None:
+    op.create_table(
+        'purchase_request_products',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('purchase_request_id', sa.UUID(), nullable=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('price', sa.Float, nullable=False),
+        sa.Column('count', sa.INTEGER(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            *primary_key, name=op.f('pk_purchase_request_products')
+        ),
+        comment='Заявки на покупку продукции',
+        **kwargs,
+    )
+    for column in ('created_at', 'purchase_request_id', 'updated_at'):
+        op.create_index(
+            op.f(f'ix_products_purchase_request_products_{column}'),
+            'purchase_request_products',
+            [column],
+            unique=False,
+        )
+
+
+def _rename_to_old(table_name: str, indexes: list[str]) -> None:
+    """
+    Переименовывает таблицу в <таблица>_old, удаляя её индексы
+    и первичный ключ (их имена нужны новой таблице)
+    """
+    for column in indexes:
+        op.drop_index(
+            op.f(f'ix_products_{table_name}_{column}'),
+            table_name=table_name,
+        )
+    op.drop_constraint(op.f(f'pk_{table_name}'), table_name, type_='primary')
+    op.rename_table(table_name, f'{table_name}_old')
+
+
+def _get_months_range() -> tuple[date, date]:
+    """
+    Месяцы секций: со старейшей записи до MONTHS_AHEAD месяцев вперёд
+    """
+    min_created_at, max_created_at = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                'SELECT min(created_at), max(created_at) FROM ('
+                'SELECT created_at FROM purchase_requests_old '
+                'UNION ALL '
+                'SELECT created_at FROM purchase_request_products_old'
+                ') AS created'
+            )
+        )
+        .one()
+    )
+    current_month = _get_month_start(datetime.now(UTC).date())
+    month_from = current_month
+    month_to = _add_months(current_month, MONTHS_AHEAD)
+    if min_created_at is not None:
+        month_from = min(
+            month_from, _get_month_start(min_created_at.astimezone(UTC).date())
+        )
+        month_to = max(
+            month_to, _get_month_start(max_created_at.astimezone(UTC).date())
+        )
+    return month_from, month_to
+
+
+def _create_partitioned_tables() -> None:
+    partition_by = {'postgresql_partition_by': 'RANGE (created_at)'}
+    _create_purchase_requests_table(['id', 'created_at'], **partition_by)
+    _create_products_table(['id', 'created_at'], **partition_by)
+
+    month, month_to = _get_months_range()
+    while month <= month_to:
+        for table_name in PARTITIONED_TABLES:
+            _create_partition(table_name, month)
+        month = _add_months(month, 1)
+
+    for table_name in PARTITIONED_TABLES:
+        _create_default_partition(table_name)
+
+
+def _replace_tables(partitioned: bool) -> None:
+    """
+    Пересоздаёт таблицы (секционированными или обычными)
+    и копирует в них данные
+    """
+    op.drop_constraint(
+        op.f(FK_NAME), 'purchase_request_products', type_='foreignkey'
+    )
+    _rename_to_old(
+        'purchase_request_products',
+        ['created_at', 'purchase_request_id', 'updated_at'],
+    )
+    _rename_to_old(
+        'purchase_requests',
+        ['created_at', 'phone_number', 'updated_at', 'total_price'],
+    )
+
+    if partitioned:
+        _create_partitioned_tables()
+        # продукт должен попасть в секцию месяца своей заявки
+        products_created_at = 'coalesce(r.created_at, p.created_at)'
+        foreign_key = ['purchase_request_id', 'created_at']
+        referred_columns = ['id', 'created_at']
+    else:
+        _create_purchase_requests_table(['id'])
+        _create_products_table(['id'])
+        products_created_at = 'p.created_at'
+        foreign_key = ['purchase_request_id']
+        referred_columns = ['id']
+
+    op.execute(
+        f'INSERT INTO purchase_requests ({PURCHASE_REQUESTS_COLUMNS}) '
+        f'SELECT {PURCHASE_REQUESTS_COLUMNS} FROM purchase_requests_old'
+    )
+    op.execute(
+        f'INSERT INTO purchase_request_products ({PRODUCTS_COLUMNS}) '
+        f'SELECT p.id, {products_created_at}, p.updated_at, '
+        'p.purchase_request_id, p.name, p.description, p.category, '
+        'p.price, p.count '
+        'FROM purchase_request_products_old p '
+        'LEFT JOIN purchase_requests_old r ON r.id = p.purchase_request_id'
+    )
+    op.create_foreign_key(
+        op.f(FK_NAME),
+        'purchase_request_products',
+        'purchase_requests',
+        foreign_key,
+        referred_columns,
+    )
+
+    op.drop_table('purchase_request_products_old')
+    op.drop_table('purchase_requests_old')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _replace_tables(partitioned=True)
+
+
+def downgrade() -> None:
+    """
+    Заархивированные секции не возвращаются
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _replace_tables(partitioned=False)
@@ -0,0 +1,147 @@
+"""Add purchase_requests search indexes
+
+PostgreSQL: расширение pg_trgm, GIN индексы по имени покупателя,
+цифрам номера телефона и названию продукта (триграммы), полнотекстовый
+GIN индекс по названию продукта.
+
+SQLite: таблица FTS5 purchase_requests_search и триггеры, которые её
+заполняют; существующие заявки добавляются в таблицу
+
+Revision ID: 9e4b7a2c5d31
+Revises: 6c2e8f4a9b17
+Create Date: 2026-10-19 16:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9e4b7a2c5d31'
+down_revision = '6c2e8f4a9b17'
+branch_labels = None
+depends_on = None
+
+PG_INDEXES = (
+    (
+        'ix_products_purchase_requests_name_trgm',
+        'purchase_requests',
+        'name gin_trgm_ops',
+    ),
+    (
+        'ix_products_purchase_requests_phone_digits_trgm',
+        'purchase_requests',
+        "regexp_replace(phone_number, '[^0-9]', '', 'g') gin_trgm_ops",
+    ),
+    (
+        'ix_products_purchase_request_products_name_trgm',
+        'purchase_request_products',
+        'name gin_trgm_ops',
+    ),
+    (
+        'ix_products_purchase_request_products_name_fts',
+        'purchase_request_products',
+        "to_tsvector('russian', name)",
+    ),
+)
+
+SQLITE_UPGRADE = (
+    'CREATE VIRTUAL TABLE purchase_requests_search USING fts5('
+    'purchase_request_id UNINDEXED, name, phone_digits, product_name, '
+    "tokenize='trigram')",
+    'CREATE TRIGGER purchase_requests_search_request_insert '
+    'AFTER INSERT ON purchase_requests BEGIN '
+    'INSERT INTO purchase_requests_search '
+    '(purchase_request_id, name, phone_digits) '
+    'VALUES (NEW.id, NEW.name, '
+    'replace(replace(replace(replace(replace(NEW.phone_number, '
+    "' ', ''), '+', ''), '(', ''), ')', ''), '-', '')); "
+    'END',
+    'CREATE TRIGGER purchase_requests_search_request_update '
+    'AFTER UPDATE OF name, phone_number ON purchase_requests BEGIN '
+    'UPDATE purchase_requests_search SET name = NEW.name, '
+    'phone_digits = replace(replace(replace(replace(replace(NEW.phone_number, '
+    "' ', ''), '+', ''), '(', ''), ')', ''), '-', '') "
+    'WHERE purchase_request_id = NEW.id AND product_name IS NULL; '
+    'END',
+    'CREATE TRIGGER purchase_requests_search_request_delete '
+    'AFTER DELETE ON purchase_requests BEGIN '
+    'DELETE FROM purchase_requests_search '
+    'WHERE purchase_request_id = OLD.id; '
+    'END',
+    'CREATE TRIGGER purchase_requests_search_product_insert '
+    'AFTER INSERT ON purchase_request_products '
+    'WHEN NEW.purchase_request_id IS NOT NULL BEGIN '
+    'INSERT INTO purchase_requests_search '
+    '(purchase_request_id, product_name) '
+    'VALUES (NEW.purchase_request_id, NEW.name); '
+    'END',
+    'CREATE TRIGGER purchase_requests_search_product_update '
+    'AFTER UPDATE OF name ON purchase_request_products BEGIN '
+    'DELETE FROM purchase_requests_search '
+    'WHERE purchase_request_id = NEW.purchase_request_id '
+    'AND product_name IS NOT NULL; '
+    'INSERT INTO purchase_requests_search '
+    '(purchase_request_id, product_name) '
+    'SELECT purchase_request_id, name FROM purchase_request_products '
+    'WHERE purchase_request_id = NEW.purchase_request_id; '
+    'END',
+    'CREATE TRIGGER purchase_requests_search_product_delete '
+    'AFTER DELETE ON purchase_request_products BEGIN '
+    'DELETE FROM purchase_requests_search '
+    'WHERE purchase_request_id = OLD.purchase_request_id '
+    'AND product_name IS NOT NULL; '
+    'INSERT INTO purchase_requests_search '
+    '(purchase_request_id, product_name) '
+    'SELECT purchase_request_id, name FROM purchase_request_products '
+    'WHERE purchase_request_id = OLD.purchase_request_id; '
+    'END',
+    # существующие заявки
+    'INSERT INTO purchase_requests_search '
+    '(purchase_request_id, name, phone_digits) '
+    'SELECT id, name, '
+    'replace(replace(replace(replace(replace(phone_number, '
+    "' ', ''), '+', ''), '(', ''), ')', ''), '-', '') "
+    'FROM purchase_requests',
+    'INSERT INTO purchase_requests_search '
+    '(purchase_request_id, product_name) '
+    'SELECT purchase_request_id, name FROM purchase_request_products '
+    'WHERE purchase_request_id IS NOT NULL',
+)
+
+SQLITE_DOWNGRADE = (
+    'DROP TRIGGER IF EXISTS purchase_requests_search_request_insert',
+    'DROP TRIGGER IF EXISTS purchase_requests_search_request_update',
+    'DROP TRIGGER IF EXISTS purchase_requests_search_request_delete',
+    'DROP TRIGGER IF EXISTS purchase_requests_search_product_insert',
+    'DROP TRIGGER IF EXISTS purchase_requests_search_product_update',
+    'DROP TRIGGER IF EXISTS purchase_requests_search_product_delete',
+    'DROP TABLE IF EXISTS purchase_requests_search',
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table_name, expression in PG_INDEXES:
+        op.create_index(
+            name,
+            table_name,
+            [sa.text(expression)],
+            unique=False,
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+        return
+
+    for name, table_name, _ in PG_INDEXES:
+        op.drop_index(name, table_name=table_name)
@@ -0,0 +1,73 @@
+"""Create catalog_products and catalog_version tables
+
+Revision ID: 4b8e1d6f0a27
+Revises: 9e4b7a2c5d31
+Create Date: 2026-10-19 17:00:00.000000+00:00
+
+"""
+
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4b8e1d6f0a27'
+down_revision = '9e4b7a2c5d31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'catalog_products',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('price', sa.Float(), nullable=False),
+        sa.Column(
+            'is_available',
+            sa.Boolean(),
+            server_default=sa.true(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_catalog_products')),
+        comment='Каталог продукции',
+    )
+    op.create_index(
+        op.f('ix_products_catalog_products_category'),
+        'catalog_products',
+        ['category'],
+        unique=False,
+    )
+
+    catalog_version = op.create_table(
+        'catalog_version',
+        sa.Column('id', sa.INTEGER(), autoincrement=False, nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_catalog_version')),
+        comment='Версия каталога продукции (меняется при каждом изменении)',
+    )
+    op.bulk_insert(
+        catalog_version,
+        [
+            {
+                'id': 1,
+                'version': 1,
+                'updated_at': datetime.now(timezone.utc),
+            },
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('catalog_version')
+    op.drop_index(
+        op.f('ix_products_catalog_products_category'),
+        table_name='catalog_products',
+    )
+    op.drop_table('catalog_products')
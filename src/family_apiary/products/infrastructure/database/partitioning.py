@@ -0,0 +1,389 @@
+import csv
+import gzip
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger('MonthlyPartitioning')
+
+AnyConnection = Connection | AsyncConnection
+
+PARTITION_NAME_REGEX = re.compile(
+    r'^(?P<table>.+)_p(?P<year>\d{4})_(?P<month>\d{2})$'
+)
+"""Имя месячной секции: <таблица>_pYYYY_MM"""
+
+DEFAULT_PARTITION_SUFFIX = '_default'
+"""Секция по умолчанию: <таблица>_default"""
+
+
+@dataclass(frozen=True)
+class MonthlyRangePartitioning:
+    """
+    Секционирование таблицы по месяцам (RANGE по колонке времени)
+    """
+
+    column: str
+
+
+def monthly_range_partitioning(column: str = 'created_at') -> dict[str, Any]:
+    """
+    Аргументы sa.Table для секционирования по месяцам.
+
+    В PostgreSQL таблица создаётся секционированной
+    (секции создаются заранее - `ensure_monthly_partitions`),
+    в других БД таблица обычная
+    """
+    return {
+        'postgresql_partition_by': f'RANGE ({column})',
+        'info': {'partitioning': MonthlyRangePartitioning(column=column)},
+    }
+
+
+def get_partitioned_tables(metadata: sa.MetaData) -> list[sa.Table]:
+    """
+    Таблицы, секционированные по месяцам (в порядке зависимостей)
+    """
+    return [
+        table
+        for table in metadata.sorted_tables
+        if isinstance(table.info.get('partitioning'), MonthlyRangePartitioning)
+    ]
+
+
+def get_month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    month_index = month.year * 12 + month.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def get_partition_name(table_name: str, month: date) -> str:
+    return f'{table_name}_p{month.year:04d}_{month.month:02d}'
+
+
+def is_partition_name(name: str) -> bool:
+    return PARTITION_NAME_REGEX.match(name) is not None
+
+
+def _month_bound(month: date) -> str:
+    return datetime.combine(month, time(), tzinfo=UTC).isoformat(sep=' ')
+
+
+def _quote_table(connection: AnyConnection, table: sa.TableClause) -> str:
+    preparer = connection.dialect.identifier_preparer
+    return preparer.format_table(table)
+
+
+def _quote_partition(
+    connection: AnyConnection, table: sa.TableClause, name: str
+) -> str:
+    preparer = connection.dialect.identifier_preparer
+    if table.schema:
+        return f'{preparer.quote_schema(table.schema)}.{preparer.quote(name)}'
+    return preparer.quote(name)
+
+
+def create_partition_statement(
+    connection: AnyConnection,
+    table: sa.TableClause,
+    month: date,
+) -> sa.TextClause:
+    """
+    CREATE TABLE ... PARTITION OF для секции месяца
+    """
+    partition = _quote_partition(
+        connection, table, get_partition_name(table.name, month)
+    )
+    return sa.text(
+        f'CREATE TABLE IF NOT EXISTS {partition} '
+        f'PARTITION OF {_quote_table(connection, table)} '
+        f"FOR VALUES FROM ('{_month_bound(month)}') "
+        f"TO ('{_month_bound(add_months(month, 1))}')"
+    )
+
+
+def create_default_partition_statement(
+    connection: AnyConnection,
+    table: sa.TableClause,
+) -> sa.TextClause:
+    """
+    CREATE TABLE ... PARTITION OF ... DEFAULT - секция для строк,
+    для месяца которых секция не создана (вставка не падает,
+    если секции вовремя не созданы заранее)
+    """
+    partition = _quote_partition(
+        connection, table, f'{table.name}{DEFAULT_PARTITION_SUFFIX}'
+    )
+    return sa.text(
+        f'CREATE TABLE IF NOT EXISTS {partition} '
+        f'PARTITION OF {_quote_table(connection, table)} DEFAULT'
+    )
+
+
+async def ensure_monthly_partitions(
+    db_engine: AsyncEngine,
+    metadata: sa.MetaData,
+    months_ahead: int,
+    month_from: date | None = None,
+) -> None:
+    """
+    Создаёт секции секционированных таблиц с `month_from`
+    (по умолчанию - текущий месяц) на `months_ahead` месяцев вперёд
+    и секции по умолчанию.
+
+    Уже существующие секции не меняются. Если в секции по умолчанию
+    уже есть строки месяца, секция месяца не создаётся (ошибка БД) -
+    строки нужно перенести вручную. Только для PostgreSQL
+    """
+    if db_engine.dialect.name != 'postgresql':
+        logger.info(
+            'Partitioning is not supported for %s, skipped',
+            db_engine.dialect.name,
+        )
+        return
+
+    first_month = get_month_start(month_from or datetime.now(UTC).date())
+    last_month = add_months(
+        get_month_start(datetime.now(UTC).date()), months_ahead
+    )
+
+    async with db_engine.begin() as connection:
+        month = first_month
+        while month <= last_month:
+            for table in get_partitioned_tables(metadata):
+                await connection.execute(
+                    create_partition_statement(connection, table, month)
+                )
+            month = add_months(month, 1)
+
+        for table in get_partitioned_tables(metadata):
+            await connection.execute(
+                create_default_partition_statement(connection, table)
+            )
+
+    logger.info('Partitions from %s to %s are ensured', first_month, last_month)
+
+
+async def _get_partitions(
+    connection: AsyncConnection,
+    table: sa.Table,
+) -> dict[date, str]:
+    """
+    Месячные секции таблицы: начало месяца -> имя секции
+    """
+    result = await connection.execute(
+        sa.text(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class parent ON parent.oid = pg_inherits.inhparent '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'JOIN pg_namespace ns ON ns.oid = parent.relnamespace '
+            'WHERE parent.relname = :table_name '
+            'AND ns.nspname = :schema'
+        ),
+        {'table_name': table.name, 'schema': table.schema or 'public'},
+    )
+
+    partitions = {}
+    for (name,) in result:
+        match = PARTITION_NAME_REGEX.match(name)
+        if match is None or match['table'] != table.name:
+            continue
+        month = date(int(match['year']), int(match['month']), 1)
+        partitions[month] = name
+    return partitions
+
+
+class ArchiveMode(StrEnum):
+    """
+    Способ архивации секций
+    """
+
+    # секция отсоединяется и переносится в схему (и табличное
+    # пространство) архива - данные остаются в БД
+    DETACH = 'detach'
+
+    # строки секции выгружаются пачками в сжатый файл, секция удаляется
+    DUMP = 'dump'
+
+
+@dataclass
+class ArchiveSettings:
+    mode: ArchiveMode
+    schema: str
+    tablespace: str | None
+    directory: Path
+    batch_size: int
+
+
+async def _dump_partition(
+    connection: AsyncConnection,
+    table: sa.Table,
+    partition_name: str,
+    settings: ArchiveSettings,
+) -> None:
+    """
+    Выгружает строки секции в <directory>/<секция>.csv.gz пачками.
+
+    Файл пишется во временный и переименовывается после записи
+    всех строк - неполный архив не появится
+    """
+    settings.directory.mkdir(parents=True, exist_ok=True)
+    path = settings.directory / f'{partition_name}.csv.gz'
+    tmp_path = path.with_suffix('.tmp')
+
+    partition = sa.table(
+        partition_name,
+        *(sa.column(column.name) for column in table.columns),
+        schema=table.schema,
+    )
+    result = await connection.stream(
+        sa.select(partition).execution_options(yield_per=settings.batch_size)
+    )
+
+    rows_count = 0
+    with open(tmp_path, 'wb') as raw_file:
+        with gzip.open(raw_file, 'wt', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(column.name for column in table.columns)
+            async for rows in result.partitions():
+                writer.writerows(rows)
+                rows_count += len(rows)
+        # архив должен быть на диске до удаления секции
+        raw_file.flush()
+        os.fsync(raw_file.fileno())
+
+    tmp_path.rename(path)
+    logger.info('Partition %s dumped: %s rows', partition_name, rows_count)
+
+
+async def _drop_foreign_keys(
+    connection: AsyncConnection,
+    partition: str,
+) -> None:
+    """
+    Удаляет внешние ключи отсоединённой секции.
+
+    Ключ остаётся у секции после отсоединения и ссылается на всю
+    секционированную таблицу - секцию с заявками этого месяца
+    нельзя было бы отсоединить
+    """
+    result = await connection.execute(
+        sa.text(
+            'SELECT conname FROM pg_constraint '
+            'WHERE conrelid = CAST(:partition AS regclass) '
+            "AND contype = 'f'"
+        ),
+        {'partition': partition},
+    )
+    preparer = connection.dialect.identifier_preparer
+    for (name,) in result.all():
+        await connection.execute(
+            sa.text(
+                f'ALTER TABLE {partition} '
+                f'DROP CONSTRAINT {preparer.quote(name)}'
+            )
+        )
+
+
+async def _archive_partition(
+    connection: AsyncConnection,
+    table: sa.Table,
+    partition_name: str,
+    settings: ArchiveSettings,
+) -> None:
+    partition = _quote_partition(connection, table, partition_name)
+    await connection.execute(
+        sa.text(
+            f'ALTER TABLE {_quote_table(connection, table)} '
+            f'DETACH PARTITION {partition}'
+        )
+    )
+    await _drop_foreign_keys(connection, partition)
+
+    if settings.mode == ArchiveMode.DUMP:
+        await _dump_partition(connection, table, partition_name, settings)
+        await connection.execute(sa.text(f'DROP TABLE {partition}'))
+        return
+
+    preparer = connection.dialect.identifier_preparer
+    archive_schema = preparer.quote_schema(settings.schema)
+    await connection.execute(
+        sa.text(f'CREATE SCHEMA IF NOT EXISTS {archive_schema}')
+    )
+    await connection.execute(
+        sa.text(f'ALTER TABLE {partition} SET SCHEMA {archive_schema}')
+    )
+    if settings.tablespace:
+        await connection.execute(
+            sa.text(
+                f'ALTER TABLE {archive_schema}.{preparer.quote(partition_name)} '
+                f'SET TABLESPACE {preparer.quote(settings.tablespace)}'
+            )
+        )
+    logger.info('Partition %s moved to %s', partition_name, settings.schema)
+
+
+async def archive_monthly_partitions(
+    db_engine: AsyncEngine,
+    metadata: sa.MetaData,
+    older_than: date,
+    settings: ArchiveSettings,
+) -> None:
+    """
+    Архивирует секции за месяцы, закончившиеся до `older_than`.
+
+    Каждый месяц архивируется в отдельной транзакции, секции всех
+    таблиц месяца - вместе (сначала зависимые таблицы). Только для
+    PostgreSQL
+    """
+    if db_engine.dialect.name != 'postgresql':
+        logger.info(
+            'Partitioning is not supported for %s, skipped',
+            db_engine.dialect.name,
+        )
+        return
+
+    # зависимые таблицы отсоединяются раньше таблиц, на которые ссылаются
+    tables = list(reversed(get_partitioned_tables(metadata)))
+
+    async with db_engine.connect() as connection:
+        partitions_by_table = {
+            table: await _get_partitions(connection, table) for table in tables
+        }
+
+    months = sorted(
+        {
+            month
+            for partitions in partitions_by_table.values()
+            for month in partitions
+            if add_months(month, 1) <= older_than
+        }
+    )
+    for month in months:
+        async with db_engine.begin() as connection:
+            for table in tables:
+                partition_name = partitions_by_table[table].get(month)
+                if partition_name is not None:
+                    await _archive_partition(
+                        connection, table, partition_name, settings
+                    )
+
+
+def get_archive_border(months_to_keep: int) -> date:
+    """
+    Начало самого старого месяца, который не архивируется
+    """
+    current_month = get_month_start(datetime.now(UTC).date())
+    return add_months(current_month, -months_to_keep)
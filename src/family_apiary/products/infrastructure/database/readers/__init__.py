@@ -0,0 +1,9 @@
+from .catalog_snapshot_provider import CachedCatalogSnapshotProviderImpl
+from .customer_profiles_reader import CustomerProfilesReaderImpl
+from .purchase_requests_export_reader import PurchaseRequestsExportReaderImpl
+from .purchase_requests_search_reader import (
+    BasePurchaseRequestsSearchReader,
+    PostgresPurchaseRequestsSearchReaderImpl,
+    SqlitePurchaseRequestsSearchReaderImpl,
+)
+from .sales_rollups_reader import SalesRollupsReaderImpl
@@ -0,0 +1,83 @@
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from commons.caching import AsyncVersionedSnapshotCache, VersionedSnapshot
+from commons.entities.base import EntityId
+from family_apiary.products.application.dto import (
+    CatalogSnapshot,
+    CatalogSnapshotProduct,
+)
+from family_apiary.products.application.interfaces import (
+    CatalogSnapshotProvider,
+)
+from family_apiary.products.infrastructure.database.catalog import (
+    get_catalog_version,
+)
+from family_apiary.products.infrastructure.database.tables import (
+    catalog_products_table,
+)
+
+
+class CachedCatalogSnapshotProviderImpl(CatalogSnapshotProvider):
+    """
+    Снимок каталога в памяти процесса.
+
+    Каталог читается целиком (он небольшой) и кэшируется. Не чаще
+    чем раз в `ttl_seconds` сверяется версия каталога (запрос одной
+    строки), каталог перечитывается только при смене версии.
+    Изменения каталога в этом процессе сбрасывают снимок сразу
+    """
+
+    def __init__(self, db_engine: AsyncEngine, ttl_seconds: float):
+        self._db_engine = db_engine
+        self._cache: AsyncVersionedSnapshotCache[CatalogSnapshot] = (
+            AsyncVersionedSnapshotCache(
+                load_version=self._load_version,
+                load_snapshot=self._load_snapshot,
+                ttl_seconds=ttl_seconds,
+            )
+        )
+
+    async def get_snapshot(self) -> CatalogSnapshot:
+        return (await self._cache.get()).data
+
+    def invalidate(self) -> None:
+        self._cache.invalidate()
+
+    async def _load_version(self) -> int:
+        async with self._db_engine.connect() as connection:
+            version: int = await get_catalog_version(connection)
+        return version
+
+    async def _load_snapshot(self) -> VersionedSnapshot[CatalogSnapshot]:
+        products = catalog_products_table.c
+        async with self._db_engine.connect() as connection:
+            # версия читается до продуктов: если каталог изменится
+            # между запросами, снимок будет перечитан при следующей сверке
+            version = await get_catalog_version(connection)
+            rows = await connection.execute(
+                sa.select(
+                    products.id,
+                    products.name,
+                    products.description,
+                    products.category,
+                    products.price,
+                    products.is_available,
+                ).order_by(products.category, products.name)
+            )
+            catalog_products = [
+                CatalogSnapshotProduct(
+                    id=EntityId(row.id),
+                    name=row.name,
+                    description=row.description,
+                    category=row.category,
+                    price=row.price,
+                    is_available=row.is_available,
+                )
+                for row in rows
+            ]
+
+        return VersionedSnapshot(
+            version=version,
+            data=CatalogSnapshot(version=version, products=catalog_products),
+        )
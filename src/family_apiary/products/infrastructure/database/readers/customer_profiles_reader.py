@@ -0,0 +1,37 @@
+from sqlalchemy import select
+
+from commons.db.sqlalchemy import BaseReadOnlyRepository
+from commons.value_objects import PhoneNumber
+from family_apiary.products.application.dto import CustomerProfile
+from family_apiary.products.application.interfaces import (
+    CustomerProfilesReader,
+)
+from family_apiary.products.infrastructure.database.tables import (
+    customer_profiles_table,
+)
+
+
+class CustomerProfilesReaderImpl(
+    BaseReadOnlyRepository, CustomerProfilesReader
+):
+    """
+    Чтение итогов покупателя по первичному ключу (без чтения заявок)
+    """
+
+    async def get_by_phone_number(
+        self,
+        phone_number: PhoneNumber,
+    ) -> CustomerProfile | None:
+        profiles = customer_profiles_table.c
+        query = select(
+            profiles.orders_count,
+            profiles.lifetime_value,
+            profiles.first_order_at,
+            profiles.last_order_at,
+        ).where(profiles.phone_number == phone_number)
+
+        row = (await self.session.execute(query)).one_or_none()
+        if row is None:
+            return None
+
+        return CustomerProfile(phone_number=phone_number, **row._asdict())
@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from commons.mappers import Mapper, MapperConfig
+from family_apiary.products.application.dto import PurchaseRequestExportRow
+from family_apiary.products.application.interfaces import (
+    PurchaseRequestsExportReader,
+)
+from family_apiary.products.infrastructure.database.tables import (
+    purchase_request_products_table,
+    purchase_requests_table,
+)
+
+export_row_mapper_config = MapperConfig(
+    source_type=Row,
+    target_type=PurchaseRequestExportRow,
+    computed_fields={
+        'total_price': lambda row: (
+            row.price * row.count if row.price is not None else None
+        ),
+    },
+)
+
+
+class PurchaseRequestsExportReaderImpl(PurchaseRequestsExportReader):
+    """
+    Чтение заявок для выгрузки курсором на стороне сервера.
+
+    Строки читаются пачками по `batch_size` (yield_per),
+    заявки и продукты объединяются в запросе
+    """
+
+    def __init__(self, db_engine: AsyncEngine, mapper: Mapper, batch_size: int):
+        self._db_engine = db_engine
+        self._mapper = mapper
+        self._batch_size = batch_size
+
+    async def stream_batches(
+        self,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[list[PurchaseRequestExportRow]]:
+        requests = purchase_requests_table.c
+        products = purchase_request_products_table.c
+
+        query = (
+            select(
+                requests.id.label('purchase_request_id'),
+                requests.created_at,
+                requests.phone_number,
+                requests.name,
+                products.name.label('product_name'),
+                products.category.label('product_category'),
+                products.description.label('product_description'),
+                products.price,
+                products.count,
+            )
+            .select_from(
+                purchase_requests_table.outerjoin(
+                    purchase_request_products_table,
+                    products.purchase_request_id == requests.id,
+                )
+            )
+            .order_by(requests.created_at, requests.id)
+            .execution_options(yield_per=self._batch_size)
+        )
+
+        # фильтр по created_at использует индекс по этой колонке
+        if created_from is not None:
+            query = query.where(requests.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(requests.created_at < created_to)
+
+        async with self._db_engine.connect() as connection:
+            result = await connection.stream(query)
+            async for partition in result.partitions():
+                yield list(
+                    self._mapper.map_many(partition, export_row_mapper_config)
+                )
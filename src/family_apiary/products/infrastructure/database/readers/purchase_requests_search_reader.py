@@ -0,0 +1,208 @@
+from abc import abstractmethod
+from typing import Any
+
+import sqlalchemy as sa
+
+from commons.db.sqlalchemy import BaseReadOnlyRepository
+from family_apiary.products.application.dto import (
+    PurchaseRequestSearchHit,
+    PurchaseRequestsSearchCursor,
+)
+from family_apiary.products.application.interfaces import (
+    PurchaseRequestsSearchReader,
+)
+from family_apiary.products.infrastructure.database.search import (
+    SQLITE_SEARCH_TABLE_NAME,
+    SearchTerms,
+    parse_search_text,
+    phone_digits_expression,
+    to_fts5_query,
+    tsquery_expression,
+    tsvector_expression,
+)
+from family_apiary.products.infrastructure.database.tables import (
+    purchase_request_products_table,
+    purchase_requests_search_table,
+    purchase_requests_table,
+)
+
+
+class BasePurchaseRequestsSearchReader(
+    BaseReadOnlyRepository, PurchaseRequestsSearchReader
+):
+    """
+    Поиск заявок: подходящие заявки с релевантностью (rank) ищутся
+    по индексам БД, затем читаются одна страница заявок по ключу
+    (rank, created_at, id)
+    """
+
+    @abstractmethod
+    def _get_candidates(self, terms: SearchTerms) -> sa.Subquery:
+        """
+        Подходящие заявки: колонки id и rank (чем больше, тем лучше)
+        """
+        ...
+
+    def _join_candidates(
+        self, candidates: sa.Subquery
+    ) -> sa.ColumnElement[bool]:
+        condition: sa.ColumnElement[bool] = (
+            purchase_requests_table.c.id == candidates.c.id
+        )
+        return condition
+
+    async def search(
+        self,
+        text: str,
+        limit: int,
+        after: PurchaseRequestsSearchCursor | None = None,
+    ) -> list[PurchaseRequestSearchHit]:
+        terms = parse_search_text(text)
+        if terms.is_empty():
+            return []
+
+        candidates = self._get_candidates(terms)
+        requests = purchase_requests_table.c
+        rank = candidates.c.rank
+        query = (
+            sa.select(
+                requests.id,
+                requests.created_at,
+                requests.name,
+                requests.phone_number,
+                requests.total_price,
+                requests.items_count,
+                rank,
+            )
+            .select_from(
+                purchase_requests_table.join(
+                    candidates, self._join_candidates(candidates)
+                )
+            )
+            .order_by(
+                rank.desc(), requests.created_at.desc(), requests.id.desc()
+            )
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(
+                sa.tuple_(rank, requests.created_at, requests.id)
+                < sa.tuple_(
+                    sa.literal(after.rank, sa.Float),
+                    sa.literal(after.created_at, requests.created_at.type),
+                    sa.literal(after.id, requests.id.type),
+                )
+            )
+
+        rows = await self.session.execute(query)
+        return [PurchaseRequestSearchHit(**row._asdict()) for row in rows]
+
+
+class PostgresPurchaseRequestsSearchReaderImpl(
+    BasePurchaseRequestsSearchReader
+):
+    """
+    Поиск в PostgreSQL: триграммы (pg_trgm) по имени, цифрам телефона
+    и названию продукта, полнотекстовый поиск по названию продукта.
+
+    Каждое условие - отдельный запрос по своему GIN индексу,
+    релевантность заявки - сумма по всем совпадениям
+    """
+
+    def _get_candidates(self, terms: SearchTerms) -> sa.Subquery:
+        requests = purchase_requests_table.c
+        products = purchase_request_products_table.c
+
+        matches: list[sa.Select[tuple[Any, Any, float]]] = []
+        for word in terms.words:
+            is_similar_to = sa.literal(word).op('<%', is_comparison=True)
+            matches.append(
+                sa.select(
+                    requests.id,
+                    requests.created_at,
+                    sa.func.word_similarity(word, requests.name).label('rank'),
+                ).where(is_similar_to(requests.name))
+            )
+
+            product_tsvector = tsvector_expression(products.name)
+            word_tsquery = tsquery_expression(word)
+            matches.append(
+                sa.select(
+                    products.purchase_request_id.label('id'),
+                    products.created_at,
+                    sa.func.greatest(
+                        sa.func.word_similarity(word, products.name),
+                        sa.func.ts_rank(product_tsvector, word_tsquery),
+                    ).label('rank'),
+                ).where(
+                    products.purchase_request_id.is_not(None),
+                    sa.or_(
+                        is_similar_to(products.name),
+                        product_tsvector.op('@@')(word_tsquery),
+                    ),
+                )
+            )
+
+        for phone_part in terms.phone_parts:
+            matches.append(
+                sa.select(
+                    requests.id,
+                    requests.created_at,
+                    sa.literal(1.0, sa.Float).label('rank'),
+                ).where(
+                    phone_digits_expression(requests.phone_number).like(
+                        f'%{phone_part}%'
+                    )
+                )
+            )
+
+        found = sa.union_all(*matches).subquery('found')
+        return (
+            sa.select(
+                found.c.id,
+                found.c.created_at,
+                sa.cast(sa.func.sum(found.c.rank), sa.Float).label('rank'),
+            )
+            .group_by(found.c.id, found.c.created_at)
+            .subquery('candidates')
+        )
+
+    def _join_candidates(
+        self, candidates: sa.Subquery
+    ) -> sa.ColumnElement[bool]:
+        # created_at - ключ секционирования, заявка ищется в одной секции
+        return sa.and_(
+            purchase_requests_table.c.id == candidates.c.id,
+            purchase_requests_table.c.created_at == candidates.c.created_at,
+        )
+
+
+class SqlitePurchaseRequestsSearchReaderImpl(BasePurchaseRequestsSearchReader):
+    """
+    Поиск в SQLite по таблице FTS5 (триграммы) - для локального запуска
+    и тестов без PostgreSQL
+    """
+
+    def _get_candidates(self, terms: SearchTerms) -> sa.Subquery:
+        search = purchase_requests_search_table.c
+        found = (
+            sa.select(
+                search.purchase_request_id.label('id'),
+                # rank FTS5 (bm25) тем меньше, чем лучше совпадение
+                (-search.rank).label('rank'),
+            )
+            .where(
+                sa.literal_column(SQLITE_SEARCH_TABLE_NAME).op(
+                    'MATCH', is_comparison=True
+                )(to_fts5_query(terms))
+            )
+            .subquery('found')
+        )
+        return (
+            sa.select(
+                found.c.id,
+                sa.func.sum(found.c.rank, type_=sa.Float).label('rank'),
+            )
+            .group_by(found.c.id)
+            .subquery('candidates')
+        )
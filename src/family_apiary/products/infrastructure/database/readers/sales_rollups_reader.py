@@ -0,0 +1,65 @@
+from datetime import date
+
+from sqlalchemy import select
+
+from commons.db.sqlalchemy import BaseReadOnlyRepository
+from family_apiary.products.application.dto import (
+    SalesReportPeriod,
+    SalesReportRow,
+)
+from family_apiary.products.application.interfaces import SalesRollupsReader
+from family_apiary.products.infrastructure.database.sales_rollups import (
+    get_month_start,
+)
+from family_apiary.products.infrastructure.database.tables import (
+    sales_daily_rollups_table,
+    sales_monthly_rollups_table,
+)
+
+_tables_by_period = {
+    SalesReportPeriod.DAY: sales_daily_rollups_table,
+    SalesReportPeriod.MONTH: sales_monthly_rollups_table,
+}
+
+
+class SalesRollupsReaderImpl(BaseReadOnlyRepository, SalesRollupsReader):
+    """
+    Чтение итогов продаж из таблиц дневных и месячных итогов
+    (без чтения заявок)
+    """
+
+    async def get_rows(
+        self,
+        period: SalesReportPeriod,
+        date_from: date,
+        date_to: date,
+        category: str | None = None,
+    ) -> list[SalesReportRow]:
+        table = _tables_by_period[period]
+        if period == SalesReportPeriod.MONTH:
+            date_from = get_month_start(date_from)
+
+        query = (
+            select(
+                table.c.period_start,
+                table.c.category,
+                table.c.product_name,
+                table.c.revenue,
+                table.c.orders_count,
+                table.c.units_count,
+            )
+            .where(
+                table.c.period_start >= date_from,
+                table.c.period_start <= date_to,
+            )
+            .order_by(
+                table.c.period_start,
+                table.c.category,
+                table.c.product_name,
+            )
+        )
+        if category is not None:
+            query = query.where(table.c.category == category)
+
+        result = await self.session.execute(query)
+        return [SalesReportRow(**row._asdict()) for row in result]
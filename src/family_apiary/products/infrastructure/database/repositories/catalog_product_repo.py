@@ -0,0 +1,35 @@
+from commons.db.sqlalchemy import AsyncTransactionContext, BaseRepository
+from commons.entities.base import EntityId
+from family_apiary.products.application.interfaces import (
+    CatalogSnapshotProvider,
+)
+from family_apiary.products.domain.entities import CatalogProduct
+from family_apiary.products.domain.repositories import CatalogProductRepo
+from family_apiary.products.infrastructure.database.catalog import (
+    bump_catalog_version,
+)
+
+
+class CatalogProductRepoImpl(BaseRepository, CatalogProductRepo):
+    """
+    Репозиторий продуктов каталога.
+
+    Сохранение продукта увеличивает версию каталога в той же транзакции,
+    снимок каталога этого процесса сбрасывается после фиксации
+    """
+
+    def __init__(
+        self,
+        transaction_context: AsyncTransactionContext,
+        catalog_snapshot_provider: CatalogSnapshotProvider,
+    ):
+        super().__init__(transaction_context)
+        self._catalog_snapshot_provider = catalog_snapshot_provider
+
+    async def get(self, product_id: EntityId) -> CatalogProduct | None:
+        return await self.session.get(CatalogProduct, product_id)
+
+    async def save(self, product: CatalogProduct) -> None:
+        self.session.add(product)
+        await bump_catalog_version(self.session)
+        self.call_after_commit(self._catalog_snapshot_provider.invalidate)
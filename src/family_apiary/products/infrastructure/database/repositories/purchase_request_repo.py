@@ -1,9 +1,72 @@
-from commons.db.sqlalchemy import BaseRepository
+from commons.db.group_commit import AsyncGroupCommitWriter
+from commons.db.sqlalchemy import AsyncTransactionContext, BaseRepository
 from family_apiary.products.domain.entities import PurchaseRequest
 from family_apiary.products.domain.repositories import PurchaseRequestRepo
+from family_apiary.products.infrastructure.database.customer_profiles import (
+    apply_customer_profiles,
+)
+from family_apiary.products.infrastructure.database.mapping import (
+    set_purchase_request_summary,
+)
+from family_apiary.products.infrastructure.database.sales_rollups import (
+    apply_sales_rollups,
+)
 
 
 class PurchaseRequestRepoImpl(BaseRepository, PurchaseRequestRepo):
+    """
+    Репозиторий заявок.
+
+    Добавленные заявки отправляются в БД один раз при фиксации
+    транзакции (или при явном вызове `flush`). Итоги продаж и итоги
+    покупателей обновляются в той же транзакции перед фиксацией,
+    чтобы строки итогов были заблокированы только до commit, а не
+    на всё время операции (например, отправки уведомления)
+    """
+
+    def __init__(self, transaction_context: AsyncTransactionContext):
+        super().__init__(transaction_context)
+        # добавленные заявки, ещё не учтённые в итогах
+        self._not_applied: list[PurchaseRequest] = []
+
     async def add(self, purchase_request: PurchaseRequest) -> None:
         self.session.add(purchase_request)
-        await self.session.flush()
+
+        if not self._not_applied:
+            self.call_before_commit(self._apply_rollups)
+        self._not_applied.append(purchase_request)
+
+    async def flush(self) -> None:
+        await self._apply_rollups()
+        await super().flush()
+
+    async def _apply_rollups(self) -> None:
+        purchase_requests, self._not_applied = self._not_applied, []
+        if not purchase_requests:
+            return
+
+        # итоги по корзине вычисляются один раз - для итогов и для БД
+        for purchase_request in purchase_requests:
+            set_purchase_request_summary(purchase_request)
+        await apply_sales_rollups(self.session, purchase_requests)
+        await apply_customer_profiles(self.session, purchase_requests)
+
+
+class GroupCommitPurchaseRequestRepoImpl(PurchaseRequestRepo):
+    """
+    Репозиторий заявок с групповой записью.
+
+    Заявка сохраняется не в транзакции текущей операции, а вместе
+    с другими одновременно пришедшими заявками. `add` завершается,
+    когда общая транзакция зафиксирована
+    """
+
+    def __init__(self, writer: AsyncGroupCommitWriter[PurchaseRequest]):
+        self._writer = writer
+
+    async def add(self, purchase_request: PurchaseRequest) -> None:
+        await self._writer.submit(purchase_request)
+
+    async def flush(self) -> None:
+        # заявки уже записаны к моменту завершения add
+        pass
@@ -0,0 +1,246 @@
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any, Iterable
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from commons.datetime_utils import now_tz
+from commons.entities.base import EntityId
+from family_apiary.products.domain.entities import PurchaseRequest
+from family_apiary.products.infrastructure.database.tables import (
+    purchase_request_products_table,
+    purchase_requests_table,
+    sales_daily_rollups_table,
+    sales_monthly_rollups_table,
+)
+from family_apiary.products.infrastructure.database.upsert import (
+    execute_upserts,
+)
+
+SalesRollupKey = tuple[date, str, str]
+"""Начало периода, категория, название продукта"""
+
+
+@dataclass
+class _SalesDelta:
+    revenue: float = 0
+    orders_count: int = 0
+    units_count: int = 0
+    last_purchase_request_id: EntityId | None = None
+
+
+def get_sales_day(created_at: datetime) -> date:
+    """
+    День продажи (по UTC; время без часового пояса считается UTC)
+    """
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(UTC)
+    return created_at.date()
+
+
+def get_month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+class SalesRollupsAggregator:
+    """
+    Накапливает изменения продаж по дням и месяцам.
+
+    Строки одной заявки должны идти подряд - заказ учитывается
+    в продукте один раз, даже если продукт встречается в заявке
+    несколько раз
+    """
+
+    def __init__(self) -> None:
+        self.deltas: dict[sa.Table, dict[SalesRollupKey, _SalesDelta]] = {
+            sales_daily_rollups_table: {},
+            sales_monthly_rollups_table: {},
+        }
+
+    def add_purchase_request(self, purchase_request: PurchaseRequest) -> None:
+        for product in purchase_request.products:
+            self.add_line(
+                purchase_request_id=purchase_request.id,
+                created_at=purchase_request.created_at,
+                category=product.category,
+                product_name=product.name,
+                price=product.price,
+                count=product.count,
+            )
+
+    def add_line(
+        self,
+        purchase_request_id: EntityId,
+        created_at: datetime,
+        category: str,
+        product_name: str,
+        price: float,
+        count: int,
+    ) -> None:
+        day = get_sales_day(created_at)
+        for table, period_start in (
+            (sales_daily_rollups_table, day),
+            (sales_monthly_rollups_table, get_month_start(day)),
+        ):
+            key = (period_start, category, product_name)
+            delta = self.deltas[table].get(key)
+            if delta is None:
+                delta = self.deltas[table][key] = _SalesDelta()
+
+            delta.revenue += price * count
+            delta.units_count += count
+            if delta.last_purchase_request_id != purchase_request_id:
+                delta.orders_count += 1
+                delta.last_purchase_request_id = purchase_request_id
+
+    def get_values(self, table: sa.Table) -> list[dict[str, Any]]:
+        updated_at = now_tz()
+        return [
+            {
+                'period_start': period_start,
+                'category': category,
+                'product_name': product_name,
+                'revenue': delta.revenue,
+                'orders_count': delta.orders_count,
+                'units_count': delta.units_count,
+                'updated_at': updated_at,
+            }
+            for (
+                period_start,
+                category,
+                product_name,
+            ), delta in self.deltas[table].items()
+        ]
+
+
+def _add_to_existing(statement: Any, table: sa.Table) -> sa.Executable:
+    """
+    Прибавляет значения к уже существующим итогам
+    """
+    upsert: sa.Executable = statement.on_conflict_do_update(
+        index_elements=[
+            table.c.period_start,
+            table.c.category,
+            table.c.product_name,
+        ],
+        set_={
+            'revenue': table.c.revenue + statement.excluded.revenue,
+            'orders_count': (
+                table.c.orders_count + statement.excluded.orders_count
+            ),
+            'units_count': table.c.units_count + statement.excluded.units_count,
+            'updated_at': statement.excluded.updated_at,
+        },
+    )
+    return upsert
+
+
+async def _write_aggregated(
+    executor: AsyncSession | AsyncConnection,
+    dialect_name: str,
+    aggregator: SalesRollupsAggregator,
+) -> None:
+    for table in aggregator.deltas:
+        await execute_upserts(
+            executor,
+            dialect_name,
+            table,
+            aggregator.get_values(table),
+            on_conflict=_add_to_existing,
+        )
+
+
+async def apply_sales_rollups(
+    session: AsyncSession,
+    purchase_requests: Iterable[PurchaseRequest],
+) -> None:
+    """
+    Добавляет продажи заявок к дневным и месячным итогам
+    в текущей транзакции сессии (многострочными INSERT без чтения итогов)
+    """
+    aggregator = SalesRollupsAggregator()
+    for purchase_request in purchase_requests:
+        aggregator.add_purchase_request(purchase_request)
+
+    # заявки сессии не нужны для итогов - они отправятся в БД при commit
+    with session.no_autoflush:
+        await _write_aggregated(
+            session, session.get_bind().dialect.name, aggregator
+        )
+
+
+async def rebuild_sales_rollups(
+    db_engine: AsyncEngine,
+    date_from: date,
+    date_to: date,
+    batch_size: int = 1000,
+) -> None:
+    """
+    Пересчитывает итоги продаж по заявкам за целые месяцы,
+    в которые попадает [date_from, date_to].
+
+    Итоги удаляются и считаются заново в одной транзакции. Заявки
+    читаются курсором пачками, в памяти только итоги за период.
+    Заявки, создаваемые во время пересчёта, могут быть учтены неверно -
+    пересчёт стоит запускать для периодов без новых заявок
+    """
+    month_from = get_month_start(date_from)
+    month_to = get_month_start(get_month_start(date_to) + timedelta(days=31))
+    created_from = datetime.combine(month_from, time(), tzinfo=UTC)
+    created_to = datetime.combine(month_to, time(), tzinfo=UTC)
+
+    requests = purchase_requests_table.c
+    products = purchase_request_products_table.c
+    query = (
+        sa.select(
+            requests.id,
+            requests.created_at,
+            products.category,
+            products.name,
+            products.price,
+            products.count,
+        )
+        .select_from(
+            purchase_requests_table.join(
+                purchase_request_products_table,
+                products.purchase_request_id == requests.id,
+            )
+        )
+        .where(
+            requests.created_at >= created_from,
+            requests.created_at < created_to,
+        )
+        .order_by(requests.created_at, requests.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    async with db_engine.begin() as connection:
+        for table in (sales_daily_rollups_table, sales_monthly_rollups_table):
+            await connection.execute(
+                sa.delete(table).where(
+                    table.c.period_start >= month_from,
+                    table.c.period_start < month_to,
+                )
+            )
+
+        aggregator = SalesRollupsAggregator()
+        result = await connection.stream(query)
+        async for (
+            purchase_request_id,
+            created_at,
+            category,
+            product_name,
+            price,
+            count,
+        ) in result:
+            aggregator.add_line(
+                purchase_request_id=purchase_request_id,
+                created_at=created_at,
+                category=category,
+                product_name=product_name,
+                price=price,
+                count=count,
+            )
+
+        await _write_aggregated(connection, connection.dialect.name, aggregator)
@@ -0,0 +1,189 @@
+import re
+from dataclasses import dataclass
+
+import sqlalchemy as sa
+
+MIN_TERM_LENGTH = 3
+"""Более короткие части запроса не ищутся (поиск идёт по триграммам)"""
+
+TS_CONFIG = 'russian'
+"""Конфигурация полнотекстового поиска PostgreSQL"""
+
+SQLITE_SEARCH_TABLE_NAME = 'purchase_requests_search'
+
+PHONE_SEPARATORS_REGEX = re.compile(r'[\s()+\-]')
+
+
+@dataclass(frozen=True)
+class SearchTerms:
+    """
+    Разобранный поисковый запрос
+    """
+
+    # слова - ищутся в имени покупателя и названиях продуктов
+    words: list[str]
+
+    # части номера телефона (только цифры)
+    phone_parts: list[str]
+
+    def is_empty(self) -> bool:
+        return not self.words and not self.phone_parts
+
+
+def parse_search_text(text: str) -> SearchTerms:
+    """
+    Делит запрос на слова и части номера телефона.
+
+    Часть запроса из цифр (возможно, с +, -, скобками) считается
+    частью номера телефона
+    """
+    words = []
+    phone_parts = []
+    for term in text.split():
+        digits = PHONE_SEPARATORS_REGEX.sub('', term)
+        if digits.isdigit():
+            if len(digits) >= MIN_TERM_LENGTH:
+                phone_parts.append(digits)
+        elif len(term) >= MIN_TERM_LENGTH:
+            words.append(term.lower())
+    return SearchTerms(words=words, phone_parts=phone_parts)
+
+
+def phone_digits_expression(column: sa.ColumnElement[str]) -> sa.Function[str]:
+    """
+    Цифры номера телефона (PostgreSQL). Используется в индексе
+    и в запросе - выражения должны совпадать
+    """
+    return sa.func.regexp_replace(
+        column,
+        sa.text("'[^0-9]'"),
+        sa.text("''"),
+        sa.text("'g'"),
+    )
+
+
+def tsvector_expression(column: sa.ColumnElement[str]) -> sa.Function[str]:
+    """
+    tsvector текста (PostgreSQL). Используется в индексе
+    и в запросе - выражения должны совпадать
+    """
+    return sa.func.to_tsvector(sa.text(f"'{TS_CONFIG}'"), column)
+
+
+def tsquery_expression(text: str) -> sa.Function[str]:
+    """
+    tsquery слов текста (PostgreSQL)
+    """
+    return sa.func.plainto_tsquery(sa.text(f"'{TS_CONFIG}'"), text)
+
+
+def to_fts5_query(terms: SearchTerms) -> str:
+    """
+    Запрос FTS5: любая из частей запроса как подстрока
+    """
+    return ' OR '.join(
+        '"{}"'.format(term.replace('"', '""'))
+        for term in (*terms.words, *terms.phone_parts)
+    )
+
+
+def _sqlite_phone_digits(column: str) -> str:
+    # в SQLite нет regexp_replace - убираются обычные разделители
+    for separator in (' ', '+', '(', ')', '-'):
+        column = f"replace({column}, '{separator}', '')"
+    return column
+
+
+def _sqlite_reindex_products(purchase_request_id: str) -> str:
+    return (
+        f'DELETE FROM {SQLITE_SEARCH_TABLE_NAME} '
+        f'WHERE purchase_request_id = {purchase_request_id} '
+        'AND product_name IS NOT NULL; '
+        f'INSERT INTO {SQLITE_SEARCH_TABLE_NAME} '
+        '(purchase_request_id, product_name) '
+        'SELECT purchase_request_id, name FROM purchase_request_products '
+        f'WHERE purchase_request_id = {purchase_request_id};'
+    )
+
+
+def get_sqlite_search_ddl(schema: str | None) -> list[str]:
+    """
+    Таблица FTS5 для поиска заявок в SQLite и триггеры, которые
+    её заполняют.
+
+    Строка таблицы - заявка (имя и цифры телефона) или продукт заявки.
+    Заявки и продукты только добавляются, поэтому при вставке строка
+    добавляется без поиска; изменение и удаление перестраивают строки
+    заявки (просмотром таблицы поиска)
+    """
+    prefix = f'{schema}.' if schema else ''
+    table = SQLITE_SEARCH_TABLE_NAME
+    return [
+        f'CREATE VIRTUAL TABLE {prefix}{table} USING fts5('
+        'purchase_request_id UNINDEXED, name, phone_digits, product_name, '
+        "tokenize='trigram')",
+        f'CREATE TRIGGER {prefix}{table}_request_insert '
+        'AFTER INSERT ON purchase_requests BEGIN '
+        f'INSERT INTO {table} (purchase_request_id, name, phone_digits) '
+        'VALUES (NEW.id, NEW.name, '
+        f'{_sqlite_phone_digits("NEW.phone_number")}); '
+        'END',
+        f'CREATE TRIGGER {prefix}{table}_request_update '
+        'AFTER UPDATE OF name, phone_number ON purchase_requests BEGIN '
+        f'UPDATE {table} SET name = NEW.name, '
+        f'phone_digits = {_sqlite_phone_digits("NEW.phone_number")} '
+        'WHERE purchase_request_id = NEW.id AND product_name IS NULL; '
+        'END',
+        f'CREATE TRIGGER {prefix}{table}_request_delete '
+        'AFTER DELETE ON purchase_requests BEGIN '
+        f'DELETE FROM {table} WHERE purchase_request_id = OLD.id; '
+        'END',
+        f'CREATE TRIGGER {prefix}{table}_product_insert '
+        'AFTER INSERT ON purchase_request_products '
+        'WHEN NEW.purchase_request_id IS NOT NULL BEGIN '
+        f'INSERT INTO {table} (purchase_request_id, product_name) '
+        'VALUES (NEW.purchase_request_id, NEW.name); '
+        'END',
+        f'CREATE TRIGGER {prefix}{table}_product_update '
+        'AFTER UPDATE OF name ON purchase_request_products BEGIN '
+        f'{_sqlite_reindex_products("NEW.purchase_request_id")} '
+        'END',
+        f'CREATE TRIGGER {prefix}{table}_product_delete '
+        'AFTER DELETE ON purchase_request_products BEGIN '
+        f'{_sqlite_reindex_products("OLD.purchase_request_id")} '
+        'END',
+    ]
+
+
+def get_sqlite_search_backfill() -> list[str]:
+    """
+    Заполнение таблицы поиска SQLite существующими заявками
+    """
+    table = SQLITE_SEARCH_TABLE_NAME
+    return [
+        f'INSERT INTO {table} (purchase_request_id, name, phone_digits) '
+        'SELECT id, name, '
+        f'{_sqlite_phone_digits("phone_number")} FROM purchase_requests',
+        f'INSERT INTO {table} (purchase_request_id, product_name) '
+        'SELECT purchase_request_id, name FROM purchase_request_products '
+        'WHERE purchase_request_id IS NOT NULL',
+    ]
+
+
+def get_sqlite_search_drop_ddl(schema: str | None) -> list[str]:
+    prefix = f'{schema}.' if schema else ''
+    table = SQLITE_SEARCH_TABLE_NAME
+    return [
+        *(
+            f'DROP TRIGGER IF EXISTS {prefix}{table}_{name}'
+            for name in (
+                'request_insert',
+                'request_update',
+                'request_delete',
+                'product_insert',
+                'product_update',
+                'product_delete',
+            )
+        ),
+        f'DROP TABLE IF EXISTS {prefix}{table}',
+    ]
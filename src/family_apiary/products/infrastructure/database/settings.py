@@ -25,3 +25,53 @@ class ProductsAlembicSettings(BaseSettings):
 
     class Config:
         env_prefix = 'PRODUCTS_'
+
+
+class PurchaseRequestsGroupCommitSettings(BaseSettings):
+    # Групповая запись заявок: заявки, пришедшие почти одновременно,
+    # сохраняются одной транзакцией
+    ENABLED: bool = False
+
+    # Сколько ждать другие заявки перед записью пачки
+    MAX_WAIT_MS: float = 5
+
+    # Максимальный размер пачки (при достижении пишется сразу)
+    MAX_BATCH_SIZE: int = 100
+
+    class Config:
+        env_prefix = 'PRODUCTS_PURCHASE_REQUESTS_GROUP_COMMIT_'
+
+
+class ProductsPartitioningSettings(BaseSettings):
+    # На сколько месяцев вперёд создавать секции заявок
+    MONTHS_AHEAD: int = 3
+
+    # Секции старше этого количества месяцев архивируются
+    ARCHIVE_AFTER_MONTHS: int = 12
+
+    # Способ архивации: detach - перенос секции в схему архива,
+    # dump - выгрузка в сжатый файл и удаление секции
+    ARCHIVE_MODE: str = 'detach'
+
+    # Схема и табличное пространство для отсоединённых секций
+    ARCHIVE_SCHEMA: str = 'products_archive'
+    ARCHIVE_TABLESPACE: str | None = None
+
+    # Каталог для выгруженных секций
+    ARCHIVE_DIR: str = 'archive'
+
+    # Количество строк, читаемых из БД за раз при выгрузке
+    ARCHIVE_BATCH_SIZE: int = 10000
+
+    class Config:
+        env_prefix = 'PRODUCTS_PARTITIONING_'
+
+
+class CatalogSnapshotCacheSettings(BaseSettings):
+    # Как часто сверять снимок каталога в памяти с версией каталога в БД.
+    # Изменения каталога, сделанные другими процессами, видны не позже
+    # чем через это время
+    TTL_SECONDS: float = 5
+
+    class Config:
+        env_prefix = 'PRODUCTS_CATALOG_SNAPSHOT_CACHE_'
@@ -1,2 +1,13 @@
+from .catalog_products import (
+    CATALOG_VERSION_ROW_ID,
+    catalog_products_table,
+    catalog_version_table,
+)
+from .customer_profiles import customer_profiles_table
 from .purchase_request_products import purchase_request_products_table
 from .purchase_requests import purchase_requests_table
+from .purchase_requests_search import purchase_requests_search_table
+from .sales_rollups import (
+    sales_daily_rollups_table,
+    sales_monthly_rollups_table,
+)
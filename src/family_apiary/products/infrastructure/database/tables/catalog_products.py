@@ -0,0 +1,74 @@
+import sqlalchemy as sa
+from sqlalchemy.types import Float
+
+from family_apiary.products.infrastructure.database.meta import metadata
+
+catalog_products_table = sa.Table(
+    'catalog_products',
+    metadata,
+    sa.Column('id', sa.UUID, primary_key=True, nullable=False),
+    sa.Column(
+        'created_at',
+        sa.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sa.Column(
+        'updated_at',
+        sa.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sa.Column(
+        'name',
+        sa.String,
+        nullable=False,
+    ),
+    sa.Column(
+        'description',
+        sa.String,
+        nullable=False,
+    ),
+    sa.Column(
+        'category',
+        sa.String,
+        nullable=False,
+        index=True,
+    ),
+    sa.Column(
+        'price',
+        Float,  # TODO: использовать Decimal (как и цену продукта заявки)
+        nullable=False,
+    ),
+    sa.Column(
+        'is_available',
+        sa.Boolean,
+        nullable=False,
+        server_default=sa.true(),
+    ),
+    comment='Каталог продукции',
+)
+
+CATALOG_VERSION_ROW_ID = 1
+"""Версия каталога хранится в одной строке"""
+
+catalog_version_table = sa.Table(
+    'catalog_version',
+    metadata,
+    sa.Column(
+        'id',
+        sa.INTEGER,
+        primary_key=True,
+        nullable=False,
+        autoincrement=False,
+    ),
+    sa.Column(
+        'version',
+        sa.BigInteger,
+        nullable=False,
+    ),
+    sa.Column(
+        'updated_at',
+        sa.DateTime(timezone=True),
+        nullable=False,
+    ),
+    comment='Версия каталога продукции (меняется при каждом изменении)',
+)
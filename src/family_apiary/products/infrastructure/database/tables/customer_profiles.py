@@ -0,0 +1,42 @@
+import sqlalchemy as sa
+from sqlalchemy.types import Float
+
+from family_apiary.products.infrastructure.database.meta import metadata
+
+customer_profiles_table = sa.Table(
+    'customer_profiles',
+    metadata,
+    sa.Column(
+        'phone_number',
+        sa.String,
+        primary_key=True,
+        nullable=False,
+        comment='Номер телефона в формате E.164',
+    ),
+    sa.Column(
+        'orders_count',
+        sa.INTEGER,
+        nullable=False,
+    ),
+    sa.Column(
+        'lifetime_value',
+        Float,  # TODO: использовать Decimal (как и цену продукта)
+        nullable=False,
+    ),
+    sa.Column(
+        'first_order_at',
+        sa.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sa.Column(
+        'last_order_at',
+        sa.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sa.Column(
+        'updated_at',
+        sa.DateTime(timezone=True),
+        nullable=False,
+    ),
+    comment='Итоги заявок покупателей',
+)
@@ -2,14 +2,24 @@ import sqlalchemy as sa
 from sqlalchemy.types import Float
 
 from family_apiary.products.infrastructure.database.meta import metadata
+from family_apiary.products.infrastructure.database.partitioning import (
+    monthly_range_partitioning,
+)
+from family_apiary.products.infrastructure.database.search import (
+    tsvector_expression,
+)
 
 purchase_request_products_table = sa.Table(
     'purchase_request_products',
     metadata,
+    # ключ секционирования входит в первичный ключ.
+    # created_at продукта совпадает с created_at заявки - продукт
+    # лежит в секции того же месяца, что и заявка
     sa.Column('id', sa.UUID, primary_key=True, nullable=False),
     sa.Column(
         'created_at',
         sa.DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         index=True,
     ),
@@ -22,7 +32,6 @@ purchase_request_products_table = sa.Table(
     sa.Column(
         'purchase_request_id',
         sa.UUID,
-        sa.ForeignKey('purchase_requests.id'),
         index=True,
     ),
     sa.Column(
@@ -50,5 +59,23 @@ purchase_request_products_table = sa.Table(
         sa.INTEGER,
         nullable=False,
     ),
+    sa.ForeignKeyConstraint(
+        ['purchase_request_id', 'created_at'],
+        ['purchase_requests.id', 'purchase_requests.created_at'],
+    ),
     comment='Заявки на покупку продукции',
+    **monthly_range_partitioning('created_at'),
 )
+
+# Поиск по названию продукта (PostgreSQL, pg_trgm и полнотекстовый)
+sa.Index(
+    'ix_products_purchase_request_products_name_trgm',
+    purchase_request_products_table.c.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'},
+).ddl_if(dialect='postgresql')
+sa.Index(
+    'ix_products_purchase_request_products_name_fts',
+    tsvector_expression(purchase_request_products_table.c.name),
+    postgresql_using='gin',
+).ddl_if(dialect='postgresql')
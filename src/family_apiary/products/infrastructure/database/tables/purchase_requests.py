@@ -1,14 +1,23 @@
 import sqlalchemy as sa
+from sqlalchemy.types import Float
 
 from family_apiary.products.infrastructure.database.meta import metadata
+from family_apiary.products.infrastructure.database.partitioning import (
+    monthly_range_partitioning,
+)
+from family_apiary.products.infrastructure.database.search import (
+    phone_digits_expression,
+)
 
 purchase_requests_table = sa.Table(
     'purchase_requests',
     metadata,
+    # ключ секционирования входит в первичный ключ
     sa.Column('id', sa.UUID, primary_key=True, nullable=False),
     sa.Column(
         'created_at',
         sa.DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         index=True,
     ),
@@ -29,5 +38,43 @@ purchase_requests_table = sa.Table(
         sa.String,
         nullable=False,
     ),
+    # Итоги по корзине - хранятся, чтобы не читать продукты заявки.
+    # Заполняются при сохранении заявки
+    sa.Column(
+        'total_price',
+        Float,  # TODO: использовать Decimal
+        nullable=False,
+        server_default='0',
+        index=True,
+    ),
+    sa.Column(
+        'items_count',
+        sa.INTEGER,
+        nullable=False,
+        server_default='0',
+    ),
+    sa.Column(
+        'distinct_products',
+        sa.INTEGER,
+        nullable=False,
+        server_default='0',
+    ),
     comment='Заявки на покупку продукции',
+    **monthly_range_partitioning('created_at'),
 )
+
+# Поиск по имени и части номера телефона (PostgreSQL, pg_trgm)
+sa.Index(
+    'ix_products_purchase_requests_name_trgm',
+    purchase_requests_table.c.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'},
+).ddl_if(dialect='postgresql')
+sa.Index(
+    'ix_products_purchase_requests_phone_digits_trgm',
+    phone_digits_expression(purchase_requests_table.c.phone_number).label(
+        'phone_digits'
+    ),
+    postgresql_using='gin',
+    postgresql_ops={'phone_digits': 'gin_trgm_ops'},
+).ddl_if(dialect='postgresql')
@@ -0,0 +1,45 @@
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy import event
+
+from family_apiary.products.infrastructure.database.meta import metadata
+from family_apiary.products.infrastructure.database.search import (
+    SQLITE_SEARCH_TABLE_NAME,
+    get_sqlite_search_ddl,
+    get_sqlite_search_drop_ddl,
+)
+from family_apiary.products.infrastructure.database.tables.purchase_request_products import (
+    purchase_request_products_table,
+)
+
+# Таблица FTS5 для поиска заявок (только SQLite, заполняется триггерами).
+# Не входит в metadata - создаётся вместе с таблицами заявок
+purchase_requests_search_table = sa.table(
+    SQLITE_SEARCH_TABLE_NAME,
+    sa.column('purchase_request_id'),
+    sa.column('rank', sa.Float),
+    schema=metadata.schema,
+)
+
+
+@event.listens_for(purchase_request_products_table, 'after_create')
+def _create_sqlite_search_table(
+    target: sa.Table, connection: sa.Connection, **kwargs: Any
+) -> None:
+    if connection.dialect.name != 'sqlite':
+        return
+
+    for statement in get_sqlite_search_ddl(target.schema):
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(purchase_request_products_table, 'before_drop')
+def _drop_sqlite_search_table(
+    target: sa.Table, connection: sa.Connection, **kwargs: Any
+) -> None:
+    if connection.dialect.name != 'sqlite':
+        return
+
+    for statement in get_sqlite_search_drop_ddl(target.schema):
+        connection.exec_driver_sql(statement)
@@ -0,0 +1,61 @@
+import sqlalchemy as sa
+from sqlalchemy.types import Float
+
+from family_apiary.products.infrastructure.database.meta import metadata
+
+
+def _create_sales_rollups_table(name: str, comment: str) -> sa.Table:
+    return sa.Table(
+        name,
+        metadata,
+        sa.Column(
+            'period_start',
+            sa.Date,
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            'category',
+            sa.String,
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            'product_name',
+            sa.String,
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            'revenue',
+            Float,  # TODO: использовать Decimal (как и цену продукта)
+            nullable=False,
+        ),
+        sa.Column(
+            'orders_count',
+            sa.INTEGER,
+            nullable=False,
+        ),
+        sa.Column(
+            'units_count',
+            sa.INTEGER,
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+        ),
+        comment=comment,
+    )
+
+
+sales_daily_rollups_table = _create_sales_rollups_table(
+    'sales_daily_rollups',
+    comment='Продажи по дням (категория, продукт)',
+)
+
+sales_monthly_rollups_table = _create_sales_rollups_table(
+    'sales_monthly_rollups',
+    comment='Продажи по месяцам (категория, продукт)',
+)
@@ -0,0 +1,48 @@
+from typing import Any, Callable
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+# строк в одном INSERT (ограничение на число параметров запроса)
+UPSERT_CHUNK_SIZE = 500
+
+UpsertStatementFactory = Callable[[Any, sa.Table], sa.Executable]
+"""
+Дополняет INSERT диалекта (с `excluded`) до INSERT ... ON CONFLICT
+"""
+
+
+def create_dialect_insert(
+    dialect_name: str,
+    table: sa.Table,
+    values: list[dict[str, Any]],
+) -> Any:
+    """
+    Многострочный INSERT диалекта с поддержкой ON CONFLICT
+    """
+    if dialect_name == 'postgresql':
+        return postgresql.insert(table).values(values)
+    if dialect_name == 'sqlite':
+        return sqlite.insert(table).values(values)
+    raise NotImplementedError(f'Upsert is not supported for {dialect_name}')
+
+
+async def execute_upserts(
+    executor: AsyncSession | AsyncConnection,
+    dialect_name: str,
+    table: sa.Table,
+    values: list[dict[str, Any]],
+    on_conflict: UpsertStatementFactory,
+) -> None:
+    """
+    Вставляет или обновляет строки многострочными INSERT ... ON CONFLICT
+    (по UPSERT_CHUNK_SIZE строк)
+    """
+    for chunk_start in range(0, len(values), UPSERT_CHUNK_SIZE):
+        statement = create_dialect_insert(
+            dialect_name,
+            table,
+            values[chunk_start : chunk_start + UPSERT_CHUNK_SIZE],
+        )
+        await executor.execute(on_conflict(statement, table))
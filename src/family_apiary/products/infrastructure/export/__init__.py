@@ -0,0 +1,6 @@
+from .encoders import (
+    ExportFormat,
+    create_export_encoder,
+    encode_export,
+)
+from .settings import PurchaseRequestsExportSettings
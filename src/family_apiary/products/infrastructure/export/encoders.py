@@ -0,0 +1,195 @@
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+from dataclasses import fields
+from enum import StrEnum
+from typing import Any, AsyncIterable, AsyncIterator
+
+from commons.app_errors import AppError
+from family_apiary.products.application.dto import PurchaseRequestExportRow
+
+EXPORT_FIELDS = [field.name for field in fields(PurchaseRequestExportRow)]
+
+
+class ExportFormat(StrEnum):
+    """
+    Форматы выгрузки заявок
+    """
+
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+    PARQUET = 'parquet'
+
+
+class ExportFormatNotAvailable(AppError):
+    message_template = 'Export format "{format}" is not available: {reason}'
+
+
+class ExportEncoder(ABC):
+    """
+    Кодирует строки выгрузки в байты по частям
+    """
+
+    media_type: str
+    file_extension: str
+
+    def begin(self) -> bytes:
+        """Начало файла (заголовок)"""
+        return b''
+
+    @abstractmethod
+    def encode(self, rows: list[PurchaseRequestExportRow]) -> bytes:
+        """Очередная пачка строк"""
+        ...
+
+    def end(self) -> bytes:
+        """Конец файла"""
+        return b''
+
+
+class CsvExportEncoder(ExportEncoder):
+    media_type = 'text/csv; charset=utf-8'
+    file_extension = 'csv'
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def begin(self) -> bytes:
+        self._writer.writerow(EXPORT_FIELDS)
+        return self._drain()
+
+    def encode(self, rows: list[PurchaseRequestExportRow]) -> bytes:
+        self._writer.writerows(
+            [getattr(row, name) for name in EXPORT_FIELDS] for row in rows
+        )
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+
+class NdjsonExportEncoder(ExportEncoder):
+    media_type = 'application/x-ndjson'
+    file_extension = 'ndjson'
+
+    def encode(self, rows: list[PurchaseRequestExportRow]) -> bytes:
+        return ''.join(
+            json.dumps(vars(row), default=str, ensure_ascii=False) + '\n'
+            for row in rows
+        ).encode()
+
+
+class _BytesSink(io.RawIOBase):
+    """
+    Файл для записи, из которого можно забирать записанные байты
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetExportEncoder(ExportEncoder):
+    """
+    Каждая пачка строк записывается отдельной группой строк (row group).
+
+    Требует pyarrow (устанавливается отдельно)
+    """
+
+    media_type = 'application/vnd.apache.parquet'
+    file_extension = 'parquet'
+
+    def __init__(self) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ExportFormatNotAvailable(
+                format=ExportFormat.PARQUET,
+                reason='pyarrow is not installed',
+            )
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ('purchase_request_id', pa.string()),
+                ('created_at', pa.timestamp('us', tz='UTC')),
+                ('phone_number', pa.string()),
+                ('name', pa.string()),
+                ('product_name', pa.string()),
+                ('product_category', pa.string()),
+                ('product_description', pa.string()),
+                ('price', pa.float64()),
+                ('count', pa.int64()),
+                ('total_price', pa.float64()),
+            ]
+        )
+        self._sink = _BytesSink()
+        self._writer = pq.ParquetWriter(
+            self._sink, self._schema, compression='zstd'
+        )
+
+    def encode(self, rows: list[PurchaseRequestExportRow]) -> bytes:
+        columns: dict[str, list[Any]] = {name: [] for name in EXPORT_FIELDS}
+        for row in rows:
+            for name in EXPORT_FIELDS:
+                columns[name].append(getattr(row, name))
+        columns['purchase_request_id'] = [
+            str(value) for value in columns['purchase_request_id']
+        ]
+
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+        return self._sink.drain()
+
+    def end(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+def create_export_encoder(export_format: ExportFormat) -> ExportEncoder:
+    """
+    Создаёт кодировщик для формата выгрузки
+    """
+    encoders: dict[ExportFormat, type[ExportEncoder]] = {
+        ExportFormat.CSV: CsvExportEncoder,
+        ExportFormat.NDJSON: NdjsonExportEncoder,
+        ExportFormat.PARQUET: ParquetExportEncoder,
+    }
+    return encoders[export_format]()
+
+
+async def encode_export(
+    batches: AsyncIterable[list[PurchaseRequestExportRow]],
+    encoder: ExportEncoder,
+) -> AsyncIterator[bytes]:
+    """
+    Кодирует пачки строк выгрузки в поток байт
+    """
+    yield encoder.begin()
+    async for rows in batches:
+        data = encoder.encode(rows)
+        if data:
+            yield data
+    yield encoder.end()
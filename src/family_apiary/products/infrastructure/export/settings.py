@@ -0,0 +1,9 @@
+from pydantic_settings import BaseSettings
+
+
+class PurchaseRequestsExportSettings(BaseSettings):
+    # Количество строк, читаемых из БД за раз
+    BATCH_SIZE: int = 1000
+
+    class Config:
+        env_prefix = 'PRODUCTS_PURCHASE_REQUESTS_EXPORT_'
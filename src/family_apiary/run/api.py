@@ -2,20 +2,51 @@ import logging
 
 import uvicorn
 
-from family_apiary.framework import log
+from family_apiary.framework import log, tracing
 from family_apiary.framework.api.app import create_app
 from family_apiary.framework.api.settings import (
     ApiPrometheusMetricsSettings,
     ApiSettings,
+    ContinuousProfilingSettings,
+    EventLoopMonitorSettings,
+    MemoryProfilingSettings,
+    RequestProfilingSettings,
 )
 from family_apiary.framework.containers import create_api_container
 from family_apiary.framework.database.settings import DBSettings
+from family_apiary.products.infrastructure.api_controllers.settings import (
+    CatalogApiSettings,
+    CustomerProfilesApiSettings,
+    PurchaseRequestsExportApiSettings,
+    PurchaseRequestsSearchApiSettings,
+    SalesReportsApiSettings,
+)
+from family_apiary.products.infrastructure.database import (
+    CatalogSnapshotCacheSettings,
+    PurchaseRequestsGroupCommitSettings,
+)
+from family_apiary.products.infrastructure.export import (
+    PurchaseRequestsExportSettings,
+)
 from family_apiary.products.infrastructure.tg_chat_bot import TgChatBotSettings
 
 api_settings = ApiSettings()
 api_prometheus_metrics_settings = ApiPrometheusMetricsSettings()
 tg_chat_bot_settings = TgChatBotSettings()
 db_settings = DBSettings()
+purchase_requests_group_commit_settings = PurchaseRequestsGroupCommitSettings()
+purchase_requests_export_settings = PurchaseRequestsExportSettings()
+purchase_requests_export_api_settings = PurchaseRequestsExportApiSettings()
+sales_reports_api_settings = SalesReportsApiSettings()
+customer_profiles_api_settings = CustomerProfilesApiSettings()
+purchase_requests_search_api_settings = PurchaseRequestsSearchApiSettings()
+catalog_api_settings = CatalogApiSettings()
+catalog_snapshot_cache_settings = CatalogSnapshotCacheSettings()
+event_loop_monitor_settings = EventLoopMonitorSettings()
+request_profiling_settings = RequestProfilingSettings()
+continuous_profiling_settings = ContinuousProfilingSettings()
+memory_profiling_settings = MemoryProfilingSettings()
+tracing_settings = tracing.TracingSettings()
 
 log_config = log.create_config(
     # db_settings.LOGGING_CONFIG,
@@ -26,17 +57,33 @@ log.configure(
     api_settings.LOGGING_CONFIG,
 )
 
+tracing.configure(tracing_settings)
+
 api_container = create_api_container(
     api_settings=api_settings,
     api_prometheus_metrics_settings=api_prometheus_metrics_settings,
     tg_chat_bot_settings=tg_chat_bot_settings,
     db_settings=db_settings,
+    purchase_requests_group_commit_settings=purchase_requests_group_commit_settings,
+    purchase_requests_export_settings=purchase_requests_export_settings,
+    purchase_requests_export_api_settings=purchase_requests_export_api_settings,
+    sales_reports_api_settings=sales_reports_api_settings,
+    customer_profiles_api_settings=customer_profiles_api_settings,
+    purchase_requests_search_api_settings=purchase_requests_search_api_settings,
+    catalog_api_settings=catalog_api_settings,
+    catalog_snapshot_cache_settings=catalog_snapshot_cache_settings,
+    event_loop_monitor_settings=event_loop_monitor_settings,
+    continuous_profiling_settings=continuous_profiling_settings,
+    memory_profiling_settings=memory_profiling_settings,
 )
 
 app = create_app(
     api_settings=api_settings,
     container=api_container,
     api_prometheus_metrics_settings=api_prometheus_metrics_settings,
+    request_profiling_settings=request_profiling_settings,
+    continuous_profiling_settings=continuous_profiling_settings,
+    memory_profiling_settings=memory_profiling_settings,
 )
 
 if __name__ == '__main__':
@@ -0,0 +1,305 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from commons.loadtest import (
+    ArrivalProcess,
+    LatencyHistogram,
+    OpenLoopResult,
+    run_open_loop,
+)
+
+CATALOG_PATH = '/api/products/v1/catalog/products'
+CREATE_PURCHASE_REQUEST_PATH = '/api/products/v1/purchase_requests/create'
+
+PERCENTILES = (0.5, 0.75, 0.9, 0.99, 0.999)
+
+CUSTOMER_NAMES = ('Иван', 'Мария', 'Алексей', 'Ольга', 'Сергей', 'Анна')
+
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            'Нагрузочное тестирование создания заявок на покупку продукции '
+            '(открытый цикл: запросы отправляются с заданной частотой, '
+            'не дожидаясь ответов)'
+        ),
+    )
+    parser.add_argument(
+        '--base-url',
+        default='http://localhost:8000',
+        help='Адрес запущенного API',
+    )
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=50,
+        help='Заявок в секунду',
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=60,
+        help='Длительность нагрузки, секунд',
+    )
+    parser.add_argument(
+        '--arrival',
+        type=ArrivalProcess,
+        choices=list(ArrivalProcess),
+        default=ArrivalProcess.POISSON,
+        help='Распределение интервалов между заявками',
+    )
+    parser.add_argument(
+        '--connections',
+        type=int,
+        default=100,
+        help='Размер пула HTTP соединений',
+    )
+    parser.add_argument(
+        '--max-in-flight',
+        type=int,
+        default=10_000,
+        help='Лимит одновременных запросов (сверх лимита - отброшены)',
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=30,
+        help='Таймаут запроса, секунд',
+    )
+    parser.add_argument(
+        '--product-ids',
+        nargs='+',
+        help='Продукты каталога (по умолчанию - все продукты витрины)',
+    )
+    parser.add_argument('--products-min', type=int, default=1)
+    parser.add_argument(
+        '--products-max',
+        type=int,
+        default=5,
+        help='Продуктов в заявке (равномерно от min до max)',
+    )
+    parser.add_argument(
+        '--count-max',
+        type=int,
+        default=3,
+        help='Количество каждого продукта (равномерно от 1 до max)',
+    )
+    parser.add_argument(
+        '--customers',
+        type=int,
+        default=1000,
+        help='Покупателей (разных номеров телефонов)',
+    )
+    parser.add_argument(
+        '--customers-skew',
+        type=float,
+        default=1.0,
+        help=(
+            'Показатель распределения Ципфа для номеров телефонов '
+            '(0 - равномерно, больше - чаще повторные покупатели)'
+        ),
+    )
+    parser.add_argument(
+        '--new-customers-share',
+        type=float,
+        default=0.1,
+        help='Доля заявок с новыми (не повторяющимися) номерами',
+    )
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=None,
+        help='JSON с результатами',
+    )
+    return parser.parse_args(args)
+
+
+@dataclass
+class PurchaseRequestTraffic:
+    """
+    Генератор тел запросов создания заявок
+    """
+
+    rng: random.Random
+    product_ids: list[str]
+    products_min: int
+    products_max: int
+    count_max: int
+    customers: int
+    customers_skew: float
+    new_customers_share: float
+
+    def __post_init__(self) -> None:
+        self._customers_cum_weights = list(
+            itertools.accumulate(
+                1 / (rank**self.customers_skew)
+                for rank in range(1, self.customers + 1)
+            )
+        )
+        self._new_customers = itertools.count(self.customers)
+
+    def _get_phone_number(self) -> str:
+        if self.rng.random() < self.new_customers_share:
+            customer = next(self._new_customers)
+        else:
+            customer = self.rng.choices(
+                range(self.customers),
+                cum_weights=self._customers_cum_weights,
+            )[0]
+        return f'+7900{customer:07d}'
+
+    def create_body(self) -> dict[str, Any]:
+        products_count = min(
+            self.rng.randint(self.products_min, self.products_max),
+            len(self.product_ids),
+        )
+        return {
+            'phone_number': self._get_phone_number(),
+            'name': self.rng.choice(CUSTOMER_NAMES),
+            'products': [
+                {
+                    'product_id': product_id,
+                    'count': self.rng.randint(1, self.count_max),
+                }
+                for product_id in self.rng.sample(
+                    self.product_ids, products_count
+                )
+            ],
+        }
+
+
+async def get_catalog_product_ids(session: aiohttp.ClientSession) -> list[str]:
+    async with session.get(CATALOG_PATH) as response:
+        response.raise_for_status()
+        catalog = await response.json()
+    return [product['id'] for product in catalog['products']]
+
+
+def format_histogram(title: str, histogram: LatencyHistogram) -> str:
+    rows = [
+        f'{title}:',
+        f'  {"mean":>8} {histogram.mean:>10.2f} ms',
+        *(
+            f'  {f"p{percentile * 100:g}":>8} '
+            f'{histogram.get_percentile(percentile):>10.2f} ms'
+            for percentile in PERCENTILES
+        ),
+        f'  {"max":>8} {histogram.max / 1000:>10.2f} ms',
+    ]
+    return '\n'.join(rows)
+
+
+def format_report(args: argparse.Namespace, result: OpenLoopResult) -> str:
+    rows = [
+        f'target rate   {args.rate:>10.1f} req/s',
+        f'achieved rate {result.achieved_rps:>10.1f} req/s',
+        f'scheduled     {result.scheduled:>10}',
+        f'completed     {result.completed:>10}',
+        f'dropped       {result.dropped:>10}',
+        f'error rate    {result.error_rate:>10.2%}',
+        *(
+            f'  {error}: {count}'
+            for error, count in result.errors.most_common()
+        ),
+        format_histogram(
+            'response time (from scheduled send, corrected)',
+            result.response_time,
+        ),
+        format_histogram('service time', result.service_time),
+    ]
+    return '\n'.join(rows)
+
+
+def dump_result(args: argparse.Namespace, result: OpenLoopResult) -> None:
+    def dump_histogram(histogram: LatencyHistogram) -> dict[str, float]:
+        return {
+            'mean_ms': histogram.mean,
+            **{
+                f'p{percentile * 100:g}_ms': histogram.get_percentile(
+                    percentile
+                )
+                for percentile in PERCENTILES
+            },
+            'max_ms': histogram.max / 1000,
+        }
+
+    data = {
+        'parameters': {
+            name: str(value) if isinstance(value, Path) else value
+            for name, value in vars(args).items()
+        },
+        'duration': result.duration,
+        'achieved_rps': result.achieved_rps,
+        'scheduled': result.scheduled,
+        'completed': result.completed,
+        'dropped': result.dropped,
+        'error_rate': result.error_rate,
+        'errors': dict(result.errors),
+        'response_time': dump_histogram(result.response_time),
+        'service_time': dump_histogram(result.service_time),
+    }
+    args.output.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+async def run(args: argparse.Namespace) -> OpenLoopResult:
+    rng = random.Random(args.seed)
+    async with aiohttp.ClientSession(
+        base_url=args.base_url,
+        connector=aiohttp.TCPConnector(limit=args.connections),
+        timeout=aiohttp.ClientTimeout(total=args.timeout),
+    ) as session:
+        traffic = PurchaseRequestTraffic(
+            rng=rng,
+            product_ids=(
+                args.product_ids or await get_catalog_product_ids(session)
+            ),
+            products_min=args.products_min,
+            products_max=args.products_max,
+            count_max=args.count_max,
+            customers=args.customers,
+            customers_skew=args.customers_skew,
+            new_customers_share=args.new_customers_share,
+        )
+        if not traffic.product_ids:
+            raise RuntimeError('Catalog has no available products')
+
+        async def create_purchase_request() -> str | None:
+            async with session.post(
+                CREATE_PURCHASE_REQUEST_PATH,
+                json=traffic.create_body(),
+            ) as response:
+                await response.read()
+                if response.status != 200:
+                    return f'HTTP {response.status}'
+            return None
+
+        return await run_open_loop(
+            send_request=create_purchase_request,
+            rate=args.rate,
+            duration=args.duration,
+            arrival_process=args.arrival,
+            max_in_flight=args.max_in_flight,
+            rng=rng,
+        )
+
+
+def main(*args: str) -> None:
+    parsed_args = parse_args(list(args))
+    result = asyncio.run(run(parsed_args))
+    print(format_report(parsed_args, result))
+    if parsed_args.output is not None:
+        dump_result(parsed_args, result)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
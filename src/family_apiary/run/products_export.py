@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from typing import BinaryIO
+
+from commons.mappers.mapper_impl import MapperImpl
+from family_apiary.framework.database.engine import (
+    create_async_engine_from_settings,
+)
+from family_apiary.framework.database.settings import DBSettings
+from family_apiary.products.infrastructure.database.readers import (
+    PurchaseRequestsExportReaderImpl,
+)
+from family_apiary.products.infrastructure.export import (
+    ExportFormat,
+    PurchaseRequestsExportSettings,
+    create_export_encoder,
+    encode_export,
+)
+
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Потоковая выгрузка заявок на покупку продукции',
+    )
+    parser.add_argument(
+        '--format',
+        type=ExportFormat,
+        choices=list(ExportFormat),
+        default=ExportFormat.CSV,
+    )
+    parser.add_argument(
+        '--from',
+        dest='created_from',
+        type=datetime.fromisoformat,
+        help='Начало периода (ISO 8601, включительно)',
+    )
+    parser.add_argument(
+        '--to',
+        dest='created_to',
+        type=datetime.fromisoformat,
+        help='Конец периода (ISO 8601, не включительно)',
+    )
+    parser.add_argument(
+        '--output',
+        help='Файл для выгрузки (по умолчанию stdout)',
+    )
+    return parser.parse_args(args)
+
+
+async def export(args: argparse.Namespace, output: BinaryIO) -> None:
+    db_engine = create_async_engine_from_settings(DBSettings())
+    export_reader = PurchaseRequestsExportReaderImpl(
+        db_engine=db_engine,
+        mapper=MapperImpl(),
+        batch_size=PurchaseRequestsExportSettings().BATCH_SIZE,
+    )
+    batches = export_reader.stream_batches(
+        created_from=args.created_from,
+        created_to=args.created_to,
+    )
+
+    try:
+        async for data in encode_export(
+            batches, create_export_encoder(args.format)
+        ):
+            output.write(data)
+    finally:
+        await db_engine.dispose()
+
+
+def main(*args: str) -> None:
+    parsed_args = parse_args(list(args))
+    if parsed_args.output is None:
+        asyncio.run(export(parsed_args, sys.stdout.buffer))
+        return
+
+    with open(parsed_args.output, 'wb') as output:
+        asyncio.run(export(parsed_args, output))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
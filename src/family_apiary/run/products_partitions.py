@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from family_apiary.framework import log
+from family_apiary.framework.database.engine import (
+    create_async_engine_from_settings,
+)
+from family_apiary.framework.database.settings import DBSettings
+from family_apiary.products.infrastructure.database import (
+    ProductsPartitioningSettings,
+)
+from family_apiary.products.infrastructure.database.meta import metadata
+from family_apiary.products.infrastructure.database.partitioning import (
+    ArchiveMode,
+    ArchiveSettings,
+    archive_monthly_partitions,
+    ensure_monthly_partitions,
+    get_archive_border,
+)
+
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    settings = ProductsPartitioningSettings()
+
+    parser = argparse.ArgumentParser(
+        description='Месячные секции таблиц заявок (только PostgreSQL)',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ensure_parser = subparsers.add_parser(
+        'ensure',
+        help='Создать секции заранее (запускать по расписанию)',
+    )
+    ensure_parser.add_argument(
+        '--months-ahead',
+        type=int,
+        default=settings.MONTHS_AHEAD,
+    )
+
+    archive_parser = subparsers.add_parser(
+        'archive',
+        help='Заархивировать старые секции',
+    )
+    archive_parser.add_argument(
+        '--mode',
+        type=ArchiveMode,
+        choices=list(ArchiveMode),
+        default=ArchiveMode(settings.ARCHIVE_MODE),
+    )
+    archive_parser.add_argument(
+        '--older-than-months',
+        type=int,
+        default=settings.ARCHIVE_AFTER_MONTHS,
+        help='Сколько последних месяцев не архивировать',
+    )
+    archive_parser.add_argument(
+        '--directory',
+        type=Path,
+        default=Path(settings.ARCHIVE_DIR),
+        help='Каталог для выгрузки секций (режим dump)',
+    )
+    return parser.parse_args(args)
+
+
+async def run(args: argparse.Namespace) -> None:
+    db_settings = DBSettings()
+    log.configure(db_settings.LOGGING_CONFIG)
+    settings = ProductsPartitioningSettings()
+
+    db_engine = create_async_engine_from_settings(db_settings)
+    try:
+        if args.command == 'ensure':
+            await ensure_monthly_partitions(
+                db_engine=db_engine,
+                metadata=metadata,
+                months_ahead=args.months_ahead,
+            )
+        elif args.command == 'archive':
+            await archive_monthly_partitions(
+                db_engine=db_engine,
+                metadata=metadata,
+                older_than=get_archive_border(args.older_than_months),
+                settings=ArchiveSettings(
+                    mode=args.mode,
+                    schema=settings.ARCHIVE_SCHEMA,
+                    tablespace=settings.ARCHIVE_TABLESPACE,
+                    directory=args.directory,
+                    batch_size=settings.ARCHIVE_BATCH_SIZE,
+                ),
+            )
+    finally:
+        await db_engine.dispose()
+
+
+def main(*args: str) -> None:
+    asyncio.run(run(parse_args(list(args))))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import sys
+from datetime import date
+
+from family_apiary.framework import log
+from family_apiary.framework.database.engine import (
+    create_async_engine_from_settings,
+)
+from family_apiary.framework.database.settings import DBSettings
+from family_apiary.products.infrastructure.database.sales_rollups import (
+    rebuild_sales_rollups,
+)
+
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Итоги продаж по дням и месяцам',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    rebuild_parser = subparsers.add_parser(
+        'rebuild',
+        help='Пересчитать итоги по заявкам (за целые месяцы)',
+    )
+    rebuild_parser.add_argument(
+        '--from',
+        dest='date_from',
+        type=date.fromisoformat,
+        required=True,
+    )
+    rebuild_parser.add_argument(
+        '--to',
+        dest='date_to',
+        type=date.fromisoformat,
+        required=True,
+    )
+    rebuild_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1000,
+        help='Количество строк, читаемых из БД за раз',
+    )
+    return parser.parse_args(args)
+
+
+async def rebuild(args: argparse.Namespace) -> None:
+    db_settings = DBSettings()
+    log.configure(db_settings.LOGGING_CONFIG)
+
+    db_engine = create_async_engine_from_settings(db_settings)
+    try:
+        await rebuild_sales_rollups(
+            db_engine=db_engine,
+            date_from=args.date_from,
+            date_to=args.date_to,
+            batch_size=args.batch_size,
+        )
+    finally:
+        await db_engine.dispose()
+
+
+def main(*args: str) -> None:
+    parsed_args = parse_args(list(args))
+    if parsed_args.command == 'rebuild':
+        asyncio.run(rebuild(parsed_args))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])